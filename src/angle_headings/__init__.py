@@ -31,6 +31,50 @@ The following is a summary of the major public Angle methods.
     reldiff(other) -- computes a normalized relative difference between two
         Angles' measures, scaled so that equal measures are 0.0 and
         diametrically opposed measures are 1.0
+    relkey() -- returns a sort key which orders headings by their signed
+        smallest angle relative to this Angle
+    from_xy(x, y[, mod]) -- class method which returns the heading of a 2D
+        vector
+    cos, sin, unit_vector -- cosine, sine, and (cos, sin) unit vector of the
+        Angle, cached until its measure is next set
+
+Units are looked up in a registry which parses each unit once. Additional
+named units can be defined, and sequences of measures converted in bulk,
+with the functions:
+    register_unit(name, mod[, aliases]) -- registers a named unit
+    convert_many(values, from_mod[, to_mod]) -- converts a sequence of
+        measures between units
+    normalize_many(values[, mod]) -- normalizes a sequence of measures
+
+The convert_many() and normalize_many() functions process their sequences
+with a pluggable compute backend, which is pure Python by default, or NumPy
+for large batches if it is installed. The backend can be chosen with
+angle_headings.backend.set_backend(), or the ANGLE_HEADINGS_BACKEND
+environment variable. The NumPy-backed classes and modules below do not use
+the backend, and always operate on NumPy arrays directly.
+
+Importing the package only loads the Angle class and unit registry. The
+other classes and functions below are imported on first access, so that
+short-lived scripts which only need Angle start quickly.
+
+Large text or CSV files of headings can be streamed in constant memory with
+the functions:
+    read_headings(source[, mod[, column[, ...]]]) -- lazily yields Angles
+        (or one AngleArray per chunk) from a file
+    write_headings(target, angles[, mod[, chunk_size]]) -- writes
+        normalized measures to a file in bulk
+
+Headings can also be stored in a compact, self-describing binary format,
+which records the unit once and holds float64, float32, or fixed-point
+measures, and which is memory-mapped for random access without parsing:
+    write_archive(path, angles[, mod[, dtype]]) -- writes an archive
+    append_archive(path, angles[, mod]) -- appends headings in bulk
+    angle_headings.AngleArchive -- reads headings from an archive
+
+The angle_headings.instrument module can be switched on at runtime to count
+Angle and FrozenAngle constructions, normalizations, unit conversions, and
+operator calls (with optional timing). It has no overhead while switched
+off.
 
 The following operators are defined for Angle objects, and perform their usual
 float operations on the Angle's measure, returning a numerical value of the
@@ -56,6 +100,10 @@ unit matches the first Angle) is returned, normalized to be between -1/2
     A // b (Angle, float) -- floor divides measure by a scalar
     A ** b (Angle, float) -- raises measure to a scalar power
 
+Each of the above binary operators also has an in-place form (A += B, A -= b,
+A *= b, A /= b, A //= b, A **= b) which updates the Angle's measure directly
+and normalizes it once, without allocating a new Angle.
+
 The following comparison operators are defined for Angle objects, and perform
 the expected comparison with the Angle's measure and another Angle's measure
 or a float. Measures are considered to be equal if their normalized values are
@@ -85,7 +133,123 @@ been converted to the first argument's unit.
     A < b (Angle, float)
     A <= B (Angle, Angle) -- A < B or A == B
     A <= b (Angle, float)
+
+The package also defines a NumPy-backed class:
+    angle_headings.AngleArray
+for storing many angles with a single shared unit. It supports the same
+operators as Angle, applied elementwise as vectorized whole-array operations.
+NumPy is an optional dependency, and is only imported the first time
+AngleArray is accessed. Measures can be stored as float32 (with a documented
+error bound) to halve the memory used by large arrays. Its subclass:
+    angle_headings.SharedAngleArray
+keeps its measures in a multiprocessing shared memory block or a
+memory-mapped file, so that worker processes can attach to a large
+collection of headings without copying it. Pickled Angles store only their
+measure and interned unit, so they are also cheap to send between
+processes.
+
+Circular statistics (mean heading, resultant length, circular variance and
+standard deviation) of unbounded streams of headings can be computed in
+constant memory with the mergeable accumulator:
+    angle_headings.AngleStats
+
+Noisy streams of headings can be smoothed across the wraparound seam, in
+constant or logarithmic time per heading, with the streaming filters:
+    angle_headings.MovingMean -- sliding-window circular mean
+    angle_headings.ExponentialSmoother -- exponential smoothing along the
+        shortest rotation
+    angle_headings.MovingMedian -- sliding-window circular median
+and whole recorded series can be filtered with the batch functions in the
+angle_headings.filters module.
+
+Headings can be binned into a fixed number of equal arcs (as for a rose
+diagram), with percentiles and the modal direction computed across the
+wraparound seam, by the mergeable histogram:
+    angle_headings.AngleHistogram
+
+Recorded trajectories can be unwrapped into continuous rotation, and
+interpolated or resampled along the shortest arc between headings, with the
+streaming unwrapper:
+    angle_headings.Unwrapper
+and the batch and streaming functions in the angle_headings.trajectory
+module.
+
+Great-circle bearings between latitude/longitude points, and planar
+bearings between 2D points, can be computed for whole tracks at once with
+the functions in the angle_headings.bearings module.
+
+Fleets of headings can be turned toward their targets, along the shortest
+rotation and at a limited turn rate, in a few whole-array passes with the
+functions in the angle_headings.steering module.
+
+The smallest arc covering a set of headings, the largest gap between them,
+and their circular interquartile range can be found in O(n log n) time with
+the functions in the angle_headings.arcs module.
+
+Headings which fall within an arc, or nearest to a given heading, can be
+queried in logarithmic time with the sorted circular index:
+    angle_headings.AngleIndex
+
+Angles can also be represented exactly in fixed-point binary angular
+measurement, with a full revolution of 2^bits integer steps, by the class:
+    angle_headings.BAMAngle
+
+Immutable, hashable Angles, which can be used as dict keys or set members
+and shared across threads without copying, are represented by the subclass:
+    angle_headings.FrozenAngle
+Their hashes (and equality) can be quantized to a fixed number of steps per
+revolution, so that near-equal headings match in lookup tables.
+
+Chains of additions and subtractions can defer normalization until the
+result is read, wrapping only once, with the builder class:
+    angle_headings.LazyAngle
 """
 
 from ._version import __author__, __version__
 from .angles import Angle
+from .units import convert_many, normalize_many, register_unit
+
+# Other public names, and the modules which define them. These are imported
+# on first access, so that importing the package only loads the Angle class.
+_lazy = {"AngleArchive": "archive",
+         "AngleArray": "arrays",
+         "AngleHistogram": "histogram",
+         "AngleIndex": "index",
+         "AngleStats": "stats",
+         "BAMAngle": "bam",
+         "ExponentialSmoother": "filters",
+         "FrozenAngle": "frozen",
+         "LazyAngle": "lazy",
+         "MovingMean": "filters",
+         "MovingMedian": "filters",
+         "SharedAngleArray": "shared",
+         "Unwrapper": "trajectory",
+         "append_archive": "archive",
+         "read_headings": "streams",
+         "write_archive": "archive",
+         "write_headings": "streams"}
+
+# Public names which require NumPy (left out of "import *")
+_numpy = {"AngleArchive", "AngleArray", "SharedAngleArray", "append_archive",
+          "write_archive"}
+
+__all__ = ["Angle", "convert_many", "normalize_many", "register_unit"] + [
+    name for name in _lazy if name not in _numpy]
+
+def __getattr__(name):
+    """Lazily imports the remaining public classes and functions on first
+    access. AngleArray and SharedAngleArray require NumPy."""
+
+    if name in _lazy:
+        import importlib
+        module = importlib.import_module("." + _lazy[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module " + repr(__name__) + " has no attribute "
+                         + repr(name))
+
+def __dir__():
+    """Lists the package's attributes, including those not yet imported."""
+
+    return sorted(set(globals()) | set(_lazy))
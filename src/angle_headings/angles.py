@@ -4,6 +4,38 @@ from ._version import __author__, __version__
 
 import math
 
+from .units import get_unit
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _normalize(value, mod):
+    """_normalize(value, mod) -> float
+    Normalizes a measure to lie within (-1/2,1/2] revolutions.
+
+    Positional arguments:
+    value (float) -- angle measure
+    mod (float) -- measure of one full revolution
+
+    This is the normalization rule applied by the Angle.measure setter.
+    Measures within [-1/2,1/2] revolutions are left untouched, measures
+    outside of it are wrapped with a modulo, and a resulting measure of
+    exactly -1/2 revolution is flipped to +1/2.
+    """
+
+    half = mod/2
+    if value < -half or value > half:
+        value = ((value + half) % mod) - half
+    if value == -half:
+        value = -value
+
+    return value
+
+#=============================================================================
+# Angle Class
+#=============================================================================
+
 class Angle:
     """A class for representing and performing calculations with angles.
 
@@ -26,13 +58,14 @@ class Angle:
     object's unit. Most (Angle, Angle) binary operators have an equivalent
     (Angle, float) version that performs the same operation, but treating the
     given float as the measure of a second angle that matches the first
-    angle's unit.
+    angle's unit. The addition, subtraction, and comparison operators return
+    NotImplemented for operands which cannot be read as a float (such as an
+    AngleArray), so that Python falls back on the other operand's reflected
+    operator.
     """
 
-    # Static attributes for accepted unit names
-    _rad_str = {"radians", "radian", "rad", "r"}
-    _deg_str = {"degrees", "degree", "deg", "d"}
-    _grad_str = {"gradians", "gradian", "grad", "g"}
+    # Fixed attribute layout (no per-instance __dict__)
+    __slots__ = ("_measure", "mod", "unit", "_trig")
 
     #=========================================================================
     # Technical Methods
@@ -54,6 +87,8 @@ class Angle:
             radians, radian, rad, r -- radians (2pi)
             degrees, degree, deg, d -- degrees (360)
             gradians, gradian, grad, g -- gradians (400)
+        Additional unit names can be defined with
+        angle_headings.register_unit().
         """
 
         # Parse unit arguments
@@ -76,6 +111,27 @@ class Angle:
 
     #-------------------------------------------------------------------------
 
+    def __reduce__(self):
+        """Pickles the Angle by its measure and interned unit.
+
+        Only the measure and the Unit are stored (not the cached cosine and
+        sine), and a registered Unit is stored once per pickle, however many
+        Angles share it. This keeps Angles cheap to send between processes.
+        (Units of unregistered numerical mods are not interned, so they are
+        stored once per Angle.)
+        Subclasses are rebuilt as their own class, with their constructor
+        called as cls(measure, unit), and any instance __dict__ restored.
+        """
+
+        args = (self._measure, get_unit(self.mod))
+        state = getattr(self, "__dict__", None)
+        if state:
+            return (type(self), args, state)
+
+        return (type(self), args)
+
+    #-------------------------------------------------------------------------
+
     def _set_mod(self, mod):
         """Angle._set_mod(mod) -> None
         Sets mod and unit based on a given mod input.
@@ -84,46 +140,15 @@ class Angle:
         mod (str or float) -- angle unit, or measure of one full revolution
 
         This is a private method called during the Angle's initialization, or
-        when its mod value is reset. It includes a procedure for parsing the
-        input (which can have several different types) and setting the unit
-        string.
-        """
-
-        # Initialize mod and unit
-        self.mod = 0.0 # full revolution measure
-        self.unit = "rad" # name of unit for string output
-
-        # Attempt to parse string mod argument
-        if isinstance(mod, str) == True:
-            # Search through recognized words
-            if mod in Angle._rad_str:
-                self.mod = 2*math.pi
-                self.unit = "rad"
-            elif mod in Angle._deg_str:
-                self.mod = 360.0
-                self.unit = "deg"
-            elif mod in Angle._grad_str:
-                self.mod = 400.0
-                self.unit = "grad"
-            else:
-                # If unrecognized, raise a value error
-                raise ValueError("unrecognized unit name string")
-        else:
-            # Otherwise attempt to parse numerical mod argument
-            self.mod = abs(float(mod))
-            self.unit = "/ " + str(self.mod)
-
-            # Raise a value error in case of nonpositive mod
-            if self.mod <= 0.0:
-                raise ValueError("measure of full revolution must be positive")
+        when its mod value is reset. It looks up the input (which can have
+        several different types) in the unit registry, which parses each
+        distinct unit only once, and sets the unit string.
+        """
 
-        # Rename unit for recognized moduli
-        if mod == 2*math.pi:
-            self.unit = "rad"
-        elif mod == 360.0:
-            self.unit = "deg"
-        elif mod == 400.0:
-            self.unit = "grad"
+        # Look up the interned unit in the registry
+        unit = get_unit(mod)
+        self.mod = unit.mod # full revolution measure
+        self.unit = unit.name # name of unit for string output
 
     #-------------------------------------------------------------------------
 
@@ -137,14 +162,18 @@ class Angle:
 
         This is a private method used in some operations that can accept
         either another Angle object or a float. If given an Angle, this
-        method returns that Angle's measure converted to this Angle's unit.
-        If given a float, it simply returns the float directly.
+        method returns that Angle's measure converted to this Angle's unit
+        (with a single multiplication, since the caller normalizes the
+        result). If given a float, it simply returns the float directly.
         """
 
         # Determine class of argument
         if isinstance(other, Angle) == True:
-            # If another angle, convert the other argument
-            m = other.convert(self.mod)
+            # If another angle, scale its measure into this Angle's unit
+            if other.mod == self.mod:
+                m = other._measure
+            else:
+                m = other._measure*(self.mod/other.mod)
         else:
             # Otherwise attempt to parse second argument as a float
             m = float(other)
@@ -154,6 +183,70 @@ class Angle:
 
     #-------------------------------------------------------------------------
 
+    def _new(self, value):
+        """Angle._new(value) -> Angle
+        Returns a new Angle with this Angle's unit.
+
+        Positional arguments:
+        value (float) -- measure of the new Angle
+
+        This is a private method used by the operators to build their
+        results. Since the new Angle shares this Angle's already-validated
+        mod and unit, it skips the unit parsing done by the constructor and
+        only applies the same normalization as the measure setter.
+        """
+
+        # Allocate without calling the constructor and copy the unit
+        out = Angle.__new__(Angle)
+        mod = self.mod
+        out.mod = mod
+        out.unit = self.unit
+
+        # Normalize exactly as the measure setter does (inlined for speed)
+        half = mod/2
+        if value < -half or value > half:
+            value = ((value + half) % mod) - half
+        if value == -half:
+            value = -value
+        out._measure = value
+        out._trig = None
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def _delta(self, other):
+        """Angle._delta(other) -> float
+        Gets the normalized difference between this and another measure.
+
+        Positional arguments:
+        other (Angle or float) -- other Angle or float to be treated as a
+            measure
+
+        This is a private method used by the comparison operators. It returns
+        the measure of (self - other) as a float, computed without building
+        an intermediate Angle.
+
+        Types which cannot be read as a float (such as AngleArray and
+        BAMAngle) may define a _rdelta(angle) method, which returns the
+        normalized difference (angle - other) from this Angle's side. This
+        keeps the comparison conventions for the Angle as the caller,
+        including the tie-break for diametrically opposed measures.
+        """
+
+        try:
+            theta = self._get_other_measure(other)
+        except TypeError:
+            # Let the other type compute the difference for this Angle
+            reflected = getattr(other, "_rdelta", None)
+            if reflected is None:
+                raise
+            return reflected(self)
+
+        return _normalize(self._measure - theta, self.mod)
+
+    #-------------------------------------------------------------------------
+
     @property
     def measure(self):
         """Angle.measure() -> float
@@ -173,15 +266,29 @@ class Angle:
         value (float) -- new angle measure
         """
 
-        # Set private measure variable
-        self._measure = value
+        # Set private measure variable, normalizing if needed
+        self._measure = _normalize(value, self.mod)
 
-        # Normalize if needed
-        if self._measure < -self.mod/2 or self._measure > self.mod/2:
-            self._measure = (((self._measure + (self.mod/2)) % self.mod)
-                             - (self.mod/2))
-        if (self._measure == -self.mod/2):
-            self._measure = -self._measure
+        # Invalidate the cached cosine and sine
+        self._trig = None
+
+    #-------------------------------------------------------------------------
+
+    def _get_trig(self):
+        """Angle._get_trig() -> tuple
+        Gets the cosine and sine of the angle, computing them if needed.
+
+        This is a private method used by the trigonometric accessors. Both
+        values are computed together on first access and cached until the
+        measure is next set.
+        """
+
+        trig = self._trig
+        if trig is None:
+            theta = self._measure*(2*math.pi/self.mod)
+            trig = self._trig = (math.cos(theta), math.sin(theta))
+
+        return trig
 
     #=========================================================================
     # Custom Methods
@@ -199,21 +306,8 @@ class Angle:
         to the given unit).
         """
 
-        # Attempt to parse string mod argument
-        if isinstance(new_mod, str) == True:
-            # Search through recognized words
-            if new_mod in Angle._rad_str:
-                new_mod = 2*math.pi
-            elif new_mod in Angle._deg_str:
-                new_mod = 360.0
-            elif new_mod in Angle._grad_str:
-                new_mod = 400.0
-            else:
-                # If unrecognized, raise a value error
-                raise ValueError("unrecognized unit name string")
-        else:
-            # Otherwise attempt to parse numerical mod argument
-            new_mod = abs(float(new_mod))
+        # Look up the new unit in the registry
+        new_mod = get_unit(new_mod).mod
 
         # Convert measure as a fraction of a complete revolution
         return ((self._measure/self.mod) % 1.0)*new_mod
@@ -238,11 +332,102 @@ class Angle:
         """
 
         # Calculate absolute difference between the measures
-        diff = abs(self - other)
+        diff = abs(self._delta(other))
 
         # Return normalized difference value
         return diff/(self.mod/2)
 
+    #-------------------------------------------------------------------------
+
+    def relkey(self):
+        """Angle.relkey() -> function
+        Returns a sort key which orders headings relative to this Angle.
+
+        The returned function accepts an Angle or a float (treated as a
+        measure in this Angle's unit) and returns the measure of the smallest
+        angle from this Angle to it, as a float in this Angle's unit between
+        -1/2 (exclusive) and 1/2 (inclusive) full revolutions. Sorting by
+        this key orders headings from the most clockwise to the most
+        counterclockwise relative to this Angle, consistently with the
+        comparison operators, and without building intermediate Angles. It
+        can be used as the "key" argument of sorted(), min(), max(), and the
+        bisect module functions.
+        """
+
+        # Capture the reference measure and unit
+        ref = self._measure
+        mod = self.mod
+        get = self._get_other_measure
+
+        def key(other):
+            return _normalize(get(other) - ref, mod)
+
+        return key
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def from_xy(cls, x, y, mod="radians"):
+        """Angle.from_xy(x, y[, mod]) -> Angle
+        Returns the heading of a 2D vector.
+
+        Positional arguments:
+        x (float) -- x-component of the vector
+        y (float) -- y-component of the vector
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- unit of the returned Angle
+
+        The heading is measured counterclockwise from the positive x-axis,
+        as computed by math.atan2(y, x). The zero vector has heading 0.0.
+        """
+
+        # Compute the measure first, so that immutable subclasses work too
+        measure = math.atan2(y, x)*(get_unit(mod).mod/(2*math.pi))
+
+        return cls(measure, mod)
+
+    #=========================================================================
+    # Trigonometric Accessors
+    #=========================================================================
+
+    @property
+    def cos(self):
+        """Angle.cos() -> float
+        Retrieves the cosine of the angle.
+
+        The cosine and sine are computed together on first access and cached
+        until the measure is next set, so repeated accesses cost only an
+        attribute lookup.
+        """
+
+        return self._get_trig()[0]
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def sin(self):
+        """Angle.sin() -> float
+        Retrieves the sine of the angle.
+
+        Cached along with the cosine, as described for Angle.cos().
+        """
+
+        return self._get_trig()[1]
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def unit_vector(self):
+        """Angle.unit_vector() -> tuple
+        Retrieves the unit vector pointing along the angle's heading.
+
+        Returns the tuple (cos, sin), from the same cache as Angle.cos() and
+        Angle.sin().
+        """
+
+        return self._get_trig()
+
     #=========================================================================
     # Overloaded Numerical Operators
     #=========================================================================
@@ -293,7 +478,7 @@ class Angle:
         normalized to lie within (-1/2,1/2] full revolutions.
         """
 
-        return Angle(self.measure, self.mod)
+        return self._new(self._measure)
 
     #-------------------------------------------------------------------------
 
@@ -306,7 +491,7 @@ class Angle:
         revolutions.
         """
 
-        return Angle(-self.measure, self.mod)
+        return self._new(-self._measure)
 
     #-------------------------------------------------------------------------
 
@@ -327,11 +512,14 @@ class Angle:
         automatically normalized to lie within (-1/2,1/2] full revolutions.
         """
 
-        # Get second argument as a float
-        theta = self._get_other_measure(other)
+        # Get second argument as a float (deferring to batched types)
+        try:
+            theta = self._get_other_measure(other)
+        except TypeError:
+            return NotImplemented
 
         # Add to this Angle's measure and return result
-        return Angle(self.measure + theta, self.mod)
+        return self._new(self._measure + theta)
 
     #-------------------------------------------------------------------------
 
@@ -353,11 +541,14 @@ class Angle:
         automatically normalized to lie within (-1/2,1/2] full revolutions.
         """
 
-        # Get second argument as a float
-        theta = self._get_other_measure(other)
+        # Get second argument as a float (deferring to batched types)
+        try:
+            theta = self._get_other_measure(other)
+        except TypeError:
+            return NotImplemented
 
         # Subtract from this Angle's measure and return result
-        return Angle(self.measure - theta, self.mod)
+        return self._new(self._measure - theta)
 
     #-------------------------------------------------------------------------
 
@@ -376,11 +567,11 @@ class Angle:
         """
 
         # Multiply this Angle's measure and return result
-        return Angle(self.measure*other, self.mod)
+        return self._new(self._measure*other)
 
     #-------------------------------------------------------------------------
 
-    def __div__(self, other):
+    def __truediv__(self, other):
         """Angle / float -> Angle
         Returns a new Angle with its measure divided by a given float.
 
@@ -395,7 +586,10 @@ class Angle:
         """
 
         # Divide this Angle's measure and return result
-        return Angle(self.measure/other, self.mod)
+        return self._new(self._measure/other)
+
+    # Python 2 name of the division operator
+    __div__ = __truediv__
 
     #-------------------------------------------------------------------------
 
@@ -415,7 +609,7 @@ class Angle:
         """
 
         # Floor divide this Angle's measure and return result
-        return Angle(self.measure//other, self.mod)
+        return self._new(self._measure//other)
 
     #-------------------------------------------------------------------------
 
@@ -434,7 +628,143 @@ class Angle:
         """
 
         # Exponentiate this Angle's measure and return result
-        return Angle(self.measure**other, self.mod)
+        return self._new(self._measure**other)
+
+    #=========================================================================
+    # Overloaded In-Place Operators
+    #=========================================================================
+
+    def __iadd__(self, other):
+        """Angle += Angle
+        Angle += float
+        Adds another angle's measure to this Angle's measure.
+
+        Positional arguments:
+        other (Angle or float) -- measure to be added to this Angle's measure
+
+        If the second argument is an Angle, it is first converted to this
+        Angle's unit. If the second argument is a float, it is assumed to
+        already match this Angle's unit.
+
+        This Angle is updated in place, without allocating a new Angle, and
+        its measure is normalized to lie within (-1/2,1/2] full revolutions.
+        """
+
+        # Get second argument as a float
+        theta = self._get_other_measure(other)
+
+        # Add in place, normalizing once
+        self.measure = self._measure + theta
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __isub__(self, other):
+        """Angle -= Angle
+        Angle -= float
+        Subtracts another angle's measure from this Angle's measure.
+
+        Positional arguments:
+        other (Angle or float) -- measure to be subtracted from this Angle's
+            measure
+
+        If the second argument is an Angle, it is first converted to this
+        Angle's unit. If the second argument is a float, it is assumed to
+        already match this Angle's unit.
+
+        This Angle is updated in place, without allocating a new Angle, and
+        its measure is normalized to lie within (-1/2,1/2] full revolutions.
+        """
+
+        # Get second argument as a float
+        theta = self._get_other_measure(other)
+
+        # Subtract in place, normalizing once
+        self.measure = self._measure - theta
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __imul__(self, other):
+        """Angle *= float
+        Multiplies this Angle's measure by a given float.
+
+        Positional arguments:
+        other (float) -- factor by which to multiply this Angle's measure
+
+        The argument is a float, assumed to already match this Angle's unit.
+
+        This Angle is updated in place, without allocating a new Angle, and
+        its measure is normalized to lie within (-1/2,1/2] full revolutions.
+        """
+
+        # Multiply this Angle's measure in place, normalizing once
+        self.measure = self._measure*other
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __itruediv__(self, other):
+        """Angle /= float
+        Divides this Angle's measure by a given float.
+
+        Positional arguments:
+        other (float) -- factor by which to divide this Angle's measure
+
+        The argument is a float, assumed to already match this Angle's unit.
+
+        This Angle is updated in place, without allocating a new Angle, and
+        its measure is normalized to lie within (-1/2,1/2] full revolutions.
+        """
+
+        # Divide this Angle's measure in place, normalizing once
+        self.measure = self._measure/other
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __ifloordiv__(self, other):
+        """Angle //= float
+        Floor divides this Angle's measure by a given float.
+
+        Positional arguments:
+        other (float) -- factor by which to (floor) divide this Angle's
+            measure
+
+        The argument is a float, assumed to already match this Angle's unit.
+
+        This Angle is updated in place, without allocating a new Angle, and
+        its measure is normalized to lie within (-1/2,1/2] full revolutions.
+        """
+
+        # Floor divide this Angle's measure in place, normalizing once
+        self.measure = self._measure//other
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __ipow__(self, other):
+        """Angle **= float
+        Raises this Angle's measure to a given float power.
+
+        Positional arguments:
+        other (float) -- power to which to raise this Angle's measure
+
+        The argument is a float, assumed to already match this Angle's unit.
+
+        This Angle is updated in place, without allocating a new Angle, and
+        its measure is normalized to lie within (-1/2,1/2] full revolutions.
+        """
+
+        # Exponentiate this Angle's measure in place, normalizing once
+        self.measure = self._measure**other
+
+        return self
 
     #=========================================================================
     # Overloaded Equality Comparisons
@@ -462,7 +792,10 @@ class Angle:
         """
 
         # Find the difference between the Angles
-        delta = float(self - other)
+        try:
+            delta = self._delta(other)
+        except TypeError:
+            return NotImplemented
 
         # Angles equal if difference is zero
         return delta == 0
@@ -490,8 +823,14 @@ class Angle:
         measures is sufficiently small.
         """
 
+        # Find the difference between the Angles
+        try:
+            delta = self._delta(other)
+        except TypeError:
+            return NotImplemented
+
         # Negate equality definition
-        return not (self == other)
+        return delta != 0
 
     #=========================================================================
     # Overloaded Inequality Comparisons
@@ -517,7 +856,10 @@ class Angle:
         """
 
         # Find the difference between the Angles
-        delta = float(self - other)
+        try:
+            delta = self._delta(other)
+        except TypeError:
+            return NotImplemented
 
         # Determine output based on sign of difference
         return delta > 0
@@ -544,7 +886,10 @@ class Angle:
         """
 
         # Find the difference between the Angles
-        delta = float(self - other)
+        try:
+            delta = self._delta(other)
+        except TypeError:
+            return NotImplemented
 
         # Determine output based on sign of difference
         return delta < 0
@@ -570,8 +915,14 @@ class Angle:
         counterclockwise relative to B (or if the measures are equal).
         """
 
-        # Combine > operator and == operator
-        return (self == other) or (self > other)
+        # Find the difference between the Angles
+        try:
+            delta = self._delta(other)
+        except TypeError:
+            return NotImplemented
+
+        # Combine > operator and == operator in a single difference
+        return delta >= 0
 
     #-------------------------------------------------------------------------
 
@@ -594,5 +945,11 @@ class Angle:
         clockwise relative to B (or if the measures are equal).
         """
 
-        # Combine < operator and == operator
-        return (self == other) or (self < other)
+        # Find the difference between the Angles
+        try:
+            delta = self._delta(other)
+        except TypeError:
+            return NotImplemented
+
+        # Combine < operator and == operator in a single difference
+        return delta <= 0
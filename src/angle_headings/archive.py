@@ -0,0 +1,334 @@
+"""Defines a compact binary file format for memory-mapped Angle datasets."""
+
+from ._version import __author__, __version__
+
+import os
+import struct
+
+import numpy as np
+
+from .angles import Angle
+from .arrays import AngleArray, _as_angle_array, _normalize
+from .units import Unit, get_unit
+
+#=============================================================================
+# File Format
+#=============================================================================
+
+# An archive begins with a fixed header: a magic number, a format version,
+# the payload's NumPy type code, the full revolution measure, the offset of
+# the payload, and the length of the unit name, followed by the UTF-8 unit
+# name. The payload starts at the next multiple of 64 bytes, and holds one
+# little-endian value per heading up to the end of the file, so that
+# appending never rewrites the header.
+_HEADER = struct.Struct("<4sB3sdIH")
+_MAGIC = b"AHDG"
+_VERSION = 1
+_ALIGN = 64
+
+# Payload encodings, by name, and their type codes
+_PAYLOADS = {"float64": b"<f8", "float32": b"<f4", "fixed16": b"<u2",
+             "fixed32": b"<u4"}
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _payload(dtype):
+    """_payload(dtype) -> bytes
+    Returns the type code of a payload encoding name or float dtype.
+    """
+
+    if isinstance(dtype, str) == True and dtype in _PAYLOADS:
+        return _PAYLOADS[dtype]
+    try:
+        name = np.dtype(dtype).name
+    except TypeError:
+        name = None
+    if name not in ("float64", "float32"):
+        raise ValueError("dtype must be float64, float32, fixed16, or "
+                         "fixed32")
+
+    return _PAYLOADS[name]
+
+#-----------------------------------------------------------------------------
+
+def _read_header(f):
+    """_read_header(f) -> tuple
+    Reads an archive header from a binary file positioned at its start.
+
+    Returns the payload dtype, the Unit, and the payload offset. Raises a
+    ValueError if the file is not an archive of a supported version.
+    """
+
+    data = f.read(_HEADER.size)
+    if len(data) < _HEADER.size:
+        raise ValueError("not an angle archive")
+    magic, version, code, mod, offset, size = _HEADER.unpack(data)
+    if magic != _MAGIC:
+        raise ValueError("not an angle archive")
+    if version != _VERSION:
+        raise ValueError("unsupported angle archive version")
+    name = f.read(size).decode("utf-8")
+
+    return np.dtype(code.decode("ascii")), _header_unit(name, mod), offset
+
+#-----------------------------------------------------------------------------
+
+def _header_unit(name, mod):
+    """_header_unit(name, mod) -> Unit
+    Gets the Unit recorded in an archive header, without registering it.
+
+    Returns the registered Unit if the name is already registered with the
+    same mod, and otherwise a new Unit private to the archive, so that
+    reading an archive never changes the process-wide unit registry.
+    """
+
+    try:
+        unit = get_unit(name)
+    except ValueError:
+        unit = None
+    if unit is not None and unit.mod == mod:
+        return unit
+
+    return Unit(name, mod)
+
+#-----------------------------------------------------------------------------
+
+def _encode(a, dtype):
+    """_encode(a, dtype) -> ndarray
+    Encodes an AngleArray's measures as payload values.
+
+    Positional arguments:
+    a (AngleArray) -- headings, already in the archive's unit
+    dtype (dtype) -- payload dtype
+    """
+
+    # Floats are normalized at the payload's precision
+    if dtype.kind == "f":
+        return _normalize(a.measure, a.mod, dtype.newbyteorder("="))
+
+    # Fixed-point values are unsigned step counts, as for BAMAngle
+    steps = float(1 << (8*dtype.itemsize))
+    out = np.rint(np.multiply(a.measure, steps/a.mod, dtype=np.float64))
+    np.mod(out, steps, out=out)
+
+    return out
+
+#-----------------------------------------------------------------------------
+
+def _decode(values, mod, dtype):
+    """_decode(values, mod, dtype) -> AngleArray
+    Decodes payload values into an AngleArray.
+    """
+
+    if dtype.kind == "f":
+        return AngleArray(values, mod, dtype.newbyteorder("="))
+
+    # Scale the step counts, and move the upper half revolution down
+    m = np.multiply(values, mod/(1 << (8*dtype.itemsize)), dtype=np.float64)
+    m[m > mod/2] -= mod
+
+    return AngleArray(m, mod)
+
+#=============================================================================
+# Writing
+#=============================================================================
+
+def write_archive(path, angles, mod=None, dtype="float64"):
+    """write_archive(path, angles[, mod[, dtype]]) -> int
+    Writes headings to a new binary archive.
+
+    Positional arguments:
+    path (str or path) -- path of the file to create (overwriting any
+        existing file)
+    angles (AngleArray, iterable, or array-like) -- headings, as an
+        AngleArray, an iterable of Angles, or an array of float measures
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings, and of the archive
+        (defaults to radians for floats, and to the headings' own unit
+        otherwise)
+    dtype (str) ["float64"] -- payload encoding: "float64", "float32", or
+        "fixed16" or "fixed32" for unsigned fixed-point step counts with
+        2**16 or 2**32 steps per full revolution
+
+    The unit is stored once in the header, and the measures are written as
+    one contiguous block. Float payloads follow the same normalization as
+    AngleArrays of the same dtype. Fixed-point payloads are accurate to half
+    a step (about 0.0027 degrees for fixed16). Returns the number of
+    headings written.
+    """
+
+    code = _payload(dtype)
+    dtype = np.dtype(code.decode("ascii"))
+    a = _as_angle_array(angles, mod)
+    unit = get_unit(a.mod)
+    name = unit.name.encode("utf-8")
+
+    # Pad the header so that the payload is aligned
+    size = _HEADER.size + len(name)
+    offset = -(-size//_ALIGN)*_ALIGN
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, code, unit.mod, offset,
+                             len(name)))
+        f.write(name + b"\0"*(offset - size))
+        f.write(_encode(a, dtype).astype(dtype).tobytes())
+
+    return len(a)
+
+#-----------------------------------------------------------------------------
+
+def append_archive(path, angles, mod=None):
+    """append_archive(path, angles[, mod]) -> int
+    Appends headings to an existing binary archive in bulk.
+
+    Positional arguments:
+    path (str or path) -- path of an archive written by write_archive()
+    angles (AngleArray, iterable, or array-like) -- headings, as an
+        AngleArray, an iterable of Angles, or an array of float measures
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to the
+        archive's unit)
+
+    The headings are converted into the archive's unit and encoding, and
+    written with a single call at the end of the file. The header is not
+    rewritten. AngleArchive objects which are already open do not see the
+    new headings until they are opened again. Returns the number of
+    headings written.
+    """
+
+    with open(path, "r+b") as f:
+        dtype, unit, offset = _read_header(f)
+        a = _as_angle_array(angles, unit.mod if mod is None else mod)
+        a = _as_angle_array(a, unit.mod)
+
+        # Drop any partial value left by an interrupted write
+        end = f.seek(0, os.SEEK_END)
+        f.truncate(end - (end - offset) % dtype.itemsize)
+        f.seek(0, os.SEEK_END)
+        f.write(_encode(a, dtype).astype(dtype).tobytes())
+
+    return len(a)
+
+#=============================================================================
+# AngleArchive Class
+#=============================================================================
+
+class AngleArchive:
+    """A read-only, memory-mapped view of a binary archive of headings.
+
+    Opening an archive reads only its header. The payload is memory-mapped,
+    so indexing or slicing reads only the pages which hold the requested
+    headings, and files larger than the available memory can be accessed
+    at random. Headings are decoded into Angles or AngleArrays as they are
+    accessed, without parsing any text.
+
+    An AngleArchive object has the following public attributes:
+        dtype (dtype) -- payload dtype (float64, float32, or an unsigned
+            integer type for fixed-point payloads)
+        mod (float) -- the measure of one full revolution
+        path (str) -- path of the archive
+        payload (ndarray) -- the raw memory-mapped payload values
+        unit (str) -- string version of the archive's unit
+
+    Opening an archive does not register its unit, so reading a file never
+    changes the process-wide unit registry. The unit attribute is the name
+    recorded in the header, while the Angles and AngleArrays read from the
+    archive take their unit names from the registry, as usual.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, path):
+        """AngleArchive(path) -> AngleArchive
+        Opens a binary archive for reading.
+
+        Positional arguments:
+        path (str or path) -- path of an archive written by write_archive()
+        """
+
+        with open(path, "rb") as f:
+            dtype, unit, offset = _read_header(f)
+            end = f.seek(0, os.SEEK_END)
+        self.path = str(path)
+        self.mod = unit.mod
+        self.unit = unit.name
+        self.dtype = dtype
+
+        # Map every complete value after the header
+        n = (end - offset)//dtype.itemsize
+        if n > 0:
+            self.payload = np.memmap(path, dtype, "r", offset, (n,))
+        else:
+            self.payload = np.empty(0, dtype)
+
+    #-------------------------------------------------------------------------
+
+    def __len__(self):
+        """len(AngleArchive) -> int
+        Returns the number of headings in the archive.
+        """
+
+        return len(self.payload)
+
+    #-------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        """AngleArchive[key] -> Angle or AngleArray
+        Reads a single Angle or a sub-array of headings.
+
+        Positional arguments:
+        key (int, slice, or array-like) -- NumPy-style index
+
+        Indexing a single element returns an Angle with the archive's unit,
+        while any other index returns a new AngleArray (of float32 measures
+        for a float32 payload). Only the requested values are read.
+        """
+
+        values = self.payload[key]
+        if np.ndim(values) == 0:
+            a = _decode(np.atleast_1d(values), self.mod, self.dtype)
+            return Angle(float(a.measure[0]), self.mod)
+
+        return _decode(values, self.mod, self.dtype)
+
+    #-------------------------------------------------------------------------
+
+    def __enter__(self):
+        """Returns this AngleArchive as a context manager."""
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __exit__(self, *args):
+        """Closes the archive on leaving a with block."""
+
+        self.close()
+
+    #=========================================================================
+    # Access Methods
+    #=========================================================================
+
+    def to_array(self):
+        """AngleArchive.to_array() -> AngleArray
+        Reads every heading in the archive into a new AngleArray.
+        """
+
+        return self[:]
+
+    #-------------------------------------------------------------------------
+
+    def close(self):
+        """AngleArchive.close() -> None
+        Releases the memory map.
+
+        The AngleArchive cannot be used afterwards. Any views of its payload
+        must be released first.
+        """
+
+        self.payload = np.empty(0, self.dtype)
@@ -0,0 +1,169 @@
+"""Defines covering arc, gap, and spread computations for sets of Angles."""
+
+from ._version import __author__, __version__
+
+import sys
+
+from .angles import Angle, _normalize
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _sort(angles, mod):
+    """_sort(angles, mod) -> tuple
+    Sorts a collection of headings once on the circle.
+
+    Positional arguments:
+    angles (iterable or AngleArray) -- headings, as Angles, floats, or a
+        single AngleArray
+    mod (str or float) -- unit of float headings, and of the results
+        (defaults to radians for floats, and to the unit of the first Angle
+        or the AngleArray otherwise)
+
+    Returns the sorted normalized measures, the indices of the headings in
+    sorted order, the gap following each sorted measure (the last of which
+    wraps around through the -1/2 / +1/2 revolution seam), the index of
+    the first largest gap, and a template Angle with the results' unit.
+    Both sequences are lists, or NumPy arrays for an AngleArray.
+    """
+
+    # Sort an AngleArray with vectorized passes
+    arrays = sys.modules.get(__package__ + ".arrays")
+    if arrays is not None and isinstance(angles, arrays.AngleArray):
+        np = arrays.np
+        a = arrays._as_angle_array(angles, mod)
+        if len(a) == 0:
+            raise ValueError("no headings given")
+        template = Angle(0.0, a.mod)
+        order = np.argsort(a.measure, kind="stable")
+        m = a.measure[order]
+        gaps = np.append(np.diff(m), m[0] + a.mod - m[-1])
+        return m, order, gaps, int(np.argmax(gaps)), template
+
+    # Otherwise parse and sort the headings one at a time
+    angles = list(angles)
+    if len(angles) == 0:
+        raise ValueError("no headings given")
+    if mod is None:
+        first = angles[0]
+        mod = first.mod if isinstance(first, Angle) == True else "radians"
+    template = Angle(0.0, mod)
+    measures = [_normalize(template._get_other_measure(a), template.mod)
+                for a in angles]
+    order = sorted(range(len(measures)), key=measures.__getitem__)
+    m = [measures[i] for i in order]
+    gaps = [y - x for x, y in zip(m, m[1:])] + [m[0] + template.mod - m[-1]]
+
+    return m, order, gaps, gaps.index(max(gaps)), template
+
+#=============================================================================
+# Arcs and Gaps
+#=============================================================================
+
+def covering_arc(angles, mod=None):
+    """covering_arc(angles[, mod]) -> tuple
+    Finds the smallest arc which contains every heading.
+
+    Positional arguments:
+    angles (iterable or AngleArray) -- headings, as Angles, floats, or a
+        single AngleArray
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings, and of the results
+        (defaults to radians for floats, and to the unit of the first Angle
+        or the AngleArray otherwise)
+
+    Returns a tuple (start, end, order), where the arc runs counterclockwise
+    from the Angle start to the Angle end, and order lists the indices of
+    the headings in counterclockwise order from start to end. The arc is
+    the complement of the largest gap between consecutive headings, so it
+    correctly handles sets which straddle the -1/2 / +1/2 revolution seam.
+    If several gaps are equally large, the one following the most clockwise
+    heading (by measure) is used. The headings are sorted once, so this
+    takes O(n log n) time. Raises a ValueError if there are no headings.
+    """
+
+    m, order, gaps, k, template = _sort(angles, mod)
+    n = len(m)
+    start = (k + 1) % n
+    if isinstance(order, list) == True:
+        order = order[start:] + order[:start]
+    else:
+        import numpy as np
+        order = np.concatenate((order[start:], order[:start]))
+
+    return (template._new(float(m[start])), template._new(float(m[k])),
+            order)
+
+#-----------------------------------------------------------------------------
+
+def largest_gap(angles, mod=None):
+    """largest_gap(angles[, mod]) -> tuple
+    Finds the largest arc which contains no headings.
+
+    Positional arguments:
+    angles (iterable or AngleArray) -- headings, as Angles, floats, or a
+        single AngleArray
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings, and of the results
+        (defaults to radians for floats, and to the unit of the first Angle
+        or the AngleArray otherwise)
+
+    Returns a tuple (start, end, width), where the gap runs counterclockwise
+    from the heading start to the heading end (both Angles), and width is
+    its measure as a float. For a single heading (or a set of equal
+    headings) the gap is the full revolution. Ties are broken as in
+    covering_arc(). Raises a ValueError if there are no headings.
+    """
+
+    m, order, gaps, k, template = _sort(angles, mod)
+    start = template._new(float(m[k]))
+    end = template._new(float(m[(k + 1) % len(m)]))
+
+    return (start, end, float(gaps[k]))
+
+#=============================================================================
+# Spread
+#=============================================================================
+
+def circular_spread(angles, mod=None):
+    """circular_spread(angles[, mod]) -> float
+    Returns the circular interquartile range of a set of headings.
+
+    Positional arguments:
+    angles (iterable or AngleArray) -- headings, as Angles, floats, or a
+        single AngleArray
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings, and of the result
+        (defaults to radians for floats, and to the unit of the first Angle
+        or the AngleArray otherwise)
+
+    The headings are laid out counterclockwise along their covering arc
+    (see covering_arc()), and the result is the width of the arc between
+    their 25th and 75th percentiles (linearly interpolated), as a float.
+    Unlike the width of the covering arc itself, this is robust to a few
+    outlying headings. Raises a ValueError if there are no headings.
+    """
+
+    m, order, gaps, k, template = _sort(angles, mod)
+    n = len(m)
+
+    # Unwrap the sorted measures to run continuously from the arc's start
+    start = (k + 1) % n
+    if isinstance(m, list) == True:
+        u = m[start:] + [x + template.mod for x in m[:start]]
+    else:
+        import numpy as np
+        u = np.concatenate((m[start:], m[:start] + template.mod))
+
+    def percentile(q):
+        pos = q*(n - 1)
+        i = int(pos)
+        if i + 1 >= n:
+            return u[-1]
+        return u[i] + (pos - i)*(u[i + 1] - u[i])
+
+    return float(percentile(0.75) - percentile(0.25))
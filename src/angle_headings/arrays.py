@@ -0,0 +1,872 @@
+"""Defines this package's NumPy-backed AngleArray class."""
+
+from ._version import __author__, __version__
+
+import numpy as np
+
+from .angles import Angle
+from .units import get_unit
+
+# Supported storage precisions
+_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _get_dtype(dtype):
+    """_get_dtype(dtype) -> dtype
+    Parses a storage precision, raising a ValueError if it is unsupported.
+    """
+
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError("dtype must be float32 or float64")
+    if dtype not in _DTYPES:
+        raise ValueError("dtype must be float32 or float64")
+
+    return dtype
+
+#-----------------------------------------------------------------------------
+
+def _normalize(value, mod, dtype=np.float64):
+    """_normalize(value, mod[, dtype]) -> ndarray
+    Normalizes an array of measures to lie within (-1/2,1/2] revolutions.
+
+    Positional arguments:
+    value (array-like) -- angle measures
+    mod (float) -- measure of one full revolution
+
+    Keyword arguments:
+    dtype (dtype) [float64] -- storage precision of the result
+
+    This applies the same rule as the Angle.measure setter, element by
+    element: measures already within [-1/2,1/2] revolutions are left
+    untouched, measures outside of it are wrapped with a modulo, and any
+    resulting measure of exactly -1/2 revolution is flipped to +1/2.
+
+    Normalization is always done in float64. For float32 storage the result
+    is then rounded once, and any measure which rounded past 1/2 revolution
+    (or onto -1/2) is replaced with the largest float32 value not exceeding
+    1/2 revolution, so that the stored measures also satisfy the rule.
+    """
+
+    # Copy the measures into a contiguous float buffer
+    m = _normalize_inplace(np.array(value, dtype=np.float64), mod)
+    if dtype == np.float64:
+        return m
+
+    # Round to the storage precision
+    out = m.astype(dtype)
+    half = out.dtype.type(mod/2)
+    if float(half) > mod/2:
+        half = np.nextafter(half, out.dtype.type(0))
+
+    # Flip the excluded endpoint, or clamp measures which rounded past it
+    if float(half) == mod/2:
+        out[out == -half] = half
+    else:
+        out[(out < -half) | (out > half)] = half
+
+    return out
+
+#-----------------------------------------------------------------------------
+
+def _normalize_inplace(m, mod):
+    """_normalize_inplace(m, mod) -> ndarray
+    Normalizes a float array of measures without copying it.
+
+    Positional arguments:
+    m (ndarray) -- float array of angle measures, overwritten in place
+    mod (float) -- measure of one full revolution
+
+    Returns the same array, following the rule described in _normalize().
+    """
+
+    half = mod/2
+
+    # Wrap only the measures which fall outside of the range
+    out = (m < -half) | (m > half)
+    if out.any():
+        m[out] = ((m[out] + half) % mod) - half
+
+    # Flip the excluded endpoint
+    m[m == -half] = half
+
+    return m
+
+#-----------------------------------------------------------------------------
+
+def _as_angle_array(angles, mod=None):
+    """_as_angle_array(angles[, mod]) -> AngleArray
+    Gets a collection of headings as an AngleArray.
+
+    Positional arguments:
+    angles (AngleArray, iterable, or array-like) -- headings, as an
+        AngleArray, an iterable of Angles, or an array of float measures
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float measures, and of the result
+        if the headings are Angles (defaults to radians for floats, and to
+        the headings' own unit otherwise)
+
+    This is a private function used by the batched operations to accept the
+    same kinds of inputs. AngleArrays are returned as they are, without
+    copying, unless a different unit is requested.
+    """
+
+    # AngleArrays are used directly, or converted to the requested unit
+    if isinstance(angles, AngleArray) == True:
+        if mod is None or get_unit(mod).mod == angles.mod:
+            return angles
+        return AngleArray(np.multiply(angles.measure,
+                                      get_unit(mod).mod/angles.mod,
+                                      dtype=np.float64), mod, angles.dtype)
+
+    # Sequences of Angles are converted to a common unit
+    if isinstance(angles, np.ndarray) == False:
+        angles = list(angles)
+        if len(angles) > 0 and isinstance(angles[0], Angle) == True:
+            return AngleArray.from_angles(angles, mod)
+
+    # Anything else is treated as float measures
+    return AngleArray(angles, "radians" if mod is None else mod)
+
+#=============================================================================
+# AngleArray Class
+#=============================================================================
+
+class AngleArray:
+    """A class for representing and performing calculations with many angles.
+
+    This is a batched counterpart to the Angle class. It stores the measures
+    of many angles in a single contiguous NumPy float buffer, all sharing a
+    single unit, and implements the Angle operators as vectorized
+    whole-array operations.
+
+    An AngleArray object has four public attributes:
+        dtype (dtype) -- storage precision of the measures, float64 or
+            float32
+        measure (ndarray) -- the numerical measures of the angles
+        mod (float) -- the measure of one full revolution (e.g. 2pi for
+            radians, 360 for degrees)
+        unit (str) -- string version of the angles' unit
+
+    All measures follow the same conventions as Angle measures. They are
+    normalized to be between -1/2 (exclusive) and 1/2 (inclusive) of a full
+    revolution, and binary operations use the first argument's unit. The
+    second argument of a binary operation may be another AngleArray, a single
+    Angle, a float, or an array of floats (which are treated as measures in
+    this AngleArray's unit). Array arguments are broadcast following the
+    usual NumPy rules. An Angle, a float, or a NumPy scalar or array may
+    also be the first argument of an addition, subtraction, or comparison
+    with an AngleArray, and an Angle keeps the first argument's tie-break
+    for diametrically opposed measures. NumPy ufuncs are not applied to
+    AngleArrays directly (they defer to the AngleArray's operators), so
+    functions such as numpy.cos() should be given AngleArray.measure.
+
+    Measures are stored as float64 by default, which matches Angle exactly.
+    Storing them as float32 halves the memory and bandwidth used by large
+    arrays. Every result is still computed in float64 and rounded once into
+    the storage precision, so each float32 measure lies within
+        2**-24 * mod/2
+    of the float64 measure that Angle (or a float64 AngleArray) gives for
+    the same operation on the same stored inputs, measured around the
+    circle. That is about 1.9e-7 radians, 1.1e-5 degrees, or 1.2e-5
+    gradians (for other units, the bound is at most twice as large). The
+    stored float32 measures satisfy the (-1/2,1/2] revolution convention
+    exactly, so measures which round onto -1/2 revolution (or past 1/2
+    revolution, if it is not exactly representable) are stored as the
+    largest float32 value not exceeding 1/2 revolution. Errors accumulate
+    across chained operations, as they would for repeated rounding of any
+    float.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, measure=(), mod="radians", dtype=np.float64):
+        """AngleArray([measure[, mod[, dtype]]]) -> AngleArray
+        AngleArray constructor.
+
+        Keyword arguments:
+        measure (array-like) [()] -- initial angle measures
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution
+        dtype (str or dtype) [float64] -- storage precision, "float64" or
+            "float32"
+
+        The optional "mod" argument accepts the same values as the Angle
+        constructor.
+        """
+
+        # Look up the interned unit in the registry
+        unit = get_unit(mod)
+        self.mod = unit.mod # full revolution measure
+        self.unit = unit.name # name of unit for string output
+        self.dtype = _get_dtype(dtype) # storage precision
+
+        # Set initial measures (automatically normalizes self)
+        self.measure = measure # current angle measures
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def from_angles(cls, angles, mod=None, dtype=np.float64):
+        """AngleArray.from_angles(angles[, mod[, dtype]]) -> AngleArray
+        Builds an AngleArray from a sequence of Angles.
+
+        Positional arguments:
+        angles (iterable) -- Angle objects
+
+        Keyword arguments:
+        mod (str or float) [None] -- angle unit, or measure of one full
+            revolution (defaults to the unit of the first Angle, or radians
+            if there are no Angles)
+        dtype (str or dtype) [float64] -- storage precision
+
+        Each Angle is converted to the requested unit.
+        """
+
+        # Materialize the sequence and determine the unit
+        angles = list(angles)
+        if mod is None:
+            mod = angles[0].mod if len(angles) > 0 else "radians"
+        out = cls((), mod, dtype)
+
+        # Scale each Angle into the common unit
+        out.measure = [a._measure*(out.mod/a.mod) for a in angles]
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def _new(self, value):
+        """AngleArray._new(value) -> AngleArray
+        Returns a new AngleArray with this AngleArray's unit.
+
+        Positional arguments:
+        value (array-like) -- measures of the new AngleArray
+
+        This is a private method used by the operators to build their
+        results without re-parsing this AngleArray's unit.
+        """
+
+        out = AngleArray.__new__(AngleArray)
+        out.mod = self.mod
+        out.unit = self.unit
+        out.dtype = self.dtype
+        out.measure = value
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def __str__(self):
+        """str(AngleArray) -> str
+        AngleArray string conversion.
+
+        Returns the measures of the angles as a string, along with an
+        abbreviation of the angle unit.
+        """
+
+        return str(self.measure) + " " + self.unit
+
+    #-------------------------------------------------------------------------
+
+    def __repr__(self):
+        """repr(AngleArray) -> str
+        AngleArray representation.
+        """
+
+        if self.dtype == np.float64:
+            return ("AngleArray(" + repr(self.measure.tolist()) + ", "
+                    + repr(self.mod) + ")")
+        return ("AngleArray(" + repr(self.measure.tolist()) + ", "
+                + repr(self.mod) + ", " + repr(self.dtype.name) + ")")
+
+    #-------------------------------------------------------------------------
+
+    def __len__(self):
+        """len(AngleArray) -> int
+        Returns the number of angles in the AngleArray.
+        """
+
+        return len(self._measure)
+
+    #-------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        """AngleArray[key] -> Angle or AngleArray
+        Retrieves a single Angle or a sub-array of Angles.
+
+        Positional arguments:
+        key (int, slice, or array-like) -- NumPy-style index
+
+        Indexing a single element returns an Angle with this AngleArray's
+        unit, while any other index returns a new AngleArray.
+        """
+
+        m = self._measure[key]
+        if np.ndim(m) == 0:
+            return Angle(float(m), self.mod)
+        return self._new(m)
+
+    #-------------------------------------------------------------------------
+
+    def __iter__(self):
+        """iter(AngleArray) -> iterator
+        Iterates over the AngleArray as individual Angles.
+        """
+
+        for m in self._measure:
+            yield Angle(float(m), self.mod)
+
+    #-------------------------------------------------------------------------
+
+    # NumPy ufuncs (including the operators of NumPy arrays and scalars)
+    # defer to the AngleArray's own operators, rather than operating on the
+    # raw measures from __array__() and returning unnormalized arrays
+    __array_ufunc__ = None
+
+    #-------------------------------------------------------------------------
+
+    def __array__(self, dtype=None, copy=None):
+        """numpy.asarray(AngleArray) -> ndarray
+        Returns the measures of the AngleArray as a NumPy array.
+
+        Unless a copy or a different dtype is requested, the result is a
+        read-only view of the measure buffer.
+        """
+
+        # Converted or requested copies are independent of the buffer
+        if dtype is not None and np.dtype(dtype) != self.dtype:
+            return self._measure.astype(dtype)
+        if copy == True:
+            return self._measure.copy()
+
+        # Otherwise return a read-only view, so that the normalized buffer
+        # cannot be changed from outside
+        out = self._measure.view()
+        out.flags.writeable = False
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def _get_other_measure(self, other):
+        """AngleArray._get_other_measure(other) -> float or ndarray
+        Gets a measure argument as a float or array of floats.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- other angles or
+            floats to be treated as measures
+
+        This is a private method used in the binary operations. If given an
+        Angle or AngleArray, this method returns its measure scaled into this
+        AngleArray's unit, matching Angle._get_other_measure(). Otherwise it
+        returns the argument as floats. For float32 AngleArrays the result is
+        always a float64 array, so that the operation itself is computed in
+        float64.
+        """
+
+        # Determine class of argument
+        if isinstance(other, (AngleArray, Angle)) == True:
+            # If angles, scale their measures into this AngleArray's unit
+            if other.mod == self.mod:
+                m = other._measure
+            else:
+                m = other._measure*(self.mod/other.mod)
+            if self.dtype != np.float64:
+                m = np.asarray(m, dtype=np.float64)
+        else:
+            # Otherwise attempt to parse second argument as floats
+            m = np.asarray(other, dtype=np.float64)
+
+        return m
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def measure(self):
+        """AngleArray.measure() -> ndarray
+        Retrieves normalized angle measures.
+        """
+
+        return self._measure
+
+    #-------------------------------------------------------------------------
+
+    @measure.setter
+    def measure(self, value):
+        """AngleArray.measure(value) -> None
+        Updates the angle measures, then automatically normalizes.
+
+        Positional arguments:
+        value (array-like) -- new angle measures
+        """
+
+        self._measure = _normalize(value, self.mod, self.dtype)
+
+    #=========================================================================
+    # Custom Methods
+    #=========================================================================
+
+    def convert(self, new_mod="radians"):
+        """AngleArray.convert([mod]) -> ndarray
+        Returns the angle measures converted into a different unit.
+
+        Positional arguments:
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution
+
+        Each element matches the result of Angle.convert() for the
+        corresponding Angle.
+        """
+
+        # Look up the new unit in the registry
+        new_mod = get_unit(new_mod).mod
+
+        # Convert measures as fractions of a complete revolution
+        out = np.divide(self._measure, self.mod, dtype=np.float64)
+        np.mod(out, 1.0, out=out)
+        out *= new_mod
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def reldiff(self, other):
+        """AngleArray.reldiff(other) -> ndarray
+        Calculates the relative differences between angles' measures.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- measures to be
+            compared to this AngleArray's measures
+
+        The returned values are the elementwise relative differences between
+        the measures, scaled so that 0.0 represents equal measures and 1.0
+        represents diametrically opposed measures.
+        """
+
+        return abs(self - other)/(self.mod/2)
+
+    #=========================================================================
+    # Overloaded Numerical Operators
+    #=========================================================================
+
+    def __abs__(self):
+        """abs(AngleArray) -> ndarray
+        Returns the absolute values of the AngleArray's measures.
+        """
+
+        return np.abs(self._measure)
+
+    #=========================================================================
+    # Overloaded Operators
+    #=========================================================================
+
+    def __pos__(self):
+        """+AngleArray -> AngleArray
+        Returns an exact copy of this AngleArray.
+        """
+
+        return self._new(self._measure)
+
+    #-------------------------------------------------------------------------
+
+    def __neg__(self):
+        """-AngleArray -> AngleArray
+        Returns a new AngleArray with the negatives of this AngleArray's
+        measures.
+        """
+
+        return self._new(-self._measure)
+
+    #-------------------------------------------------------------------------
+
+    def __add__(self, other):
+        """AngleArray + AngleArray -> AngleArray
+        AngleArray + Angle -> AngleArray
+        AngleArray + float -> AngleArray
+        Returns a new AngleArray with the sums of the angles' measures.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- measures to be
+            added to this AngleArray's measures
+        """
+
+        return self._new(self._measure + self._get_other_measure(other))
+
+    #-------------------------------------------------------------------------
+
+    def __sub__(self, other):
+        """AngleArray - AngleArray -> AngleArray
+        AngleArray - Angle -> AngleArray
+        AngleArray - float -> AngleArray
+        Returns a new AngleArray with the differences of the angles' measures.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- measures to be
+            subtracted from this AngleArray's measures
+        """
+
+        return self._new(self._measure - self._get_other_measure(other))
+
+    #-------------------------------------------------------------------------
+
+    def __radd__(self, other):
+        """Angle + AngleArray -> AngleArray
+        float + AngleArray -> AngleArray
+        Returns a new AngleArray with the sums of the angles' measures.
+
+        Positional arguments:
+        other (Angle or float) -- measure to which this AngleArray's measures
+            are added
+
+        This is the reflected form of AngleArray.__add__(). As for any binary
+        operation, the result uses the first argument's unit (this
+        AngleArray's unit for a float).
+        """
+
+        a = self._reflect(other)
+
+        return a._new(a._get_other_measure(other) + a._measure)
+
+    #-------------------------------------------------------------------------
+
+    def __rsub__(self, other):
+        """Angle - AngleArray -> AngleArray
+        float - AngleArray -> AngleArray
+        Returns a new AngleArray with the differences of the angles'
+        measures.
+
+        Positional arguments:
+        other (Angle or float) -- measure from which this AngleArray's
+            measures are subtracted
+
+        This is the reflected form of AngleArray.__sub__(), with the result
+        in the first argument's unit.
+        """
+
+        a = self._reflect(other)
+
+        return a._new(a._get_other_measure(other) - a._measure)
+
+    #-------------------------------------------------------------------------
+
+    def _reflect(self, other):
+        """AngleArray._reflect(other) -> AngleArray
+        Gets this AngleArray in the unit of a reflected operation's result.
+
+        Positional arguments:
+        other (Angle or float) -- first argument of the operation
+
+        This is a private method used by the reflected operators. An Angle's
+        unit is used if given, and this AngleArray's own unit otherwise.
+        """
+
+        if isinstance(other, Angle) == True:
+            return _as_angle_array(self, other.mod)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __mul__(self, other):
+        """AngleArray * float -> AngleArray
+        Returns a new AngleArray with its measures multiplied by scalars.
+
+        Positional arguments:
+        other (float or array-like) -- factors by which to multiply this
+            AngleArray's measures
+        """
+
+        return self._new(self._measure*np.asarray(other, dtype=np.float64))
+
+    #-------------------------------------------------------------------------
+
+    def __truediv__(self, other):
+        """AngleArray / float -> AngleArray
+        Returns a new AngleArray with its measures divided by scalars.
+
+        Positional arguments:
+        other (float or array-like) -- factors by which to divide this
+            AngleArray's measures
+        """
+
+        return self._new(self._measure/np.asarray(other, dtype=np.float64))
+
+    #-------------------------------------------------------------------------
+
+    def __floordiv__(self, other):
+        """AngleArray // float -> AngleArray
+        Returns a new AngleArray with its measures (floor) divided by scalars.
+
+        Positional arguments:
+        other (float or array-like) -- factors by which to (floor) divide this
+            AngleArray's measures
+        """
+
+        return self._new(self._measure//np.asarray(other, dtype=np.float64))
+
+    #-------------------------------------------------------------------------
+
+    def __pow__(self, other):
+        """AngleArray ** float -> AngleArray
+        Returns a new AngleArray with its measures raised to scalar powers.
+
+        Positional arguments:
+        other (float or array-like) -- powers to which to raise this
+            AngleArray's measures
+        """
+
+        return self._new(self._measure**np.asarray(other, dtype=np.float64))
+
+    #=========================================================================
+    # Overloaded In-Place Operators
+    #=========================================================================
+
+    # The in-place operators update the existing measure buffer and normalize
+    # it once, without allocating a new AngleArray.
+
+    def _update(self, ufunc, theta):
+        """AngleArray._update(ufunc, theta) -> None
+        Applies a binary ufunc to the measure buffer in place.
+
+        Positional arguments:
+        ufunc (ufunc) -- NumPy binary ufunc
+        theta (float or ndarray) -- second operand
+
+        This is a private method used by the in-place operators. A float32
+        buffer is updated from a float64 intermediate result, so that it is
+        only rounded once.
+        """
+
+        if self.dtype == np.float64:
+            ufunc(self._measure, theta, out=self._measure)
+            _normalize_inplace(self._measure, self.mod)
+        else:
+            self._measure[...] = _normalize(ufunc(self._measure, theta,
+                                                  dtype=np.float64),
+                                            self.mod, self.dtype)
+
+    #-------------------------------------------------------------------------
+
+    def __iadd__(self, other):
+        """AngleArray += AngleArray
+        AngleArray += Angle
+        AngleArray += float
+        Adds other angles' measures to this AngleArray's measures.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- measures to be
+            added to this AngleArray's measures
+        """
+
+        theta = self._get_other_measure(other)
+        self._update(np.add, theta)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __isub__(self, other):
+        """AngleArray -= AngleArray
+        AngleArray -= Angle
+        AngleArray -= float
+        Subtracts other angles' measures from this AngleArray's measures.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- measures to be
+            subtracted from this AngleArray's measures
+        """
+
+        theta = self._get_other_measure(other)
+        self._update(np.subtract, theta)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __imul__(self, other):
+        """AngleArray *= float
+        Multiplies this AngleArray's measures by scalars.
+
+        Positional arguments:
+        other (float or array-like) -- factors by which to multiply this
+            AngleArray's measures
+        """
+
+        theta = np.asarray(other, dtype=np.float64)
+        self._update(np.multiply, theta)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __itruediv__(self, other):
+        """AngleArray /= float
+        Divides this AngleArray's measures by scalars.
+
+        Positional arguments:
+        other (float or array-like) -- factors by which to divide this
+            AngleArray's measures
+        """
+
+        theta = np.asarray(other, dtype=np.float64)
+        self._update(np.true_divide, theta)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __ifloordiv__(self, other):
+        """AngleArray //= float
+        (Floor) divides this AngleArray's measures by scalars.
+
+        Positional arguments:
+        other (float or array-like) -- factors by which to (floor) divide
+            this AngleArray's measures
+        """
+
+        theta = np.asarray(other, dtype=np.float64)
+        self._update(np.floor_divide, theta)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __ipow__(self, other):
+        """AngleArray **= float
+        Raises this AngleArray's measures to scalar powers.
+
+        Positional arguments:
+        other (float or array-like) -- powers to which to raise this
+            AngleArray's measures
+        """
+
+        theta = np.asarray(other, dtype=np.float64)
+        self._update(np.power, theta)
+
+        return self
+
+    #=========================================================================
+    # Overloaded Comparisons
+    #=========================================================================
+
+    def _delta(self, other):
+        """AngleArray._delta(other) -> ndarray
+        Returns the normalized differences between this and other measures.
+
+        Positional arguments:
+        other (AngleArray, Angle, float, or array-like) -- measures to be
+            compared to this AngleArray's measures
+        """
+
+        return _normalize(self._measure - self._get_other_measure(other),
+                          self.mod)
+
+    #-------------------------------------------------------------------------
+
+    def _rdelta(self, other):
+        """AngleArray._rdelta(other) -> ndarray
+        Returns the normalized differences between an Angle's measure and
+        this AngleArray's measures.
+
+        Positional arguments:
+        other (Angle) -- Angle to which this AngleArray is compared
+
+        This is a private method used by the Angle comparison operators when
+        an Angle is compared to an AngleArray. The differences are computed
+        in the Angle's unit, so that the Angle keeps the tie-break of the
+        comparison's first argument for diametrically opposed measures.
+        """
+
+        a = self._reflect(other)
+
+        return _normalize(other._measure - a._measure, a.mod)
+
+    #-------------------------------------------------------------------------
+
+    def __eq__(self, other):
+        """AngleArray == AngleArray -> ndarray
+        AngleArray == Angle -> ndarray
+        AngleArray == float -> ndarray
+        Determines elementwise whether angles have the same measure.
+
+        As with Angle, AngleArray.reldiff() should generally be preferred to
+        direct equality tests.
+        """
+
+        return self._delta(other) == 0
+
+    #-------------------------------------------------------------------------
+
+    def __ne__(self, other):
+        """AngleArray != AngleArray -> ndarray
+        AngleArray != Angle -> ndarray
+        AngleArray != float -> ndarray
+        Determines elementwise whether angles have different measures.
+        """
+
+        return self._delta(other) != 0
+
+    #-------------------------------------------------------------------------
+
+    def __gt__(self, other):
+        """AngleArray > AngleArray -> ndarray
+        AngleArray > Angle -> ndarray
+        AngleArray > float -> ndarray
+        Determines elementwise the direction of the smallest angle between
+        two angles.
+
+        An element is True if and only if the smallest angle between the two
+        angles places this AngleArray's angle counterclockwise relative to
+        the other.
+        """
+
+        return self._delta(other) > 0
+
+    #-------------------------------------------------------------------------
+
+    def __lt__(self, other):
+        """AngleArray < AngleArray -> ndarray
+        AngleArray < Angle -> ndarray
+        AngleArray < float -> ndarray
+        Determines elementwise the direction of the smallest angle between
+        two angles.
+
+        An element is True if and only if the smallest angle between the two
+        angles places this AngleArray's angle clockwise relative to the
+        other.
+        """
+
+        return self._delta(other) < 0
+
+    #-------------------------------------------------------------------------
+
+    def __ge__(self, other):
+        """AngleArray >= AngleArray -> ndarray
+        AngleArray >= Angle -> ndarray
+        AngleArray >= float -> ndarray
+        Elementwise combination of the > and == operators.
+        """
+
+        return self._delta(other) >= 0
+
+    #-------------------------------------------------------------------------
+
+    def __le__(self, other):
+        """AngleArray <= AngleArray -> ndarray
+        AngleArray <= Angle -> ndarray
+        AngleArray <= float -> ndarray
+        Elementwise combination of the < and == operators.
+        """
+
+        return self._delta(other) <= 0
+
+    # Elementwise equality makes AngleArrays unhashable
+    __hash__ = None
@@ -0,0 +1,216 @@
+"""Defines the pluggable compute backends used by batched operations."""
+
+from ._version import __author__, __version__
+
+import os
+
+#=============================================================================
+# Backend Classes
+#=============================================================================
+
+class PythonBackend:
+    """A pure Python backend for batched operations.
+
+    This backend needs nothing beyond the standard library, and has no
+    startup cost, so it is also used for small batches when the backend is
+    chosen automatically.
+
+    Every backend defines the following methods, each of which accepts a
+    sequence of float measures and returns a list of floats:
+        normalize(values, mod) -- normalizes each measure to lie within
+            (-1/2,1/2] full revolutions, as the Angle.measure setter does
+        convert(values, from_mod, to_mod) -- converts each measure into a
+            different unit, as Angle.convert() does
+    where mod, from_mod, and to_mod are full revolution measures.
+    """
+
+    name = "python"
+
+    #-------------------------------------------------------------------------
+
+    def normalize(self, values, mod):
+        """PythonBackend.normalize(values, mod) -> list
+        Normalizes a sequence of measures.
+        """
+
+        from .angles import _normalize
+
+        return [_normalize(float(v), mod) for v in values]
+
+    #-------------------------------------------------------------------------
+
+    def convert(self, values, from_mod, to_mod):
+        """PythonBackend.convert(values, from_mod, to_mod) -> list
+        Converts a sequence of measures into a different unit.
+        """
+
+        from .angles import _normalize
+
+        return [((_normalize(float(v), from_mod)/from_mod) % 1.0)*to_mod
+                for v in values]
+
+#-----------------------------------------------------------------------------
+
+class NumPyBackend:
+    """A NumPy backend for batched operations.
+
+    This backend converts each batch into a NumPy array, applies each
+    operation as a few whole-array passes, and converts the result back
+    into a list. The results are identical to those of the pure Python
+    backend. NumPy is imported when this backend is first instantiated.
+    """
+
+    name = "numpy"
+
+    #-------------------------------------------------------------------------
+
+    def __init__(self):
+        """NumPyBackend() -> NumPyBackend
+        NumPyBackend constructor.
+
+        Raises an ImportError if NumPy is not installed.
+        """
+
+        import numpy
+        from . import arrays
+        self._np = numpy
+        self._arrays = arrays
+
+    #-------------------------------------------------------------------------
+
+    def normalize(self, values, mod):
+        """NumPyBackend.normalize(values, mod) -> list
+        Normalizes a sequence of measures.
+        """
+
+        return self._arrays._normalize(values, mod).tolist()
+
+    #-------------------------------------------------------------------------
+
+    def convert(self, values, from_mod, to_mod):
+        """NumPyBackend.convert(values, from_mod, to_mod) -> list
+        Converts a sequence of measures into a different unit.
+        """
+
+        m = self._arrays._normalize(values, from_mod)
+        m /= from_mod
+        self._np.mod(m, 1.0, out=m)
+        m *= to_mod
+
+        return m.tolist()
+
+#=============================================================================
+# Backend Selection
+#=============================================================================
+
+# Registered backend classes, by name
+_backends = {"python": PythonBackend, "numpy": NumPyBackend}
+
+# Instantiated backends, by name (each is created on first use)
+_instances = {}
+
+# Backends whose dependencies were found to be missing
+_unavailable = set()
+
+# Backend choice ("auto" or a registered name), validated here so that a
+# misspelled environment variable fails when this module is imported, rather
+# than with a KeyError from the first batched operation
+_choice = os.environ.get("ANGLE_HEADINGS_BACKEND", "auto")
+if _choice != "auto" and _choice not in _backends:
+    raise ValueError("unrecognized ANGLE_HEADINGS_BACKEND name string "
+                     + repr(_choice) + " (expected one of "
+                     + ", ".join(repr(n) for n in ["auto"] + sorted(_backends))
+                     + ")")
+
+# Smallest batch which is worth loading an accelerated backend for
+AUTO_THRESHOLD = 256
+
+#-----------------------------------------------------------------------------
+
+def _instance(name):
+    """_instance(name) -> object
+    Returns the instance of a registered backend, creating it if needed.
+    """
+
+    if name not in _instances:
+        _instances[name] = _backends[name]()
+
+    return _instances[name]
+
+#-----------------------------------------------------------------------------
+
+def register_backend(name, cls):
+    """register_backend(name, cls) -> None
+    Registers a backend class.
+
+    Positional arguments:
+    name (str) -- name of the backend
+    cls (class) -- backend class, whose instances define the methods listed
+        for PythonBackend (it is instantiated with no arguments on first use,
+        and may raise an ImportError if its dependencies are missing)
+
+    Registering a name again replaces the earlier backend.
+    """
+
+    _backends[name] = cls
+    _instances.pop(name, None)
+    _unavailable.discard(name)
+
+#-----------------------------------------------------------------------------
+
+def set_backend(name="auto"):
+    """set_backend([name]) -> None
+    Chooses the backend used by batched operations.
+
+    Keyword arguments:
+    name (str) ["auto"] -- name of a registered backend ("python" or "numpy"
+        unless others are registered), or "auto"
+
+    A named backend is instantiated (and its dependencies imported)
+    immediately, so that a missing dependency raises an ImportError here
+    rather than during a later batched operation. The "auto" setting uses
+    NumPy for batches of at least AUTO_THRESHOLD measures if it is
+    installed, and the pure Python backend otherwise, so that NumPy is only
+    ever imported by a batch large enough to benefit from it. The initial
+    choice can also be set with the ANGLE_HEADINGS_BACKEND environment
+    variable, which must name a built-in backend or "auto" (any other value
+    raises a ValueError when this module is first imported).
+
+    Only convert_many() and normalize_many() use the backend. The NumPy
+    classes and modules (AngleArray, filters, bearings, and so on) always
+    operate on NumPy arrays directly.
+    """
+
+    global _choice
+
+    if name != "auto":
+        if name not in _backends:
+            raise ValueError("unrecognized backend name string")
+        _instance(name)
+    _choice = name
+
+#-----------------------------------------------------------------------------
+
+def get_backend(size=None):
+    """get_backend([size]) -> object
+    Returns the backend to use for a batch.
+
+    Keyword arguments:
+    size (int) [None] -- number of measures in the batch, if known
+
+    Returns the chosen backend, or under the "auto" setting, the backend
+    best suited to a batch of the given size.
+    """
+
+    if _choice != "auto":
+        return _instance(_choice)
+
+    # Automatically use NumPy for large batches, if it is installed
+    if (size is not None and size >= AUTO_THRESHOLD and
+        "numpy" not in _unavailable):
+        try:
+            return _instance("numpy")
+        except ImportError:
+            _unavailable.add("numpy")
+
+    return _instance("python")
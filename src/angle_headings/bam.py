@@ -0,0 +1,431 @@
+"""Defines a fixed-point binary angular measurement (BAM) angle class."""
+
+from ._version import __author__, __version__
+
+from .angles import Angle
+from .units import get_unit
+
+class BAMAngle:
+    """A class for representing angles in binary angular measurement.
+
+    A BAMAngle stores its angle as an unsigned integer count of steps, where
+    one full revolution is 2^bits steps (usually 2^16 or 2^32). Wraparound
+    is a single bitwise mask rather than a floating point modulo, and since
+    measures are integers, equality is exact and hashing is deterministic.
+    Conversion to and from Angles in any unit is accurate to within half of
+    a step. For up to 52 bits, a round trip through an Angle recovers the
+    original steps exactly. With more bits, a float64 Angle measure cannot
+    resolve every step, so a round trip may be off by a few steps.
+
+    A BAMAngle object has two public attributes:
+        bits (int) -- number of bits per full revolution
+        value (int) -- unsigned step count, between 0 and 2^bits - 1
+    and the read-only property:
+        measure (int) -- signed step count, normalized to be between -1/2
+            (exclusive) and 1/2 (inclusive) of a full revolution, following
+            the same convention as Angle measures
+
+    Binary operators accept another BAMAngle (rescaled to this BAMAngle's
+    bits), an Angle (quantized to the nearest step), or a number (treated as
+    a step count, rounded to the nearest integer), and return a new
+    BAMAngle with this BAMAngle's bits. Comparisons follow the Angle
+    conventions, and work with the BAMAngle on either side. An Angle
+    compared with a BAMAngle is quantized to its steps, and whichever is the
+    first argument wins the tie-break for diametrically opposed headings,
+    as for two Angles. Equality is only defined between BAMAngles and
+    mutable Angles (with the Angle quantized to the BAMAngle's steps either
+    way round), and BAMAngles representing the same fraction of a
+    revolution compare and hash equal regardless of their bits. BAMAngles
+    are never equal to FrozenAngles, whose hashes do not agree with
+    theirs.
+
+    BAMAngles do not define float(), so they cannot be used directly as
+    measures in Angle arithmetic. Use BAMAngle.to_angle() instead.
+    """
+
+    __slots__ = ("value", "bits")
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, value=0, bits=16):
+        """BAMAngle([value[, bits]]) -> BAMAngle
+        BAMAngle constructor.
+
+        Keyword arguments:
+        value (int) [0] -- initial step count (wrapped to one revolution)
+        bits (int) [16] -- number of bits per full revolution, between 1
+            and 64
+        """
+
+        bits = int(bits)
+        if bits < 1 or bits > 64:
+            raise ValueError("number of bits must be between 1 and 64")
+        self.bits = bits
+        self.value = int(value) & ((1 << bits) - 1)
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def from_angle(cls, angle, bits=16):
+        """BAMAngle.from_angle(angle[, bits]) -> BAMAngle
+        Quantizes an Angle to the nearest step.
+
+        Positional arguments:
+        angle (Angle) -- angle to quantize
+
+        Keyword arguments:
+        bits (int) [16] -- number of bits per full revolution
+        """
+
+        return cls(round(angle.measure*(1 << int(bits))/angle.mod), bits)
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def from_measure(cls, measure, mod="radians", bits=16):
+        """BAMAngle.from_measure(measure[, mod[, bits]]) -> BAMAngle
+        Quantizes a float measure to the nearest step.
+
+        Positional arguments:
+        measure (float) -- angle measure
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- unit of the measure, accepting the
+            same values as the Angle constructor
+        bits (int) [16] -- number of bits per full revolution
+        """
+
+        mod = get_unit(mod).mod
+
+        return cls(round(float(measure)*(1 << int(bits))/mod), bits)
+
+    #-------------------------------------------------------------------------
+
+    def _new(self, value):
+        """BAMAngle._new(value) -> BAMAngle
+        Returns a new BAMAngle with this BAMAngle's bits.
+
+        Positional arguments:
+        value (int) -- step count (wrapped to one revolution)
+        """
+
+        out = BAMAngle.__new__(BAMAngle)
+        out.bits = self.bits
+        out.value = value & ((1 << self.bits) - 1)
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def __str__(self):
+        """str(BAMAngle) -> str
+        BAMAngle string conversion.
+
+        Returns the signed step count, along with the number of bits.
+        """
+
+        return str(self.measure) + " bam" + str(self.bits)
+
+    #-------------------------------------------------------------------------
+
+    def __repr__(self):
+        """repr(BAMAngle) -> str
+        BAMAngle representation.
+        """
+
+        return "BAMAngle(" + str(self.value) + ", " + str(self.bits) + ")"
+
+    #-------------------------------------------------------------------------
+
+    def __hash__(self):
+        """hash(BAMAngle) -> int
+        Hashes the BAMAngle's fraction of a revolution.
+        """
+
+        return hash(self.value << (64 - self.bits))
+
+    #-------------------------------------------------------------------------
+
+    def _get_other_steps(self, other):
+        """BAMAngle._get_other_steps(other) -> int
+        Gets a measure argument as a step count.
+
+        Positional arguments:
+        other (BAMAngle, Angle, or number) -- other angle or step count
+
+        This is a private method used by the binary operations. BAMAngles
+        are rescaled to this BAMAngle's bits (rounding to the nearest step if
+        this BAMAngle has fewer bits), Angles are quantized to the nearest
+        step, and numbers are rounded to the nearest integer.
+        """
+
+        if isinstance(other, BAMAngle) == True:
+            shift = self.bits - other.bits
+            if shift >= 0:
+                return other.value << shift
+            return (other.value + (1 << (-shift - 1))) >> -shift
+        if isinstance(other, Angle) == True:
+            return round(other.measure*(1 << self.bits)/other.mod)
+
+        return round(other)
+
+    #-------------------------------------------------------------------------
+
+    def _delta(self, other):
+        """BAMAngle._delta(other) -> int
+        Gets the signed step difference between this and another measure.
+        """
+
+        return self._new(self.value - self._get_other_steps(other)).measure
+
+    #-------------------------------------------------------------------------
+
+    def _rdelta(self, other):
+        """BAMAngle._rdelta(other) -> int
+        Gets the signed step difference between an Angle and this BAMAngle.
+
+        Positional arguments:
+        other (Angle) -- Angle to which this BAMAngle is compared
+
+        This is a private method used by the Angle comparison operators when
+        an Angle is compared to a BAMAngle. The Angle is quantized to this
+        BAMAngle's steps, and the difference is taken from the Angle's side,
+        so that the Angle keeps the tie-break of the comparison's first
+        argument for diametrically opposed measures.
+        """
+
+        return self._new(self._get_other_steps(other) - self.value).measure
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def measure(self):
+        """BAMAngle.measure() -> int
+        Retrieves the signed, normalized step count.
+        """
+
+        half = 1 << (self.bits - 1)
+        if self.value > half:
+            return self.value - (1 << self.bits)
+        return self.value
+
+    #=========================================================================
+    # Custom Methods
+    #=========================================================================
+
+    def to_angle(self, mod="radians"):
+        """BAMAngle.to_angle([mod]) -> Angle
+        Returns an Angle with this BAMAngle's measure.
+
+        Positional arguments:
+        mod (str or float) ["radians"] -- unit of the returned Angle
+        """
+
+        out = Angle(0.0, mod)
+        out.measure = self.measure*out.mod/(1 << self.bits)
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def convert(self, new_mod="radians"):
+        """BAMAngle.convert([mod]) -> float
+        Returns the angle measure converted into a different unit.
+
+        Positional arguments:
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution
+
+        Unlike Angle.convert(), the result is normalized to lie within
+        (-1/2,1/2] full revolutions (relative to the given unit).
+        """
+
+        return self.measure*get_unit(new_mod).mod/(1 << self.bits)
+
+    #-------------------------------------------------------------------------
+
+    def reldiff(self, other):
+        """BAMAngle.reldiff(other) -> float
+        Calculates the relative difference between two angles' measures.
+
+        Positional arguments:
+        other (BAMAngle, Angle, or number) -- measure to be compared to this
+            BAMAngle's measure
+
+        The returned value is scaled so that 0.0 represents equal measures
+        and 1.0 represents diametrically opposed measures.
+        """
+
+        return abs(self._delta(other))/(1 << (self.bits - 1))
+
+    #=========================================================================
+    # Overloaded Numerical Operators
+    #=========================================================================
+
+    def __abs__(self):
+        """abs(BAMAngle) -> int
+        Returns the absolute value of the BAMAngle's signed step count.
+        """
+
+        return abs(self.measure)
+
+    #-------------------------------------------------------------------------
+
+    def __int__(self):
+        """int(BAMAngle) -> int
+        Returns the BAMAngle's signed step count.
+        """
+
+        return self.measure
+
+    #=========================================================================
+    # Overloaded Operators
+    #=========================================================================
+
+    def __pos__(self):
+        """+BAMAngle -> BAMAngle
+        Returns an exact copy of this BAMAngle.
+        """
+
+        return self._new(self.value)
+
+    #-------------------------------------------------------------------------
+
+    def __neg__(self):
+        """-BAMAngle -> BAMAngle
+        Returns a new BAMAngle with the negative of this BAMAngle's measure.
+        """
+
+        return self._new(-self.value)
+
+    #-------------------------------------------------------------------------
+
+    def __add__(self, other):
+        """BAMAngle + BAMAngle -> BAMAngle
+        BAMAngle + Angle -> BAMAngle
+        BAMAngle + int -> BAMAngle
+        Returns a new BAMAngle with the sum of two angles' measures.
+        """
+
+        return self._new(self.value + self._get_other_steps(other))
+
+    #-------------------------------------------------------------------------
+
+    def __sub__(self, other):
+        """BAMAngle - BAMAngle -> BAMAngle
+        BAMAngle - Angle -> BAMAngle
+        BAMAngle - int -> BAMAngle
+        Returns a new BAMAngle with the difference between two angles'
+        measures.
+        """
+
+        return self._new(self.value - self._get_other_steps(other))
+
+    #-------------------------------------------------------------------------
+
+    def __mul__(self, other):
+        """BAMAngle * float -> BAMAngle
+        Returns a new BAMAngle with its signed measure multiplied by a given
+        number, rounded to the nearest step.
+        """
+
+        if isinstance(other, int) == True:
+            return self._new(self.value*other)
+        return self._new(round(self.measure*other))
+
+    #-------------------------------------------------------------------------
+
+    def __floordiv__(self, other):
+        """BAMAngle // int -> BAMAngle
+        Returns a new BAMAngle with its signed measure (floor) divided by a
+        given integer.
+        """
+
+        return self._new(self.measure//other)
+
+    #=========================================================================
+    # Overloaded Comparisons
+    #=========================================================================
+
+    def __eq__(self, other):
+        """BAMAngle == BAMAngle -> bool
+        BAMAngle == Angle -> bool
+        Determines whether two angles have the same measure.
+
+        BAMAngles are compared exactly. Mutable Angles are first quantized to
+        this BAMAngle's steps. Any other operand (including a FrozenAngle)
+        gives NotImplemented.
+        """
+
+        if isinstance(other, BAMAngle) == True:
+            if self.bits >= other.bits:
+                return self.value == other.value << (self.bits - other.bits)
+            return self.value << (other.bits - self.bits) == other.value
+        # Hashable Angles (such as FrozenAngles) are never equal, since
+        # their hashes do not agree with a BAMAngle's
+        if isinstance(other, Angle) == True and other.__hash__ is None:
+            return self._delta(other) == 0
+
+        return NotImplemented
+
+    #-------------------------------------------------------------------------
+
+    def __ne__(self, other):
+        """BAMAngle != BAMAngle -> bool
+        BAMAngle != Angle -> bool
+        Determines whether two angles have different measures.
+        """
+
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    #-------------------------------------------------------------------------
+
+    def __gt__(self, other):
+        """BAMAngle > BAMAngle -> bool
+        BAMAngle > Angle -> bool
+        BAMAngle > int -> bool
+        Determines whether the smallest angle between two angles places this
+        angle counterclockwise relative to the other.
+        """
+
+        return self._delta(other) > 0
+
+    #-------------------------------------------------------------------------
+
+    def __lt__(self, other):
+        """BAMAngle < BAMAngle -> bool
+        BAMAngle < Angle -> bool
+        BAMAngle < int -> bool
+        Determines whether the smallest angle between two angles places this
+        angle clockwise relative to the other.
+        """
+
+        return self._delta(other) < 0
+
+    #-------------------------------------------------------------------------
+
+    def __ge__(self, other):
+        """BAMAngle >= BAMAngle -> bool
+        BAMAngle >= Angle -> bool
+        BAMAngle >= int -> bool
+        Combination of the > and == operators.
+        """
+
+        return self._delta(other) >= 0
+
+    #-------------------------------------------------------------------------
+
+    def __le__(self, other):
+        """BAMAngle <= BAMAngle -> bool
+        BAMAngle <= Angle -> bool
+        BAMAngle <= int -> bool
+        Combination of the < and == operators.
+        """
+
+        return self._delta(other) <= 0
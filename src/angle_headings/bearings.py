@@ -0,0 +1,185 @@
+"""Defines batched great-circle and planar bearings between points."""
+
+from ._version import __author__, __version__
+
+import math
+
+import numpy as np
+
+from .rotation import from_vectors
+from .units import get_unit
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _legs(start, end):
+    """_legs(start, end) -> tuple
+    Gets the start and end points of one or many legs as coordinate arrays.
+
+    Positional arguments:
+    start (array-like) -- points, as an array whose last axis has length 2
+    end (array-like) -- end points, broadcastable against start, or None to
+        use consecutive points of start as the legs of a track
+
+    Returns the first and second coordinates of the start points, followed
+    by those of the end points, as float64 arrays.
+    """
+
+    p = np.asarray(start, dtype=np.float64)
+    if p.shape[-1:] != (2,):
+        raise ValueError("points must have a last axis of length 2")
+
+    # Split a track into its consecutive legs
+    if end is None:
+        if p.ndim < 2:
+            raise ValueError("a track must be an array of points")
+        q = p[1:]
+        p = p[:-1]
+    else:
+        q = np.asarray(end, dtype=np.float64)
+        if q.shape[-1:] != (2,):
+            raise ValueError("points must have a last axis of length 2")
+
+    return p[..., 0], p[..., 1], q[..., 0], q[..., 1]
+
+#-----------------------------------------------------------------------------
+
+def _heading(east, north, mod, compass):
+    """_heading(east, north, mod, compass) -> Angle or AngleArray
+    Returns the headings of displacement vectors.
+
+    Positional arguments:
+    east (float or ndarray) -- eastward (x) components
+    north (float or ndarray) -- northward (y) components
+    mod (str or float) -- unit of the result
+    compass (bool) -- True for bearings clockwise from north, or False for
+        headings counterclockwise from east
+
+    Returns an Angle for a single vector, or an AngleArray otherwise.
+    """
+
+    if compass == True:
+        out = from_vectors(north, east, mod)
+    else:
+        out = from_vectors(east, north, mod)
+    if out.measure.ndim == 0:
+        return out[()]
+
+    return out
+
+#-----------------------------------------------------------------------------
+
+def _great_circle(start, end, mod, compass, coords, final):
+    """_great_circle(start, end, mod, compass, coords, final)
+        -> Angle or AngleArray
+    Computes initial or final great-circle bearings in one vectorized pass.
+    """
+
+    # Convert the coordinates into radians
+    scale = 2*math.pi/get_unit(coords).mod
+    lat1, lon1, lat2, lon2 = (c*scale for c in _legs(start, end))
+    dlon = lon2 - lon1
+    cos1, sin1 = np.cos(lat1), np.sin(lat1)
+    cos2, sin2 = np.cos(lat2), np.sin(lat2)
+    cosd = np.cos(dlon)
+
+    # Find the direction of travel at the start or end of each leg
+    if final == True:
+        east = np.sin(dlon)*cos1
+        north = sin2*cos1*cosd - cos2*sin1
+    else:
+        east = np.sin(dlon)*cos2
+        north = cos1*sin2 - sin1*cos2*cosd
+
+    return _heading(east, north, mod, compass)
+
+#=============================================================================
+# Great-Circle Bearings
+#=============================================================================
+
+def initial_bearing(start, end=None, mod="degrees", compass=True,
+                    coords="degrees"):
+    """initial_bearing(start[, end[, mod[, compass[, coords]]]])
+        -> Angle or AngleArray
+    Returns the great-circle bearing at the start of one or many legs.
+
+    Positional arguments:
+    start (array-like) -- start points, as (latitude, longitude) pairs in an
+        array whose last axis has length 2
+
+    Keyword arguments:
+    end (array-like) [None] -- end points, broadcastable against start, or
+        None to use consecutive points of start as the legs of a track
+    mod (str or float) ["degrees"] -- unit of the result
+    compass (bool) [True] -- True for bearings measured clockwise from north
+        (so that east is +1/4 revolution), or False for headings measured
+        counterclockwise from east, as for the rest of the package
+    coords (str or float) ["degrees"] -- unit of the latitudes and
+        longitudes
+
+    Returns an Angle for a single pair of points, or an AngleArray with one
+    bearing per leg otherwise (n - 1 bearings for a track of n points). All
+    bearings are computed on a sphere in a single vectorized pass, and are
+    normalized like any other Angle measures (so that west is -1/4
+    revolution as a compass bearing). The bearing between coincident points
+    is 0.0.
+    """
+
+    return _great_circle(start, end, mod, compass, coords, False)
+
+#-----------------------------------------------------------------------------
+
+def final_bearing(start, end=None, mod="degrees", compass=True,
+                  coords="degrees"):
+    """final_bearing(start[, end[, mod[, compass[, coords]]]])
+        -> Angle or AngleArray
+    Returns the great-circle bearing at the end of one or many legs.
+
+    Positional arguments:
+    start (array-like) -- start points, as (latitude, longitude) pairs in an
+        array whose last axis has length 2
+
+    Keyword arguments:
+    end (array-like) [None] -- end points, broadcastable against start, or
+        None to use consecutive points of start as the legs of a track
+    mod (str or float) ["degrees"] -- unit of the result
+    compass (bool) [True] -- True for bearings measured clockwise from north,
+        or False for headings measured counterclockwise from east
+    coords (str or float) ["degrees"] -- unit of the latitudes and
+        longitudes
+
+    The final bearing is the direction of travel on arrival, which is the
+    initial bearing of the reverse leg turned by a half revolution. Results
+    are returned as for initial_bearing().
+    """
+
+    return _great_circle(start, end, mod, compass, coords, True)
+
+#=============================================================================
+# Planar Bearings
+#=============================================================================
+
+def planar_bearing(start, end=None, mod="radians", compass=False):
+    """planar_bearing(start[, end[, mod[, compass]]]) -> Angle or AngleArray
+    Returns the direction of one or many legs in the plane.
+
+    Positional arguments:
+    start (array-like) -- start points, as (x, y) pairs in an array whose
+        last axis has length 2
+
+    Keyword arguments:
+    end (array-like) [None] -- end points, broadcastable against start, or
+        None to use consecutive points of start as the legs of a track
+    mod (str or float) ["radians"] -- unit of the result
+    compass (bool) [False] -- False for headings measured counterclockwise
+        from the x-axis, as for Angle.from_xy(), or True for bearings
+        measured clockwise from the y-axis
+
+    Returns an Angle for a single pair of points, or an AngleArray with one
+    heading per leg otherwise, computed in a single vectorized pass.
+    """
+
+    x1, y1, x2, y2 = _legs(start, end)
+
+    return _heading(x2 - x1, y2 - y1, mod, compass)
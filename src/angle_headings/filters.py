@@ -0,0 +1,438 @@
+"""Defines streaming and batch smoothing filters for noisy Angle headings."""
+
+from ._version import __author__, __version__
+
+import bisect
+import collections
+import math
+
+from .angles import Angle, _normalize
+
+#=============================================================================
+# Moving Circular Mean
+#=============================================================================
+
+class MovingMean:
+    """A sliding-window circular mean filter.
+
+    Averaging Angle measures directly breaks down when the window straddles
+    the -1/2 / +1/2 revolution seam. This filter instead keeps running sums
+    of the cosines and sines of the headings in the window, so that each
+    update takes constant time regardless of the window size. To stop
+    rounding errors from accumulating in the running sums, they are
+    recomputed from the window once every window updates, which adds only
+    constant amortized time.
+
+    A MovingMean object has the following public attributes:
+        window (int) -- maximum number of headings averaged
+        mod (float) -- the measure of one full revolution
+        unit (str) -- string version of the filter's unit
+
+    Headings are given as Angles (which are converted to the filter's unit)
+    or floats (which are assumed to already match the filter's unit). Until
+    the window fills, the mean of all headings so far is returned.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, window, mod="radians"):
+        """MovingMean(window[, mod]) -> MovingMean
+        MovingMean constructor.
+
+        Positional arguments:
+        window (int) -- number of headings averaged
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution, accepting the same values as the Angle constructor
+        """
+
+        window = int(window)
+        if window < 1:
+            raise ValueError("window size must be positive")
+        self.window = window
+
+        # Parse the unit once through a template Angle
+        self._template = Angle(0.0, mod)
+        self.mod = self._template.mod
+        self.unit = self._template.unit
+
+        # Cosines and sines in the window, and their running sums
+        self._vectors = collections.deque()
+        self._cos = 0.0
+        self._sin = 0.0
+        self._updates = 0 # updates since the sums were last recomputed
+
+    #-------------------------------------------------------------------------
+
+    def __len__(self):
+        """len(MovingMean) -> int
+        Returns the number of headings currently in the window.
+        """
+
+        return len(self._vectors)
+
+    #-------------------------------------------------------------------------
+
+    def _push(self, m):
+        """MovingMean._push(m) -> float
+        Ingests a measure in the filter's unit, and returns the new mean.
+
+        This is a private method shared by update() and moving_mean(). If the
+        mean is undefined (the headings in the window cancel out exactly), the
+        newest measure is returned.
+        """
+
+        theta = m*(2*math.pi/self.mod)
+        c = math.cos(theta)
+        s = math.sin(theta)
+        self._vectors.append((c, s))
+        self._cos += c
+        self._sin += s
+
+        # Drop the oldest heading once the window is full
+        if len(self._vectors) > self.window:
+            c, s = self._vectors.popleft()
+            self._cos -= c
+            self._sin -= s
+
+        # Periodically recompute the running sums from scratch
+        self._updates += 1
+        if self._updates >= self.window:
+            self._cos = math.fsum(v[0] for v in self._vectors)
+            self._sin = math.fsum(v[1] for v in self._vectors)
+            self._updates = 0
+
+        if self._cos == 0.0 and self._sin == 0.0:
+            return m
+        return math.atan2(self._sin, self._cos)*(self.mod/(2*math.pi))
+
+    #-------------------------------------------------------------------------
+
+    def update(self, angle):
+        """MovingMean.update(angle) -> Angle
+        Ingests a heading, and returns the circular mean of the window.
+
+        Positional arguments:
+        angle (Angle or float) -- newest heading
+        """
+
+        m = self._template._get_other_measure(angle)
+
+        return self._template._new(self._push(m))
+
+#=============================================================================
+# Exponential Smoother
+#=============================================================================
+
+class ExponentialSmoother:
+    """An exponential smoothing filter which follows the shortest rotation.
+
+    Each update moves the smoothed heading a fixed fraction (alpha) of the
+    way toward the newest heading, along the smallest angle between them,
+    exactly as the difference of two Angles is computed. This avoids the
+    spurious full-revolution swings of a linear smoother at the -1/2 / +1/2
+    revolution seam. Each update takes constant time.
+
+    An ExponentialSmoother object has the following public attributes:
+        alpha (float) -- smoothing factor, between 0 (exclusive) and 1
+            (inclusive), where 1 applies no smoothing
+        mod (float) -- the measure of one full revolution
+        unit (str) -- string version of the filter's unit
+
+    Headings are given as Angles (which are converted to the filter's unit)
+    or floats (which are assumed to already match the filter's unit). The
+    first heading initializes the smoothed heading.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, alpha, mod="radians"):
+        """ExponentialSmoother(alpha[, mod]) -> ExponentialSmoother
+        ExponentialSmoother constructor.
+
+        Positional arguments:
+        alpha (float) -- smoothing factor, between 0 (exclusive) and 1
+            (inclusive)
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution, accepting the same values as the Angle constructor
+        """
+
+        alpha = float(alpha)
+        if alpha <= 0 or alpha > 1:
+            raise ValueError("smoothing factor must be in (0,1]")
+        self.alpha = alpha
+
+        # Parse the unit once through a template Angle
+        self._template = Angle(0.0, mod)
+        self.mod = self._template.mod
+        self.unit = self._template.unit
+
+        # Smoothed measure (None until the first heading)
+        self._state = None
+
+    #-------------------------------------------------------------------------
+
+    def _push(self, m):
+        """ExponentialSmoother._push(m) -> float
+        Ingests a measure in the filter's unit, and returns the new smoothed
+        measure.
+
+        This is a private method shared by update() and
+        exponential_smooth().
+        """
+
+        if self._state is None:
+            self._state = _normalize(m, self.mod)
+        else:
+            delta = _normalize(m - self._state, self.mod)
+            self._state = _normalize(self._state + self.alpha*delta,
+                                     self.mod)
+
+        return self._state
+
+    #-------------------------------------------------------------------------
+
+    def update(self, angle):
+        """ExponentialSmoother.update(angle) -> Angle
+        Ingests a heading, and returns the smoothed heading.
+
+        Positional arguments:
+        angle (Angle or float) -- newest heading
+        """
+
+        m = self._template._get_other_measure(angle)
+
+        return self._template._new(self._push(m))
+
+#=============================================================================
+# Moving Circular Median
+#=============================================================================
+
+class MovingMedian:
+    """A sliding-window circular median filter.
+
+    The median is robust to the occasional wild heading (e.g. from magnetic
+    interference) which would pull a mean off course. Since headings have no
+    natural order on the circle, the headings in the window are ordered
+    relative to the window's circular mean, from the most clockwise to the
+    most counterclockwise, and the middle one is returned (or the midpoint
+    of the middle two, along the smallest angle between them). This is the
+    circular median whenever the window's headings lie within a half
+    revolution of their mean.
+
+    The window is kept in sorted order, so each update takes O(log n)
+    comparisons (plus a list shift) for a window of n headings, along with a
+    constant-time update of the running mean.
+
+    A MovingMedian object has the following public attributes:
+        window (int) -- maximum number of headings in the window
+        mod (float) -- the measure of one full revolution
+        unit (str) -- string version of the filter's unit
+
+    Headings are given as Angles (which are converted to the filter's unit)
+    or floats (which are assumed to already match the filter's unit). Until
+    the window fills, the median of all headings so far is returned.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, window, mod="radians"):
+        """MovingMedian(window[, mod]) -> MovingMedian
+        MovingMedian constructor.
+
+        Positional arguments:
+        window (int) -- number of headings in the window
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution, accepting the same values as the Angle constructor
+        """
+
+        # The running mean shares the window size and unit
+        self._mean = MovingMean(window, mod)
+        self.window = self._mean.window
+        self._template = self._mean._template
+        self.mod = self._template.mod
+        self.unit = self._template.unit
+
+        # Measures in arrival order, and in sorted order
+        self._arrivals = collections.deque()
+        self._sorted = []
+
+    #-------------------------------------------------------------------------
+
+    def __len__(self):
+        """len(MovingMedian) -> int
+        Returns the number of headings currently in the window.
+        """
+
+        return len(self._sorted)
+
+    #-------------------------------------------------------------------------
+
+    def _push(self, m):
+        """MovingMedian._push(m) -> float
+        Ingests a measure in the filter's unit, and returns the new median.
+
+        This is a private method shared by update() and moving_median().
+        """
+
+        m = _normalize(m, self.mod)
+        ref = self._mean._push(m)
+
+        # Add the new measure and drop the oldest
+        self._arrivals.append(m)
+        bisect.insort(self._sorted, m)
+        if len(self._arrivals) > self.window:
+            old = self._arrivals.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, old)]
+
+        # Start the circular order just counterclockwise of the mean's
+        # opposite, so that it runs from most clockwise to most
+        # counterclockwise relative to the mean
+        keys = self._sorted
+        n = len(keys)
+        start = bisect.bisect_right(keys, _normalize(ref + self.mod/2,
+                                                     self.mod))
+        if n % 2 == 1:
+            return keys[(start + n//2) % n]
+        a = keys[(start + n//2 - 1) % n]
+        b = keys[(start + n//2) % n]
+
+        return _normalize(a + _normalize(b - a, self.mod)/2, self.mod)
+
+    #-------------------------------------------------------------------------
+
+    def update(self, angle):
+        """MovingMedian.update(angle) -> Angle
+        Ingests a heading, and returns the circular median of the window.
+
+        Positional arguments:
+        angle (Angle or float) -- newest heading
+        """
+
+        m = self._template._get_other_measure(angle)
+
+        return self._template._new(self._push(m))
+
+#=============================================================================
+# Batch Filters
+#=============================================================================
+
+def _measures(angles, mod):
+    """_measures(angles, mod) -> AngleArray
+    Gets a recorded series of headings as an AngleArray (requires NumPy).
+
+    The batch filters build their results with _new() on the returned
+    AngleArray, so each result is a plain AngleArray (even for a
+    SharedAngleArray input) with the same unit and dtype as the input.
+    """
+
+    from .arrays import _as_angle_array
+
+    return _as_angle_array(angles, mod)
+
+#-----------------------------------------------------------------------------
+
+def moving_mean(angles, window, mod=None):
+    """moving_mean(angles, window[, mod]) -> AngleArray
+    Applies a sliding-window circular mean filter to a recorded series.
+
+    Positional arguments:
+    angles (AngleArray, iterable, or array-like) -- headings, in order
+    window (int) -- number of headings averaged
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians)
+
+    Element i of the result is the circular mean of headings
+    max(0, i - window + 1) through i, as MovingMean.update() would return
+    after ingesting heading i. It is computed in a few vectorized passes,
+    and requires NumPy.
+    """
+
+    import numpy as np
+    a = _measures(angles, mod)
+    window = int(window)
+    if window < 1:
+        raise ValueError("window size must be positive")
+
+    # Windowed sums of cosines and sines, from cumulative sums
+    theta = np.multiply(a.measure, 2*math.pi/a.mod, dtype=np.float64)
+    sums = []
+    for v in (np.cos(theta), np.sin(theta)):
+        total = np.cumsum(v)
+        total[window:] = total[window:] - total[:-window]
+        sums.append(total)
+    out = np.arctan2(sums[1], sums[0])
+    out *= a.mod/(2*math.pi)
+
+    # Undefined means give the newest heading, as for MovingMean
+    zero = (sums[0] == 0.0) & (sums[1] == 0.0)
+    out[zero] = a.measure[zero]
+
+    return a._new(out)
+
+#-----------------------------------------------------------------------------
+
+def exponential_smooth(angles, alpha, mod=None):
+    """exponential_smooth(angles, alpha[, mod]) -> AngleArray
+    Applies an exponential smoothing filter to a recorded series.
+
+    Positional arguments:
+    angles (AngleArray, iterable, or array-like) -- headings, in order
+    alpha (float) -- smoothing factor, between 0 (exclusive) and 1
+        (inclusive)
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians)
+
+    Element i of the result is the smoothed heading which
+    ExponentialSmoother.update() would return after ingesting heading i.
+    Each step depends on the previous one, so the filter runs as a single
+    scalar pass over the measures, without building per-heading Angles. It
+    requires NumPy.
+    """
+
+    a = _measures(angles, mod)
+    f = ExponentialSmoother(alpha, a.mod)
+    push = f._push
+
+    return a._new([push(m) for m in a.measure.tolist()])
+
+#-----------------------------------------------------------------------------
+
+def moving_median(angles, window, mod=None):
+    """moving_median(angles, window[, mod]) -> AngleArray
+    Applies a sliding-window circular median filter to a recorded series.
+
+    Positional arguments:
+    angles (AngleArray, iterable, or array-like) -- headings, in order
+    window (int) -- number of headings in the window
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians)
+
+    Element i of the result is the circular median which
+    MovingMedian.update() would return after ingesting heading i, computed
+    in a single scalar pass over the measures without building per-heading
+    Angles. It requires NumPy.
+    """
+
+    a = _measures(angles, mod)
+    f = MovingMedian(window, a.mod)
+    push = f._push
+
+    return a._new([push(m) for m in a.measure.tolist()])
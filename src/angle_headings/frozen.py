@@ -0,0 +1,314 @@
+"""Defines an immutable, hashable variant of the Angle class."""
+
+from ._version import __author__, __version__
+
+from .angles import Angle, _normalize
+from .units import get_unit
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _hash_key(measure, mod, steps):
+    """_hash_key(measure, mod, steps) -> float
+    Gets the key by which a normalized measure is hashed and compared.
+
+    Positional arguments:
+    measure (float) -- normalized angle measure
+    mod (float) -- measure of one full revolution
+    steps (int) -- number of hash buckets per full revolution, or None
+
+    The key is the measure as a fraction of a full revolution, rounded to
+    the nearest of the given number of steps (if any). Since the key does
+    not depend on the unit, equal headings in different units share a key.
+    """
+
+    key = measure/mod
+    if steps is not None:
+        key = round(key*steps)/steps
+        if key == -0.5:
+            key = 0.5
+
+    return key
+
+#=============================================================================
+# FrozenAngle Class
+#=============================================================================
+
+class FrozenAngle(Angle):
+    """An immutable, hashable Angle.
+
+    A FrozenAngle supports all of the Angle methods and operators, but its
+    measure can never change, so it can be shared freely across threads and
+    data structures, and used as a dict key or set member. Binary operators
+    return new FrozenAngles, and the in-place operators rebind their target
+    to a new FrozenAngle (as they do for tuples) rather than updating it.
+    Copying a FrozenAngle, with +A, copy.copy(), or copy.deepcopy(), returns
+    the same object.
+
+    FrozenAngles are hashed and compared for equality by their measure as a
+    fraction of a full revolution, optionally quantized to a given number of
+    steps per revolution. With quantization, headings which round to the
+    same step are equal and hash equal, so that a lookup table keyed by
+    FrozenAngles matches near-equal headings in O(1) time. Without it,
+    equality is exact. FrozenAngles compared with (mutable, unhashable)
+    Angles quantize them to their own steps. FrozenAngles never compare
+    equal to floats, since no hash could agree with float equality in every
+    unit at once (FrozenAngle(90.0, "deg") == FrozenAngle(pi/2, "rad"), but
+    90.0 != pi/2), nor to BAMAngles, for the same reason. Ordering
+    comparisons follow the Angle conventions, accept floats and BAMAngles,
+    and are not quantized to the FrozenAngle's steps.
+
+    FrozenAngles built with the constructor at 0, 1/4, -1/4, or 1/2 of a
+    full revolution, without quantization, in one of the built-in units
+    (radians, degrees, or gradians), are interned singletons. For example,
+    FrozenAngle(90.0, "deg") is FrozenAngle(-270.0, "deg").
+    """
+
+    __slots__ = ("_steps", "_key")
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __new__(cls, measure=0.0, mod="radians", steps=None):
+        """FrozenAngle([measure[, mod[, steps]]]) -> FrozenAngle
+        FrozenAngle constructor.
+
+        Keyword arguments:
+        measure (float) [0.0] -- angle measure
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution
+        steps (int) [None] -- number of steps per full revolution to which
+            the measure is quantized for hashing and equality, or None for
+            exact hashing and equality
+
+        The measure is normalized exactly as for an Angle, but it is never
+        quantized itself (only its hash key is).
+        """
+
+        unit = get_unit(mod)
+        measure = _normalize(float(measure), unit.mod)
+
+        # Validate the steps, or return an interned singleton if one exists
+        if steps is not None:
+            steps = int(steps)
+            if steps < 1:
+                raise ValueError("number of steps must be positive")
+        elif cls is FrozenAngle:
+            out = _interned.get((unit.mod, measure))
+            if out is not None:
+                return out
+
+        return cls._create(measure, unit.mod, unit.name, steps)
+
+    #-------------------------------------------------------------------------
+
+    def __init__(self, measure=0.0, mod="radians", steps=None):
+        """Does nothing, since FrozenAngles are fully built by __new__()."""
+
+        pass
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def _create(cls, measure, mod, unit, steps):
+        """FrozenAngle._create(measure, mod, unit, steps) -> FrozenAngle
+        Builds a FrozenAngle from an already normalized measure.
+
+        This is a private method which bypasses the immutability checks.
+        """
+
+        out = object.__new__(cls)
+        assign = object.__setattr__
+        assign(out, "_measure", measure)
+        assign(out, "mod", mod)
+        assign(out, "unit", unit)
+        assign(out, "_trig", None)
+        assign(out, "_steps", steps)
+        assign(out, "_key", _hash_key(measure, mod, steps))
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def from_angle(cls, angle, steps=None):
+        """FrozenAngle.from_angle(angle[, steps]) -> FrozenAngle
+        Returns a FrozenAngle with an Angle's measure and unit.
+
+        Positional arguments:
+        angle (Angle) -- angle to freeze
+
+        Keyword arguments:
+        steps (int) [None] -- number of steps per full revolution to which
+            the measure is quantized for hashing and equality
+        """
+
+        return cls(angle._measure, angle.mod, steps)
+
+    #-------------------------------------------------------------------------
+
+    def _new(self, value):
+        """FrozenAngle._new(value) -> FrozenAngle
+        Returns a new FrozenAngle with this FrozenAngle's unit and steps.
+
+        Positional arguments:
+        value (float) -- measure of the new FrozenAngle
+        """
+
+        return FrozenAngle._create(_normalize(value, self.mod), self.mod,
+                                   self.unit, self._steps)
+
+    #-------------------------------------------------------------------------
+
+    def __setattr__(self, name, value):
+        """Prevents the FrozenAngle's attributes from being changed.
+
+        Only the private trigonometric cache may be filled in, which does not
+        change the FrozenAngle's value.
+        """
+
+        if name != "_trig":
+            raise AttributeError("FrozenAngle objects are immutable")
+        object.__setattr__(self, name, value)
+
+    #-------------------------------------------------------------------------
+
+    def __delattr__(self, name):
+        """Prevents the FrozenAngle's attributes from being deleted."""
+
+        raise AttributeError("FrozenAngle objects are immutable")
+
+    #-------------------------------------------------------------------------
+
+    def __repr__(self):
+        """repr(FrozenAngle) -> str
+        FrozenAngle representation.
+        """
+
+        out = "FrozenAngle(" + repr(self._measure) + ", " + repr(self.mod)
+        if self._steps is not None:
+            out += ", steps=" + str(self._steps)
+
+        return out + ")"
+
+    #-------------------------------------------------------------------------
+
+    def __hash__(self):
+        """hash(FrozenAngle) -> int
+        Hashes the FrozenAngle's (quantized) fraction of a revolution.
+        """
+
+        return hash(self._key)
+
+    #-------------------------------------------------------------------------
+
+    def __reduce__(self):
+        """Pickles the FrozenAngle by its constructor arguments.
+
+        Subclasses are rebuilt as their own class, with their constructor
+        called as cls(measure, unit, steps).
+        """
+
+        return (type(self), (self._measure, get_unit(self.mod), self._steps))
+
+    #-------------------------------------------------------------------------
+
+    def __copy__(self):
+        """copy.copy(FrozenAngle) -> FrozenAngle
+        Returns this FrozenAngle, since it cannot change.
+        """
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __deepcopy__(self, memo):
+        """copy.deepcopy(FrozenAngle) -> FrozenAngle
+        Returns this FrozenAngle, since it cannot change.
+        """
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def steps(self):
+        """FrozenAngle.steps() -> int
+        Retrieves the number of hash steps per full revolution (or None).
+        """
+
+        return self._steps
+
+    #=========================================================================
+    # Overloaded Operators
+    #=========================================================================
+
+    def __pos__(self):
+        """+FrozenAngle -> FrozenAngle
+        Returns this FrozenAngle, since it cannot change.
+        """
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    # In-place operators rebind to a new FrozenAngle
+    __iadd__ = Angle.__add__
+    __isub__ = Angle.__sub__
+    __imul__ = Angle.__mul__
+    __itruediv__ = Angle.__truediv__
+    __ifloordiv__ = Angle.__floordiv__
+    __ipow__ = Angle.__pow__
+
+    #=========================================================================
+    # Overloaded Comparisons
+    #=========================================================================
+
+    def __eq__(self, other):
+        """FrozenAngle == FrozenAngle -> bool
+        FrozenAngle == Angle -> bool
+        Determines whether two angles have the same hash key.
+
+        FrozenAngles are equal if their (quantized) fractions of a full
+        revolution are equal. Angles are quantized to this FrozenAngle's
+        steps. Any other operand (including a float) gives NotImplemented,
+        so that equal objects always have equal hashes.
+        """
+
+        if isinstance(other, FrozenAngle) == True:
+            return self._key == other._key
+        if isinstance(other, Angle) == False:
+            return NotImplemented
+        m = _normalize(self._get_other_measure(other), self.mod)
+
+        return self._key == _hash_key(m, self.mod, self._steps)
+
+    #-------------------------------------------------------------------------
+
+    def __ne__(self, other):
+        """FrozenAngle != FrozenAngle -> bool
+        FrozenAngle != Angle -> bool
+        Determines whether two angles have different hash keys.
+        """
+
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+#=============================================================================
+# Interned Constants
+#=============================================================================
+
+# Interned FrozenAngles, keyed by (mod, measure)
+_interned = {}
+
+for _name in ("radians", "degrees", "gradians"):
+    _mod = get_unit(_name).mod
+    for _fraction in (0.0, 0.25, -0.25, 0.5):
+        _interned[(_mod, _fraction*_mod)] = FrozenAngle._create(
+            _fraction*_mod, _mod, get_unit(_name).name, None)
+del _name, _mod, _fraction
@@ -0,0 +1,320 @@
+"""Defines a mergeable histogram (rose diagram) of Angle headings."""
+
+from ._version import __author__, __version__
+
+import math
+import sys
+
+from .angles import Angle
+from .units import get_unit
+
+#=============================================================================
+# AngleHistogram Class
+#=============================================================================
+
+class AngleHistogram:
+    """A mergeable histogram of headings, as used for rose diagrams.
+
+    The full revolution is divided into a fixed number of equal bins, which
+    proceed counterclockwise from a given offset. Bin i covers the
+    half-open arc [offset + i*width, offset + (i+1)*width), where width is
+    one full revolution divided by the number of bins. For example, 16 bins
+    in degrees with an offset of -11.25 gives bins centered on 0.0, 22.5,
+    45.0, and so on.
+
+    Headings are binned one at a time, or a whole AngleArray at once in a
+    single vectorized pass. Two histograms with the same bins (e.g. built in
+    separate worker processes) can be combined with AngleHistogram.merge().
+    Only the bin counts are stored, so memory use does not depend on the
+    number of headings ingested.
+
+    An AngleHistogram object has the following public attributes:
+        bins (int) -- number of bins
+        counts (list) -- number of headings in each bin
+        mod (float) -- the measure of one full revolution
+        offset (float) -- starting edge of bin 0
+        total (int) -- number of headings ingested
+        unit (str) -- string version of the histogram's unit
+        width (float) -- width of each bin
+
+    The following summaries are available:
+        mode() -- center of the fullest bin, as an Angle
+        percentile(q) -- heading below which q percent of the headings lie,
+            as an Angle, measured counterclockwise from a cut placed
+            opposite the bulk of the headings
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, bins=36, mod="degrees", offset=0.0):
+        """AngleHistogram([bins[, mod[, offset]]]) -> AngleHistogram
+        AngleHistogram constructor.
+
+        Keyword arguments:
+        bins (int) [36] -- number of bins per full revolution
+        mod (str or float) ["degrees"] -- unit of the bin edges and results,
+            and the default unit of float headings, given in any form
+            accepted by the Angle constructor
+        offset (float) [0.0] -- starting edge of bin 0
+        """
+
+        bins = int(bins)
+        if bins < 1:
+            raise ValueError("number of bins must be positive")
+
+        # Look up the unit once in the registry
+        unit = get_unit(mod)
+        self.mod = unit.mod
+        self.unit = unit.name
+        self._template = Angle(0.0, unit.mod)
+
+        # Set up the bins
+        self.bins = bins
+        self.offset = float(offset)
+        self.width = self.mod/bins
+        self.counts = [0]*bins
+        self.total = 0
+
+    #-------------------------------------------------------------------------
+
+    def __str__(self):
+        """str(AngleHistogram) -> str
+        AngleHistogram string conversion.
+
+        Returns the number of headings and the number of bins.
+        """
+
+        return "n = " + str(self.total) + ", bins = " + str(self.bins)
+
+    #-------------------------------------------------------------------------
+
+    def _index(self, measure):
+        """AngleHistogram._index(measure) -> int
+        Returns the bin containing a measure in this histogram's unit.
+        """
+
+        i = int((((measure - self.offset)/self.mod) % 1.0)*self.bins)
+
+        # Rounding can give the upper edge of the last bin
+        if i >= self.bins:
+            i = 0
+
+        return i
+
+    #-------------------------------------------------------------------------
+
+    def _start(self, i):
+        """AngleHistogram._start(i) -> float
+        Returns the starting edge of bin i, which may be unnormalized.
+        """
+
+        return self.offset + i*self.width
+
+    #=========================================================================
+    # Ingestion Methods
+    #=========================================================================
+
+    def add(self, angle, mod=None):
+        """AngleHistogram.add(angle[, mod]) -> None
+        Bins a single heading.
+
+        Positional arguments:
+        angle (Angle or float) -- heading to bin
+
+        Keyword arguments:
+        mod (str or float) [None] -- unit of a float heading (defaults to
+            this histogram's unit)
+        """
+
+        # Get the heading in this histogram's unit
+        if isinstance(angle, Angle) == True:
+            m = angle._measure*(self.mod/angle.mod)
+        elif mod is None:
+            m = float(angle)
+        else:
+            m = float(angle)*(self.mod/get_unit(mod).mod)
+
+        self.counts[self._index(m)] += 1
+        self.total += 1
+
+    #-------------------------------------------------------------------------
+
+    def update(self, angles, mod=None):
+        """AngleHistogram.update(angles[, mod]) -> None
+        Bins a batch of headings.
+
+        Positional arguments:
+        angles (iterable or AngleArray) -- headings to bin, as Angles,
+            floats, or a single AngleArray
+
+        Keyword arguments:
+        mod (str or float) [None] -- unit of float headings (defaults to this
+            histogram's unit)
+
+        An AngleArray is binned with a single vectorized pass. Any other
+        iterable is consumed one element at a time, so generators can be
+        streamed without being materialized.
+        """
+
+        # Bin an AngleArray in one vectorized pass
+        arrays = sys.modules.get(__package__ + ".arrays")
+        if arrays is not None and isinstance(angles, arrays.AngleArray):
+            np = arrays.np
+            f = angles.measure*(self.mod/angles.mod) - self.offset
+            f /= self.mod
+            np.mod(f, 1.0, out=f)
+            f *= self.bins
+            i = f.astype(np.intp)
+            i[i >= self.bins] = 0
+            counts = np.bincount(i, minlength=self.bins).tolist()
+            self.counts = [a + b for a, b in zip(self.counts, counts)]
+            self.total += i.size
+            return
+
+        # Otherwise fall back on a scalar scan
+        if mod is not None:
+            scale = self.mod/get_unit(mod).mod
+        for a in angles:
+            if isinstance(a, Angle) == True:
+                m = a._measure*(self.mod/a.mod)
+            elif mod is None:
+                m = float(a)
+            else:
+                m = float(a)*scale
+            self.counts[self._index(m)] += 1
+            self.total += 1
+
+    #-------------------------------------------------------------------------
+
+    def merge(self, other):
+        """AngleHistogram.merge(other) -> AngleHistogram
+        Merges another histogram into this one.
+
+        Positional arguments:
+        other (AngleHistogram) -- histogram to merge
+
+        Returns this histogram, which afterwards represents the union of
+        both histograms' headings. The two histograms may use different
+        units, but must have the same number of bins and the same offset
+        (as a fraction of a full revolution).
+        """
+
+        if (other.bins != self.bins or
+            other.offset/other.mod != self.offset/self.mod):
+            raise ValueError("histograms must have the same bins")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+
+        return self
+
+    #=========================================================================
+    # Bins
+    #=========================================================================
+
+    def edges(self):
+        """AngleHistogram.edges() -> list
+        Returns the bin edges, as floats in this histogram's unit.
+
+        The list has bins + 1 increasing elements, starting with the offset,
+        so that bin i covers [edges[i], edges[i+1]). The edges are not
+        normalized.
+        """
+
+        return [self._start(i) for i in range(self.bins + 1)]
+
+    #-------------------------------------------------------------------------
+
+    def centers(self):
+        """AngleHistogram.centers() -> list
+        Returns the bin centers, as Angles.
+        """
+
+        return [self._template._new(self._start(i + 0.5))
+                for i in range(self.bins)]
+
+    #=========================================================================
+    # Summaries
+    #=========================================================================
+
+    def mode(self):
+        """AngleHistogram.mode() -> Angle
+        Returns the modal direction, at the center of the fullest bin.
+
+        Ties are broken in favor of the lowest bin index. Raises a
+        ValueError if the histogram is empty.
+        """
+
+        if self.total == 0:
+            raise ValueError("mode of an empty histogram")
+        i = self.counts.index(max(self.counts))
+
+        return self._template._new(self._start(i + 0.5))
+
+    #-------------------------------------------------------------------------
+
+    def _cut(self):
+        """AngleHistogram._cut() -> int
+        Returns the bin at which the cumulative distribution starts.
+
+        This is a private method used by percentile(). The cut is placed at
+        the start of the bin nearest the direction opposite the circular mean
+        of the bin centers (weighted by their counts), where the headings are
+        sparsest, so that a cluster of headings is never split by the cut. If
+        the mean is undefined, the cut is at bin 0.
+        """
+
+        # Find the circular mean of the bin centers
+        c = s = 0.0
+        for i, n in enumerate(self.counts):
+            if n > 0:
+                theta = self._start(i + 0.5)*(2*math.pi/self.mod)
+                c += n*math.cos(theta)
+                s += n*math.sin(theta)
+        if math.hypot(c, s) <= 1e-12*self.total:
+            return 0
+
+        # Locate the opposite direction
+        opposite = math.atan2(s, c)*(self.mod/(2*math.pi)) + self.mod/2
+
+        return self._index(opposite)
+
+    #-------------------------------------------------------------------------
+
+    def percentile(self, q):
+        """AngleHistogram.percentile(q) -> Angle
+        Returns the heading below which a given percentage of headings lie.
+
+        Positional arguments:
+        q (float) -- percentage, between 0 and 100
+
+        Headings have no natural order on the circle, so the cumulative
+        distribution starts at a cut placed opposite the circular mean of
+        the histogram, and proceeds counterclockwise. This handles clusters
+        which straddle the -1/2 / +1/2 revolution seam correctly. Headings
+        are assumed to be uniformly distributed within each bin, so the
+        result is linearly interpolated within its bin. Raises a ValueError
+        if the histogram is empty.
+        """
+
+        q = float(q)
+        if q < 0 or q > 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if self.total == 0:
+            raise ValueError("percentile of an empty histogram")
+
+        # Walk the bins counterclockwise from the cut
+        target = q/100*self.total
+        start = self._cut()
+        cumulative = 0
+        for k in range(self.bins):
+            i = start + k
+            n = self.counts[i % self.bins]
+            if n > 0 and cumulative + n >= target:
+                m = self._start(i) + self.width*(target - cumulative)/n
+                return self._template._new(m)
+            cumulative += n
+
+        # Unreachable for a nonempty histogram
+        raise ValueError("percentile of an empty histogram")
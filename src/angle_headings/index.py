@@ -0,0 +1,254 @@
+"""Defines a sorted circular index for range queries over Angles."""
+
+from ._version import __author__, __version__
+
+import bisect
+
+from .angles import Angle, _normalize
+
+#=============================================================================
+# AngleIndex Class
+#=============================================================================
+
+class AngleIndex:
+    """A sorted circular index of headings.
+
+    This class stores a collection of heading measures in sorted order, all
+    in a single unit, to answer queries such as "which headings lie within
+    delta of theta" or "which heading is nearest to theta" without scanning
+    the whole collection. Queries correctly handle arcs which wrap through
+    the -1/2 / +1/2 revolution seam.
+
+    Queries take O(log n + k) time, where k is the number of headings
+    returned. Insertions and removals are incremental, and take O(log n)
+    comparisons (plus a list shift).
+
+    An AngleIndex object has two public attributes:
+        mod (float) -- the measure of one full revolution
+        unit (str) -- string version of the index's unit
+
+    Methods which accept a heading accept either an Angle (which is converted
+    to the index's unit) or a float (which is assumed to already match the
+    index's unit). Methods which return headings return Angles in the index's
+    unit.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, angles=(), mod="radians"):
+        """AngleIndex([angles[, mod]]) -> AngleIndex
+        AngleIndex constructor.
+
+        Keyword arguments:
+        angles (iterable) [()] -- initial headings, as Angles or floats
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution, accepting the same values as the Angle constructor
+        """
+
+        # Parse the unit once through a template Angle
+        self._template = Angle(0.0, mod)
+        self.mod = self._template.mod
+        self.unit = self._template.unit
+
+        # Sorted list of normalized measures
+        self._keys = sorted(self._key(a) for a in angles)
+
+    #-------------------------------------------------------------------------
+
+    def __len__(self):
+        """len(AngleIndex) -> int
+        Returns the number of headings in the index.
+        """
+
+        return len(self._keys)
+
+    #-------------------------------------------------------------------------
+
+    def __iter__(self):
+        """iter(AngleIndex) -> iterator
+        Iterates over the headings in the index, in increasing measure order.
+        """
+
+        for m in self._keys:
+            yield self._template._new(m)
+
+    #-------------------------------------------------------------------------
+
+    def __contains__(self, angle):
+        """Angle in AngleIndex -> bool
+        float in AngleIndex -> bool
+        Determines whether a heading with exactly this measure is indexed.
+        """
+
+        m = self._key(angle)
+        i = bisect.bisect_left(self._keys, m)
+
+        return i < len(self._keys) and self._keys[i] == m
+
+    #-------------------------------------------------------------------------
+
+    def _key(self, angle):
+        """AngleIndex._key(angle) -> float
+        Gets a heading as a normalized measure in the index's unit.
+
+        Positional arguments:
+        angle (Angle or float) -- heading
+        """
+
+        return _normalize(self._template._get_other_measure(angle), self.mod)
+
+    #-------------------------------------------------------------------------
+
+    def _dist(self, i, m):
+        """AngleIndex._dist(i, m) -> float
+        Returns the smallest angle between an indexed heading and a measure.
+
+        Positional arguments:
+        i (int) -- position of the indexed heading
+        m (float) -- normalized measure
+        """
+
+        return abs(_normalize(self._keys[i] - m, self.mod))
+
+    #=========================================================================
+    # Updates
+    #=========================================================================
+
+    def add(self, angle):
+        """AngleIndex.add(angle) -> None
+        Inserts a heading into the index.
+
+        Positional arguments:
+        angle (Angle or float) -- heading to insert
+        """
+
+        bisect.insort(self._keys, self._key(angle))
+
+    #-------------------------------------------------------------------------
+
+    def remove(self, angle):
+        """AngleIndex.remove(angle) -> None
+        Removes one heading with exactly the given measure from the index.
+
+        Positional arguments:
+        angle (Angle or float) -- heading to remove
+
+        Raises a ValueError if no such heading is indexed.
+        """
+
+        m = self._key(angle)
+        i = bisect.bisect_left(self._keys, m)
+        if i == len(self._keys) or self._keys[i] != m:
+            raise ValueError("heading not found in index")
+        del self._keys[i]
+
+    #=========================================================================
+    # Queries
+    #=========================================================================
+
+    def arc(self, start, end):
+        """AngleIndex.arc(start, end) -> list
+        Returns all headings on the arc running counterclockwise from one
+        heading to another.
+
+        Positional arguments:
+        start (Angle or float) -- clockwise end of the arc
+        end (Angle or float) -- counterclockwise end of the arc
+
+        Both endpoints are included. If the arc passes through the +1/2
+        revolution seam, the result wraps around it, and is ordered from
+        start to end.
+        """
+
+        lo = self._key(start)
+        hi = self._key(end)
+        i = bisect.bisect_left(self._keys, lo)
+        j = bisect.bisect_right(self._keys, hi)
+
+        # Select one contiguous run, or two runs if the arc wraps
+        if lo <= hi:
+            found = self._keys[i:j]
+        else:
+            found = self._keys[i:] + self._keys[:j]
+
+        return [self._template._new(x) for x in found]
+
+    #-------------------------------------------------------------------------
+
+    def within(self, center, delta):
+        """AngleIndex.within(center, delta) -> list
+        Returns all headings within a given angle of a center heading.
+
+        Positional arguments:
+        center (Angle or float) -- center of the arc
+        delta (float) -- largest allowed smallest angle between a heading and
+            the center, in the index's unit
+
+        The result is ordered counterclockwise from center - delta to
+        center + delta.
+        """
+
+        delta = abs(float(delta))
+        m = self._key(center)
+
+        # An arc of at least a full revolution contains everything, ordered
+        # starting opposite the center
+        if delta >= self.mod/2:
+            opposite = _normalize(m + self.mod/2, self.mod)
+            i = bisect.bisect_left(self._keys, opposite)
+            found = self._keys[i:] + self._keys[:i]
+            return [self._template._new(x) for x in found]
+
+        return self.arc(m - delta, m + delta)
+
+    #-------------------------------------------------------------------------
+
+    def nearest(self, angle):
+        """AngleIndex.nearest(angle) -> Angle
+        Returns the indexed heading closest to a given heading.
+
+        Positional arguments:
+        angle (Angle or float) -- query heading
+
+        Raises a ValueError if the index is empty.
+        """
+
+        if len(self._keys) == 0:
+            raise ValueError("index is empty")
+
+        return self.nearest_k(angle, 1)[0]
+
+    #-------------------------------------------------------------------------
+
+    def nearest_k(self, angle, k):
+        """AngleIndex.nearest_k(angle, k) -> list
+        Returns the k indexed headings closest to a given heading.
+
+        Positional arguments:
+        angle (Angle or float) -- query heading
+        k (int) -- number of headings to return
+
+        The result is ordered by increasing smallest angle to the query
+        heading, and contains fewer than k headings only if the index does.
+        """
+
+        n = len(self._keys)
+        k = min(int(k), n)
+        m = self._key(angle)
+
+        # Expand outwards in both directions from the insertion point,
+        # wrapping around the seam
+        right = bisect.bisect_left(self._keys, m)
+        left = right - 1
+        found = []
+        while len(found) < k:
+            if self._dist(left % n, m) <= self._dist(right % n, m):
+                found.append(self._keys[left % n])
+                left -= 1
+            else:
+                found.append(self._keys[right % n])
+                right += 1
+
+        return [self._template._new(x) for x in found]
@@ -0,0 +1,310 @@
+"""Defines opt-in instrumentation of the Angle class's hot paths."""
+
+from ._version import __author__, __version__
+
+import contextlib
+import functools
+import time
+
+from .angles import Angle
+from .frozen import FrozenAngle
+from .units import get_unit
+
+#=============================================================================
+# State
+#=============================================================================
+
+# Operators which are counted (and optionally timed) individually
+OPERATORS = ("__abs__", "__int__", "__float__", "__round__", "__pos__",
+             "__neg__", "__add__", "__sub__", "__mul__", "__truediv__",
+             "__floordiv__", "__pow__", "__iadd__", "__isub__", "__imul__",
+             "__itruediv__", "__ifloordiv__", "__ipow__", "__eq__", "__ne__",
+             "__gt__", "__lt__", "__ge__", "__le__", "reldiff")
+
+# Counters
+_counts = {"constructions": 0, "normalizations": 0, "conversions": 0,
+           "mixed_unit_conversions": 0}
+_operators = {}
+_times = {}
+
+# Original attributes replaced while instrumentation is enabled, by (class,
+# name)
+_originals = {}
+
+#=============================================================================
+# Wrappers
+#=============================================================================
+
+def _wraps(value, mod):
+    """_wraps(value, mod) -> bool
+    Determines whether normalizing a measure takes the modulo branch.
+    """
+
+    return value < -mod/2 or value > mod/2
+
+#-----------------------------------------------------------------------------
+
+def _wrap_setter(prop):
+    """Counts measures which the Angle.measure setter has to wrap."""
+
+    fset = prop.fset
+
+    @functools.wraps(fset)
+    def setter(self, value):
+        if _wraps(value, self.mod) == True:
+            _counts["normalizations"] += 1
+        fset(self, value)
+
+    return property(prop.fget, setter, prop.fdel, prop.__doc__)
+
+#-----------------------------------------------------------------------------
+
+def _wrap_init(f):
+    """Counts calls to the Angle constructor."""
+
+    @functools.wraps(f)
+    def wrapper(self, *args, **kwargs):
+        _counts["constructions"] += 1
+        return f(self, *args, **kwargs)
+
+    return wrapper
+
+#-----------------------------------------------------------------------------
+
+def _wrap_new(f, allocates):
+    """Counts calls to Angle._new() (or FrozenAngle._new(), which allocates
+    through FrozenAngle._create()), and those which wrap their input."""
+
+    @functools.wraps(f)
+    def wrapper(self, value):
+        if allocates == True:
+            _counts["constructions"] += 1
+        if _wraps(value, self.mod) == True:
+            _counts["normalizations"] += 1
+        return f(self, value)
+
+    return wrapper
+
+#-----------------------------------------------------------------------------
+
+def _wrap_frozen_new(f):
+    """Counts FrozenAngle constructor calls which wrap their input."""
+
+    @functools.wraps(f)
+    def wrapper(cls, measure=0.0, mod="radians", steps=None):
+        if _wraps(float(measure), get_unit(mod).mod) == True:
+            _counts["normalizations"] += 1
+        return f(cls, measure, mod, steps)
+
+    return staticmethod(wrapper)
+
+#-----------------------------------------------------------------------------
+
+def _wrap_create(f):
+    """Counts FrozenAngles allocated by FrozenAngle._create()."""
+
+    @functools.wraps(f)
+    def wrapper(cls, *args):
+        _counts["constructions"] += 1
+        return f(cls, *args)
+
+    return classmethod(wrapper)
+
+#-----------------------------------------------------------------------------
+
+def _wrap_convert(f):
+    """Counts calls to Angle.convert()."""
+
+    @functools.wraps(f)
+    def wrapper(self, *args, **kwargs):
+        _counts["conversions"] += 1
+        return f(self, *args, **kwargs)
+
+    return wrapper
+
+#-----------------------------------------------------------------------------
+
+def _wrap_other(f):
+    """Counts mixed-unit conversions in Angle._get_other_measure()."""
+
+    @functools.wraps(f)
+    def wrapper(self, other):
+        if isinstance(other, Angle) == True and other.mod != self.mod:
+            _counts["mixed_unit_conversions"] += 1
+        return f(self, other)
+
+    return wrapper
+
+#-----------------------------------------------------------------------------
+
+def _wrap_operator(name, f, timing):
+    """Counts (and optionally times) calls to an operator."""
+
+    if timing == True:
+        clock = time.perf_counter_ns
+
+        @functools.wraps(f)
+        def wrapper(*args):
+            start = clock()
+            try:
+                return f(*args)
+            finally:
+                _times[name] = _times.get(name, 0) + clock() - start
+                _operators[name] = _operators.get(name, 0) + 1
+    else:
+        @functools.wraps(f)
+        def wrapper(*args):
+            _operators[name] = _operators.get(name, 0) + 1
+            return f(*args)
+
+    return wrapper
+
+#-----------------------------------------------------------------------------
+
+def _install(cls, name, wrapper):
+    """Replaces a class attribute with a wrapper, saving the original."""
+
+    _originals[(cls, name)] = cls.__dict__[name]
+    setattr(cls, name, wrapper)
+
+#=============================================================================
+# Public Interface
+#=============================================================================
+
+def enable(timing=False):
+    """enable([timing]) -> None
+    Switches instrumentation on.
+
+    Keyword arguments:
+    timing (bool) [False] -- whether to also accumulate the time spent in
+        each operator
+
+    Instrumentation works by temporarily replacing methods of the Angle and
+    FrozenAngle classes with counting wrappers. Methods are looked up on the
+    class at every call, so every caller is counted, including the other
+    modules of this package, and when instrumentation is disabled the
+    original methods run untouched with no overhead at all. Calling enable()
+    again while enabled changes the timing setting. Counters are kept until
+    reset(). See snapshot() for exactly what is counted.
+    """
+
+    if enabled() == True:
+        disable()
+
+    # Angle constructions, normalizations, and conversions
+    _install(Angle, "__init__", _wrap_init(Angle.__dict__["__init__"]))
+    _install(Angle, "measure", _wrap_setter(Angle.__dict__["measure"]))
+    _install(Angle, "_new", _wrap_new(Angle.__dict__["_new"], True))
+    _install(Angle, "convert", _wrap_convert(Angle.__dict__["convert"]))
+    _install(Angle, "_get_other_measure",
+             _wrap_other(Angle.__dict__["_get_other_measure"]))
+
+    # FrozenAngles are built without Angle.__init__() or Angle._new()
+    _install(FrozenAngle, "__new__",
+             _wrap_frozen_new(FrozenAngle.__dict__["__new__"].__func__))
+    _install(FrozenAngle, "_create",
+             _wrap_create(FrozenAngle.__dict__["_create"].__func__))
+    _install(FrozenAngle, "_new",
+             _wrap_new(FrozenAngle.__dict__["_new"], False))
+
+    # Operators, including those which FrozenAngle defines itself
+    for cls in (Angle, FrozenAngle):
+        for name in OPERATORS:
+            if name in cls.__dict__:
+                _install(cls, name, _wrap_operator(name, cls.__dict__[name],
+                                                   timing))
+
+#-----------------------------------------------------------------------------
+
+def disable():
+    """disable() -> None
+    Switches instrumentation off, restoring the original Angle methods.
+
+    Counters are kept until reset().
+    """
+
+    if enabled() == False:
+        return
+    for (cls, name), f in _originals.items():
+        setattr(cls, name, f)
+    _originals.clear()
+
+#-----------------------------------------------------------------------------
+
+def enabled():
+    """enabled() -> bool
+    Determines whether instrumentation is currently switched on.
+    """
+
+    return len(_originals) > 0
+
+#-----------------------------------------------------------------------------
+
+def snapshot():
+    """snapshot() -> dict
+    Returns a copy of the current counters.
+
+    The returned dictionary has the following keys:
+        constructions (int) -- Angles and FrozenAngles allocated, by their
+            constructors, by operators, or by any other code which builds
+            them with Angle._new() (interned FrozenAngles returned by the
+            constructor are not allocated, and are not counted)
+        normalizations (int) -- measures which had to be wrapped into
+            (-1/2,1/2] full revolutions on their way into an Angle or
+            FrozenAngle, by a constructor, the measure setter, an operator,
+            or Angle._new()
+        conversions (int) -- calls to Angle.convert()
+        mixed_unit_conversions (int) -- Angle operands converted from a
+            different unit by Angle._get_other_measure(), which is used by
+            the binary operators, comparisons, reldiff(), and the other
+            functions which accept Angles in any unit
+        operators (dict) -- number of calls to each operator
+        operator_time_ns (dict) -- total nanoseconds spent in each operator,
+            if timing was enabled
+
+    Floats which are normalized without becoming an Angle's measure are not
+    counted as normalizations. These include the differences computed by
+    the comparisons, reldiff(), and relkey(), and the intermediate measures
+    of the streaming and statistics classes. LazyAngles, BAMAngles, and the
+    batched NumPy types are not instrumented, although the Angles returned
+    by LazyAngle.angle() are counted, since it builds them with _new().
+    """
+
+    out = dict(_counts)
+    out["operators"] = dict(_operators)
+    out["operator_time_ns"] = dict(_times)
+
+    return out
+
+#-----------------------------------------------------------------------------
+
+def reset():
+    """reset() -> None
+    Resets all counters to zero.
+    """
+
+    for key in _counts:
+        _counts[key] = 0
+    _operators.clear()
+    _times.clear()
+
+#-----------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def instrumented(timing=False):
+    """instrumented([timing]) -> context manager
+    Enables instrumentation for the duration of a with block.
+
+    Keyword arguments:
+    timing (bool) [False] -- whether to also time each operator
+
+    The counters are reset on entry, and the context manager yields the
+    snapshot() function. Instrumentation is disabled again on exit.
+    """
+
+    reset()
+    enable(timing)
+    try:
+        yield snapshot
+    finally:
+        disable()
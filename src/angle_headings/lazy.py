@@ -0,0 +1,292 @@
+"""Defines a deferred-normalization builder for chained Angle arithmetic."""
+
+from ._version import __author__, __version__
+
+from .angles import Angle, _normalize
+
+class LazyAngle:
+    """A builder which defers Angle normalization until it is read.
+
+    Every Angle operator normalizes its result. In a chained expression like
+    h + a - b + c that means one modulo per operator, and a rounding error at
+    every wrap. A LazyAngle instead accumulates the raw, unnormalized sum of
+    its terms, and only wraps it into (-1/2,1/2] full revolutions when its
+    measure is read or it is materialized as an Angle.
+
+    Since normalization only discards whole revolutions, deferring it across
+    additions and subtractions gives the same angle as the eager path (to
+    within float rounding). Multiplication, division, and exponentiation do
+    not commute with normalization, so those operators normalize the running
+    sum before they are applied, exactly as the eager path does. To bound the
+    loss of precision in very long sums, the running sum is also wrapped
+    whenever it exceeds 16 revolutions in magnitude, which short chains never
+    reach.
+
+    A LazyAngle object has two public attributes:
+        mod (float) -- the measure of one full revolution
+        unit (str) -- string version of the angle's unit
+    and the read-only properties:
+        raw (float) -- the unnormalized running sum
+        measure (float) -- the normalized measure
+
+    The binary operators accept Angles, LazyAngles (converted to this
+    LazyAngle's unit), or floats (assumed to match this LazyAngle's unit),
+    following the Angle conventions. The in-place operators update the
+    LazyAngle without allocating. A LazyAngle should be materialized with
+    LazyAngle.angle() before being used as an operand of Angle arithmetic.
+
+    Skipping a normalization saves little time, since a measure which is
+    already in range costs only two comparisons to normalize, while
+    allocating a new object costs far more. So the binary operators (like
+    h + a - b), which allocate a new LazyAngle for every term, are no faster
+    than the same Angle expression, and are typically slightly slower. The
+    speedup comes from the in-place operators (x += a; x -= b), which
+    accumulate without allocating. They are faster than chained Angle
+    operators, and than in-place Angle operators, which still normalize
+    after every term. Use the binary operators for a single wrap and for
+    readability, and the in-place operators for speed.
+    """
+
+    __slots__ = ("_raw", "mod", "unit")
+
+    # Magnitude (in revolutions) past which the running sum is wrapped
+    _limit = 16.0
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, angle=0.0, mod="radians"):
+        """LazyAngle([angle[, mod]]) -> LazyAngle
+        LazyAngle constructor.
+
+        Keyword arguments:
+        angle (Angle, LazyAngle, or float) [0.0] -- initial angle (if an
+            Angle or LazyAngle, its unit is used and mod is ignored, and a
+            LazyAngle's unnormalized running sum is copied as it is)
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution, for a float initial measure
+        """
+
+        # Copy another LazyAngle's running sum without normalizing it
+        if isinstance(angle, LazyAngle) == True:
+            self.mod = angle.mod
+            self.unit = angle.unit
+            self._raw = angle._raw
+            return
+
+        if isinstance(angle, Angle) == False:
+            angle = Angle(angle, mod)
+        self.mod = angle.mod
+        self.unit = angle.unit
+        self._raw = angle._measure
+
+    #-------------------------------------------------------------------------
+
+    def _new(self, raw):
+        """LazyAngle._new(raw) -> LazyAngle
+        Returns a new LazyAngle with this LazyAngle's unit.
+
+        Positional arguments:
+        raw (float) -- running sum of the new LazyAngle
+        """
+
+        out = LazyAngle.__new__(LazyAngle)
+        out.mod = self.mod
+        out.unit = self.unit
+        out._raw = raw
+        if abs(raw) > LazyAngle._limit*self.mod:
+            out._raw = _normalize(raw, self.mod)
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def __str__(self):
+        """str(LazyAngle) -> str
+        LazyAngle string conversion.
+
+        Returns the normalized measure of the angle as a string, along with
+        an abbreviation of the angle unit.
+        """
+
+        return str(self.measure) + " " + self.unit
+
+    #-------------------------------------------------------------------------
+
+    def _get_other_measure(self, other):
+        """LazyAngle._get_other_measure(other) -> float
+        Gets a measure argument as a float.
+
+        Positional arguments:
+        other (Angle, LazyAngle, or float) -- other angle or float to be
+            treated as a measure
+        """
+
+        if isinstance(other, Angle) == True:
+            if other.mod == self.mod:
+                return other._measure
+            return other._measure*(self.mod/other.mod)
+        if isinstance(other, LazyAngle) == True:
+            if other.mod == self.mod:
+                return other._raw
+            return other._raw*(self.mod/other.mod)
+
+        return float(other)
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def raw(self):
+        """LazyAngle.raw() -> float
+        Retrieves the unnormalized running sum.
+        """
+
+        return self._raw
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def measure(self):
+        """LazyAngle.measure() -> float
+        Retrieves the normalized angle measure.
+        """
+
+        return _normalize(self._raw, self.mod)
+
+    #=========================================================================
+    # Materialization
+    #=========================================================================
+
+    def angle(self):
+        """LazyAngle.angle() -> Angle
+        Returns an Angle with this LazyAngle's normalized measure.
+        """
+
+        # Angle._new() only reads the mod and unit, which this shares
+        return Angle._new(self, self._raw)
+
+    #-------------------------------------------------------------------------
+
+    def __float__(self):
+        """float(LazyAngle) -> float
+        Returns the normalized measure of the LazyAngle.
+        """
+
+        return self.measure
+
+    #=========================================================================
+    # Deferred Operators
+    #=========================================================================
+
+    def __pos__(self):
+        """+LazyAngle -> LazyAngle
+        Returns a copy of this LazyAngle.
+        """
+
+        return self._new(self._raw)
+
+    #-------------------------------------------------------------------------
+
+    def __neg__(self):
+        """-LazyAngle -> LazyAngle
+        Returns a LazyAngle with the negative of this running sum.
+        """
+
+        return self._new(-self._raw)
+
+    #-------------------------------------------------------------------------
+
+    def __add__(self, other):
+        """LazyAngle + Angle -> LazyAngle
+        LazyAngle + LazyAngle -> LazyAngle
+        LazyAngle + float -> LazyAngle
+        Returns a LazyAngle with another measure added, without normalizing.
+        """
+
+        return self._new(self._raw + self._get_other_measure(other))
+
+    #-------------------------------------------------------------------------
+
+    def __sub__(self, other):
+        """LazyAngle - Angle -> LazyAngle
+        LazyAngle - LazyAngle -> LazyAngle
+        LazyAngle - float -> LazyAngle
+        Returns a LazyAngle with another measure subtracted, without
+        normalizing.
+        """
+
+        return self._new(self._raw - self._get_other_measure(other))
+
+    #-------------------------------------------------------------------------
+
+    def __iadd__(self, other):
+        """LazyAngle += Angle
+        LazyAngle += LazyAngle
+        LazyAngle += float
+        Adds another measure to this LazyAngle in place, without normalizing.
+        """
+
+        self._raw += self._get_other_measure(other)
+        if abs(self._raw) > LazyAngle._limit*self.mod:
+            self._raw = _normalize(self._raw, self.mod)
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __isub__(self, other):
+        """LazyAngle -= Angle
+        LazyAngle -= LazyAngle
+        LazyAngle -= float
+        Subtracts another measure from this LazyAngle in place, without
+        normalizing.
+        """
+
+        self._raw -= self._get_other_measure(other)
+        if abs(self._raw) > LazyAngle._limit*self.mod:
+            self._raw = _normalize(self._raw, self.mod)
+
+        return self
+
+    #=========================================================================
+    # Normalizing Operators
+    #=========================================================================
+
+    def __mul__(self, other):
+        """LazyAngle * float -> LazyAngle
+        Returns a LazyAngle with the normalized measure multiplied by a given
+        float.
+        """
+
+        return self._new(self.measure*other)
+
+    #-------------------------------------------------------------------------
+
+    def __truediv__(self, other):
+        """LazyAngle / float -> LazyAngle
+        Returns a LazyAngle with the normalized measure divided by a given
+        float.
+        """
+
+        return self._new(self.measure/other)
+
+    #-------------------------------------------------------------------------
+
+    def __floordiv__(self, other):
+        """LazyAngle // float -> LazyAngle
+        Returns a LazyAngle with the normalized measure (floor) divided by a
+        given float.
+        """
+
+        return self._new(self.measure//other)
+
+    #-------------------------------------------------------------------------
+
+    def __pow__(self, other):
+        """LazyAngle ** float -> LazyAngle
+        Returns a LazyAngle with the normalized measure raised to a given
+        float power.
+        """
+
+        return self._new(self.measure**other)
@@ -0,0 +1,192 @@
+"""Defines blocked pairwise circular distance computations for Angles."""
+
+from ._version import __author__, __version__
+
+import numpy as np
+
+from .arrays import _as_angle_array, _normalize_inplace
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _prepare(a, b, mod):
+    """_prepare(a, b, mod) -> tuple
+    Gets both collections of headings as measure arrays in a common unit.
+
+    Returns the measures of a, the measures of b (converted to a's unit),
+    and the measure of a full revolution in that unit. If b is None, a is
+    compared against itself.
+    """
+
+    a = _as_angle_array(a, mod)
+    if b is None:
+        return a.measure, a.measure, a.mod
+    b = _as_angle_array(b, a.mod)
+
+    return a.measure, b.measure, a.mod
+
+#-----------------------------------------------------------------------------
+
+def _block(x, y, mod):
+    """_block(x, y, mod) -> ndarray
+    Returns the reldiff() matrix between two arrays of measures.
+
+    Element [i,j] equals Angle(x[i], mod).reldiff(Angle(y[j], mod)).
+    """
+
+    d = np.subtract.outer(x, y)
+    _normalize_inplace(d, mod)
+    np.abs(d, out=d)
+    d /= mod/2
+
+    return d
+
+#-----------------------------------------------------------------------------
+
+def _nearest_rows(args):
+    """_nearest_rows(args) -> tuple
+    Finds the k nearest columns for one block of rows.
+
+    Positional arguments:
+    args (tuple) -- (x, y, mod, k, block_size, offset), where offset is the
+        index of the block's first row if rows should not match the column
+        with the same index (for self comparisons), or None otherwise
+
+    This is a private module-level function so that it can be sent to
+    worker processes.
+    """
+
+    x, y, mod, k, block_size, offset = args
+    n = len(x)
+    best_d = np.full((n, k), np.inf)
+    best_i = np.full((n, k), -1, dtype=np.intp)
+    rows = np.arange(n)
+
+    # Merge the k nearest columns of each block into the running best
+    for j0 in range(0, len(y), block_size):
+        d = _block(x, y[j0:j0 + block_size], mod)
+        if offset is not None:
+            cols = rows + offset - j0
+            mask = (cols >= 0) & (cols < d.shape[1])
+            d[rows[mask], cols[mask]] = np.inf
+        cand_d = np.concatenate((best_d, d), axis=1)
+        cand_i = np.concatenate(
+            (best_i, np.broadcast_to(np.arange(j0, j0 + d.shape[1]),
+                                     d.shape)), axis=1)
+        part = np.argpartition(cand_d, k - 1, axis=1)[:, :k]
+        best_d = np.take_along_axis(cand_d, part, axis=1)
+        best_i = np.take_along_axis(cand_i, part, axis=1)
+
+    # Sort each row's results by distance, then by index
+    best_i[np.isinf(best_d)] = -1
+    order = np.lexsort((best_i, best_d), axis=1)
+
+    return (np.take_along_axis(best_i, order, axis=1),
+            np.take_along_axis(best_d, order, axis=1))
+
+#=============================================================================
+# Pairwise Distances
+#=============================================================================
+
+def reldiff_matrix(a, b=None, mod=None):
+    """reldiff_matrix(a[, b[, mod]]) -> ndarray
+    Returns the dense matrix of relative differences between headings.
+
+    Positional arguments:
+    a (AngleArray, iterable, or array-like) -- first collection of headings
+
+    Keyword arguments:
+    b (AngleArray, iterable, or array-like) [None] -- second collection of
+        headings (defaults to a)
+    mod (str or float) [None] -- unit of float headings in a (defaults to
+        radians); float headings in b are assumed to match a's unit
+
+    Element [i,j] equals a[i].reldiff(b[j]), the Angle.reldiff() metric
+    scaled so that 0.0 represents equal measures and 1.0 represents
+    diametrically opposed measures. The whole matrix is allocated at once,
+    so for large collections reldiff_blocks() or nearest_k() should be used
+    instead.
+    """
+
+    return _block(*_prepare(a, b, mod))
+
+#-----------------------------------------------------------------------------
+
+def reldiff_blocks(a, b=None, mod=None, block_size=1024):
+    """reldiff_blocks(a[, b[, mod[, block_size]]]) -> generator
+    Generates the matrix of relative differences between headings in
+    memory-bounded blocks.
+
+    Positional arguments:
+    a (AngleArray, iterable, or array-like) -- first collection of headings
+
+    Keyword arguments:
+    b (AngleArray, iterable, or array-like) [None] -- second collection of
+        headings (defaults to a)
+    mod (str or float) [None] -- unit of float headings in a (defaults to
+        radians); float headings in b are assumed to match a's unit
+    block_size (int) [1024] -- maximum number of rows and columns per block
+
+    Yields (i, j, block) tuples, where block is the submatrix of
+    reldiff_matrix(a, b) whose top left element is [i,j]. At most one block
+    of block_size^2 elements is held in memory at a time.
+    """
+
+    x, y, mod = _prepare(a, b, mod)
+    for i in range(0, len(x), block_size):
+        for j in range(0, len(y), block_size):
+            yield (i, j, _block(x[i:i + block_size], y[j:j + block_size],
+                                mod))
+
+#-----------------------------------------------------------------------------
+
+def nearest_k(a, b=None, k=1, mod=None, block_size=1024, workers=None):
+    """nearest_k(a[, b[, k[, mod[, block_size[, workers]]]]]) -> tuple
+    Finds the k nearest headings in one collection to each heading in
+    another.
+
+    Positional arguments:
+    a (AngleArray, iterable, or array-like) -- query headings
+
+    Keyword arguments:
+    b (AngleArray, iterable, or array-like) [None] -- headings to search
+        (defaults to a, in which case each heading is excluded from its own
+        results)
+    k (int) [1] -- number of nearest headings to find
+    mod (str or float) [None] -- unit of float headings in a (defaults to
+        radians); float headings in b are assumed to match a's unit
+    block_size (int) [1024] -- maximum number of rows and columns per block
+    workers (int) [None] -- number of worker processes across which to split
+        the rows (by default the computation runs in this process)
+
+    Returns a tuple (indices, distances) of arrays with one row per heading
+    in a and k columns, giving the indices of the nearest headings in b and
+    their reldiff() distances, sorted by increasing distance. Only
+    block_size^2 distances are held in memory at a time per process. If
+    fewer than k headings are available, the remaining indices are -1 and
+    distances are infinite.
+    """
+
+    x, y, mod = _prepare(a, b, mod)
+    k = int(k)
+    if k < 1:
+        raise ValueError("k must be positive")
+    exclude = b is None
+
+    # Split the rows into blocks
+    tasks = [(x[i:i + block_size], y, mod, k, block_size,
+              i if exclude else None) for i in range(0, len(x), block_size)]
+    if len(tasks) == 0:
+        return (np.empty((0, k), dtype=np.intp), np.empty((0, k)))
+
+    # Process the blocks, optionally in a process pool
+    if workers is None or workers <= 1 or len(tasks) == 1:
+        results = [_nearest_rows(t) for t in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_nearest_rows, tasks))
+
+    return (np.concatenate([r[0] for r in results]),
+            np.concatenate([r[1] for r in results]))
@@ -0,0 +1,113 @@
+"""Defines batched 2D rotations and vector headings for Angles."""
+
+from ._version import __author__, __version__
+
+import math
+
+import numpy as np
+
+from .angles import Angle
+from .arrays import AngleArray, _as_angle_array
+from .units import get_unit
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _trig(headings, mod):
+    """_trig(headings, mod) -> tuple
+    Gets the cosines and sines of one or many headings.
+
+    Returns a pair of floats for a single Angle (from its cached values), or
+    a pair of arrays otherwise.
+    """
+
+    if isinstance(headings, Angle) == True:
+        return headings.unit_vector
+    headings = _as_angle_array(headings, mod)
+    theta = headings.measure*(2*math.pi/headings.mod)
+
+    return np.cos(theta), np.sin(theta)
+
+#=============================================================================
+# Vectors
+#=============================================================================
+
+def unit_vectors(headings, mod=None):
+    """unit_vectors(headings[, mod]) -> ndarray
+    Returns the unit vectors pointing along many headings.
+
+    Positional arguments:
+    headings (AngleArray, iterable, or array-like) -- headings
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians)
+
+    Returns an array with one row (cos, sin) per heading.
+    """
+
+    c, s = _trig(_as_angle_array(headings, mod), None)
+
+    return np.stack((c, s), axis=-1)
+
+#-----------------------------------------------------------------------------
+
+def from_vectors(x, y=None, mod="radians"):
+    """from_vectors(x[, y[, mod]]) -> AngleArray
+    Returns the headings of many 2D vectors.
+
+    Positional arguments:
+    x (array-like) -- x-components of the vectors, or (if y is not given)
+        an array of vectors whose last axis has length 2
+
+    Keyword arguments:
+    y (array-like) [None] -- y-components of the vectors
+    mod (str or float) ["radians"] -- unit of the returned AngleArray
+
+    Element i equals Angle.from_xy(x[i], y[i], mod), computed in a single
+    vectorized np.arctan2() pass.
+    """
+
+    if y is None:
+        v = np.asarray(x, dtype=np.float64)
+        if v.shape[-1:] != (2,):
+            raise ValueError("vectors must have a last axis of length 2")
+        x, y = v[..., 0], v[..., 1]
+    theta = np.arctan2(y, x)
+    theta *= get_unit(mod).mod/(2*math.pi)
+
+    return AngleArray(theta, mod)
+
+#=============================================================================
+# Rotation
+#=============================================================================
+
+def rotate(points, headings, mod=None):
+    """rotate(points, headings[, mod]) -> ndarray
+    Rotates 2D points or vectors counterclockwise by one or many headings.
+
+    Positional arguments:
+    points (array-like) -- points to rotate, as an array whose last axis has
+        length 2
+    headings (Angle, AngleArray, iterable, or array-like) -- a single Angle
+        by which to rotate every point, or one heading per point
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians)
+
+    Rotation is about the origin, so it applies equally to positions and to
+    velocity vectors. A single Angle's cached cosine and sine are reused for
+    every point. Per-point headings are broadcast against the points
+    following the usual NumPy rules. Returns a new float array with the
+    shape of points.
+    """
+
+    p = np.asarray(points, dtype=np.float64)
+    if p.shape[-1:] != (2,):
+        raise ValueError("points must have a last axis of length 2")
+    c, s = _trig(headings, mod)
+    x, y = p[..., 0], p[..., 1]
+
+    return np.stack((c*x - s*y, s*x + c*y), axis=-1)
@@ -0,0 +1,326 @@
+"""Defines AngleArrays backed by shared memory or memory-mapped files."""
+
+from ._version import __author__, __version__
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .arrays import AngleArray, _as_angle_array, _get_dtype, _normalize
+from .units import get_unit
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _attach(name, size, mod, dtype):
+    """_attach(name, size, mod, dtype) -> SharedAngleArray
+    Unpickles a SharedAngleArray by attaching to its shared memory block.
+    """
+
+    return SharedAngleArray.attach(name, size, mod, dtype)
+
+#-----------------------------------------------------------------------------
+
+def _reopen(path, mod, mode, dtype):
+    """_reopen(path, mod, mode, dtype) -> SharedAngleArray
+    Unpickles a SharedAngleArray by mapping its file again.
+    """
+
+    return SharedAngleArray.open_file(path, mod, mode, dtype)
+
+#=============================================================================
+# SharedAngleArray Class
+#=============================================================================
+
+class SharedAngleArray(AngleArray):
+    """An AngleArray whose measures live outside of the process's own memory.
+
+    A SharedAngleArray's measure buffer lives in either a
+    multiprocessing.shared_memory block or a memory-mapped file of raw
+    float64 (or float32) measures. Other processes can attach to the same
+    buffer without copying it, so a large collection of headings can be
+    shared by a pool of workers at the cost of a single copy.
+
+    A SharedAngleArray supports everything an AngleArray does. The in-place
+    operators and the measure setter write directly into the shared buffer,
+    so their results are visible to every attached process. Other operators
+    return ordinary AngleArrays in private memory. The storage precision
+    follows the same rules as for an AngleArray, and must be given again
+    (like the unit) when attaching to a block or opening a file by name.
+
+    Pickling a SharedAngleArray (e.g. as an argument to a worker process)
+    sends only the name of its shared memory block or the path of its file,
+    along with its length, unit, and storage precision. Unpickling attaches
+    to the same buffer. The process which created a shared memory block is
+    responsible for calling SharedAngleArray.unlink() once every process is
+    finished with it, while every process should call
+    SharedAngleArray.close() (or use the SharedAngleArray as a context
+    manager) to release its own mapping.
+
+    A SharedAngleArray has the following public attributes, in addition to
+    those of an AngleArray:
+        name (str) -- name of the shared memory block, or None
+        path (str) -- path of the memory-mapped file, or None
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, measure=(), mod="radians", dtype=np.float64):
+        """SharedAngleArray([measure[, mod[, dtype]]]) -> SharedAngleArray
+        Copies measures into a new shared memory block.
+
+        Keyword arguments:
+        measure (array-like) [()] -- initial angle measures
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution
+        dtype (str or dtype) [float64] -- storage precision, "float64" or
+            "float32"
+
+        The block is named automatically, and can be attached to by name
+        from other processes with SharedAngleArray.attach().
+        """
+
+        unit = get_unit(mod)
+        m = _normalize(measure, unit.mod, _get_dtype(dtype)).ravel()
+
+        # Copy the measures into a new block (of at least one byte)
+        shm = shared_memory.SharedMemory(create=True,
+                                         size=max(m.nbytes, 1))
+        self._setup(np.ndarray(m.shape, m.dtype, shm.buf), unit)
+        self._measure[:] = m
+        self._shm = shm
+        self.name = shm.name
+
+    #-------------------------------------------------------------------------
+
+    def _setup(self, buffer, unit):
+        """SharedAngleArray._setup(buffer, unit) -> None
+        Sets the attributes shared by every kind of SharedAngleArray.
+        """
+
+        self.mod = unit.mod
+        self.unit = unit.name
+        self.dtype = buffer.dtype
+        self._measure = buffer
+        self._shm = None
+        self._mode = None
+        self.name = None
+        self.path = None
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def share(cls, angles, mod=None, dtype=None):
+        """SharedAngleArray.share(angles[, mod[, dtype]]) -> SharedAngleArray
+        Copies a collection of headings into a new shared memory block.
+
+        Positional arguments:
+        angles (AngleArray, iterable, or array-like) -- headings
+
+        Keyword arguments:
+        mod (str or float) [None] -- unit of float headings, and of the
+            result (defaults to radians for floats, and to the headings' own
+            unit otherwise)
+        dtype (str or dtype) [None] -- storage precision (defaults to that
+            of an AngleArray, and to float64 otherwise)
+        """
+
+        a = _as_angle_array(angles, mod)
+
+        return cls(a.measure, a.mod, a.dtype if dtype is None else dtype)
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def attach(cls, name, size, mod="radians", dtype=np.float64):
+        """SharedAngleArray.attach(name, size[, mod[, dtype]])
+            -> SharedAngleArray
+        Attaches to an existing shared memory block without copying it.
+
+        Positional arguments:
+        name (str) -- name of the shared memory block
+        size (int) -- number of measures in the block
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- angle unit of the measures
+        dtype (str or dtype) [float64] -- storage precision of the measures
+        """
+
+        # Attach without tracking where supported (Python 3.13+), since the
+        # creating process owns the block
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+
+        out = cls.__new__(cls)
+        out._setup(np.ndarray((int(size),), _get_dtype(dtype), shm.buf),
+                   get_unit(mod))
+        out._shm = shm
+        out.name = shm.name
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def create_file(cls, path, angles, mod=None, dtype=None):
+        """SharedAngleArray.create_file(path, angles[, mod[, dtype]])
+            -> SharedAngleArray
+        Writes headings to a new raw file, and maps it into memory.
+
+        Positional arguments:
+        path (str) -- path of the file to create (overwriting any existing
+            file)
+        angles (AngleArray, iterable, or array-like) -- headings
+
+        Keyword arguments:
+        mod (str or float) [None] -- unit of float headings, and of the file
+            (defaults to radians for floats, and to the headings' own unit
+            otherwise)
+        dtype (str or dtype) [None] -- storage precision of the file
+            (defaults to that of an AngleArray, and to float64 otherwise)
+
+        The file holds the normalized measures as raw native-endian float64
+        (or float32) values, with no header, so its unit and precision must
+        be given again when it is opened. The returned SharedAngleArray maps
+        the file for reading and writing.
+        """
+
+        a = _as_angle_array(angles, mod)
+        if dtype is not None and _get_dtype(dtype) != a.dtype:
+            a = AngleArray(a.measure, a.mod, dtype)
+        a.measure.tofile(path)
+
+        return cls.open_file(path, a.mod, "r+", a.dtype)
+
+    #-------------------------------------------------------------------------
+
+    @classmethod
+    def open_file(cls, path, mod="radians", mode="r", dtype=np.float64):
+        """SharedAngleArray.open_file(path[, mod[, mode[, dtype]]])
+            -> SharedAngleArray
+        Maps an existing raw file of measures into memory without reading
+        it.
+
+        Positional arguments:
+        path (str) -- path of a file written by create_file()
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- angle unit of the measures
+        mode (str) ["r"] -- "r" for read-only access, "r+" to also allow
+            in-place updates, or "c" for copy-on-write
+        dtype (str or dtype) [float64] -- storage precision of the measures
+
+        The measures are assumed to be normalized already. Pages of the file
+        are only read as they are accessed, so the file may be larger than
+        the available memory.
+        """
+
+        if mode not in ("r", "r+", "c"):
+            raise ValueError("mode must be 'r', 'r+', or 'c'")
+        out = cls.__new__(cls)
+        out._setup(np.memmap(path, _get_dtype(dtype), mode), get_unit(mod))
+        out._mode = mode
+        out.path = str(path)
+
+        return out
+
+    #-------------------------------------------------------------------------
+
+    def __reduce__(self):
+        """Pickles the SharedAngleArray by reference to its buffer."""
+
+        if self.path is not None:
+            return (_reopen, (self.path, self.mod, self._mode,
+                              self.dtype.name))
+
+        return (_attach, (self.name, len(self._measure), self.mod,
+                          self.dtype.name))
+
+    #-------------------------------------------------------------------------
+
+    def __enter__(self):
+        """Returns this SharedAngleArray as a context manager."""
+
+        return self
+
+    #-------------------------------------------------------------------------
+
+    def __exit__(self, *args):
+        """Closes this process's mapping on leaving a with block."""
+
+        self.close()
+
+    #-------------------------------------------------------------------------
+
+    @property
+    def measure(self):
+        """SharedAngleArray.measure() -> ndarray
+        Retrieves normalized angle measures, as a view of the shared buffer.
+        """
+
+        return self._measure
+
+    #-------------------------------------------------------------------------
+
+    @measure.setter
+    def measure(self, value):
+        """SharedAngleArray.measure(value) -> None
+        Overwrites the angle measures in the shared buffer, then
+        automatically normalizes.
+
+        Positional arguments:
+        value (array-like) -- new angle measures, broadcastable to the
+            SharedAngleArray's length
+        """
+
+        self._measure[...] = _normalize(value, self.mod, self.dtype)
+
+    #=========================================================================
+    # Buffer Management
+    #=========================================================================
+
+    def flush(self):
+        """SharedAngleArray.flush() -> None
+        Writes any changes to a memory-mapped file back to disk.
+        """
+
+        if self.path is not None and self._mode == "r+":
+            self._measure.flush()
+
+    #-------------------------------------------------------------------------
+
+    def close(self):
+        """SharedAngleArray.close() -> None
+        Releases this process's mapping of the buffer.
+
+        The SharedAngleArray cannot be used afterwards. Any views of its
+        measures must be released first.
+        """
+
+        self.flush()
+        self._measure = np.empty(0, self.dtype)
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    #-------------------------------------------------------------------------
+
+    def unlink(self):
+        """SharedAngleArray.unlink() -> None
+        Destroys the shared memory block.
+
+        This should be called once, by the process which created the block,
+        after every process has finished with it. It has no effect for
+        memory-mapped files.
+        """
+
+        if self.name is not None:
+            if self._shm is not None:
+                self._shm.unlink()
+            else:
+                shared_memory.SharedMemory(name=self.name).unlink()
@@ -0,0 +1,281 @@
+"""Defines a streaming accumulator for circular statistics of Angles."""
+
+from ._version import __author__, __version__
+
+import math
+import sys
+
+from .angles import Angle
+from .units import get_unit
+
+#=============================================================================
+# AngleStats Class
+#=============================================================================
+
+class AngleStats:
+    """An online accumulator for circular statistics of headings.
+
+    Averaging Angle measures directly gives wrong results for headings which
+    straddle the -1/2 / +1/2 revolution seam. This class instead accumulates
+    the sums of the cosines and sines of the headings, which requires only
+    constant memory regardless of the number of headings ingested, and from
+    which the usual circular statistics can be computed at any time.
+
+    Two accumulators (e.g. built in separate worker processes) can be
+    combined with AngleStats.merge(), with the same result as a single
+    accumulator which ingested both streams. The running sums use compensated
+    summation, which keeps the rounding error small, so results for a stream
+    split in different ways agree to within rounding (but are not always
+    bitwise identical).
+
+    An AngleStats object has the following public attributes:
+        count (int) -- number of headings ingested
+        mod (float) -- the measure of one full revolution for results
+        unit (str) -- string version of the results' unit
+
+    The following statistics are available:
+        mean() -- circular mean heading, as an Angle
+        resultant() -- mean resultant length, between 0.0 and 1.0
+        variance() -- circular variance, between 0.0 and 1.0
+        std() -- circular standard deviation, as a float in the results' unit
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, mod="radians"):
+        """AngleStats([mod]) -> AngleStats
+        AngleStats constructor.
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- unit of the results, and the
+            default unit of float headings, given in any form accepted by
+            the Angle constructor
+        """
+
+        # Look up the unit once in the registry
+        unit = get_unit(mod)
+        self.mod = unit.mod
+        self.unit = unit.name
+        self._template = Angle(0.0, unit.mod) # template for results
+
+        # Initialize the running sums, with compensation terms
+        self.count = 0 # number of headings ingested
+        self._cos = 0.0 # sum of cosines
+        self._cos_c = 0.0
+        self._sin = 0.0 # sum of sines
+        self._sin_c = 0.0
+
+    #-------------------------------------------------------------------------
+
+    def __str__(self):
+        """str(AngleStats) -> str
+        AngleStats string conversion.
+
+        Returns the number of headings and their circular mean.
+        """
+
+        if self.count == 0 or self.resultant() == 0.0:
+            return "n = " + str(self.count)
+        return "n = " + str(self.count) + ", mean = " + str(self.mean())
+
+    #-------------------------------------------------------------------------
+
+    def _accumulate(self, c, s, n):
+        """AngleStats._accumulate(c, s, n) -> None
+        Adds partial sums to the running sums.
+
+        Positional arguments:
+        c (float) -- sum of cosines to add
+        s (float) -- sum of sines to add
+        n (int) -- number of headings represented by the sums
+
+        This is a private method which applies Neumaier's compensated
+        summation to both running sums.
+        """
+
+        # Cosine sum
+        t = self._cos + c
+        if abs(self._cos) >= abs(c):
+            self._cos_c += (self._cos - t) + c
+        else:
+            self._cos_c += (c - t) + self._cos
+        self._cos = t
+
+        # Sine sum
+        t = self._sin + s
+        if abs(self._sin) >= abs(s):
+            self._sin_c += (self._sin - t) + s
+        else:
+            self._sin_c += (s - t) + self._sin
+        self._sin = t
+
+        self.count += n
+
+    #=========================================================================
+    # Ingestion Methods
+    #=========================================================================
+
+    def add(self, angle, mod=None):
+        """AngleStats.add(angle[, mod]) -> None
+        Ingests a single heading.
+
+        Positional arguments:
+        angle (Angle or float) -- heading to ingest
+
+        Keyword arguments:
+        mod (str or float) [None] -- unit of a float heading (defaults to
+            this accumulator's unit)
+        """
+
+        # Use an Angle's cached cosine and sine
+        if isinstance(angle, Angle) == True:
+            self._accumulate(*angle.unit_vector, 1)
+            return
+
+        # Otherwise get the heading in radians
+        if mod is None:
+            theta = float(angle)*(2*math.pi/self.mod)
+        else:
+            theta = float(angle)*(2*math.pi/get_unit(mod).mod)
+
+        self._accumulate(math.cos(theta), math.sin(theta), 1)
+
+    #-------------------------------------------------------------------------
+
+    def update(self, angles, mod=None):
+        """AngleStats.update(angles[, mod]) -> None
+        Ingests a batch of headings.
+
+        Positional arguments:
+        angles (iterable or AngleArray) -- headings to ingest, as Angles,
+            floats, or a single AngleArray
+
+        Keyword arguments:
+        mod (str or float) [None] -- unit of float headings (defaults to this
+            accumulator's unit)
+
+        An AngleArray is ingested with a single vectorized pass. Any other
+        iterable is consumed one element at a time, so generators can be
+        streamed without being materialized.
+        """
+
+        # Ingest an AngleArray in one vectorized pass
+        arrays = sys.modules.get(__package__ + ".arrays")
+        if arrays is not None and isinstance(angles, arrays.AngleArray):
+            np = arrays.np
+            theta = np.multiply(angles.measure, 2*math.pi/angles.mod,
+                                dtype=np.float64)
+            self._accumulate(float(np.cos(theta).sum()),
+                             float(np.sin(theta).sum()), theta.size)
+            return
+
+        # Otherwise fall back on a scalar scan
+        if mod is None:
+            scale = 2*math.pi/self.mod
+        else:
+            scale = 2*math.pi/get_unit(mod).mod
+        for a in angles:
+            if isinstance(a, Angle) == True:
+                theta = a._measure*(2*math.pi/a.mod)
+            else:
+                theta = float(a)*scale
+            self._accumulate(math.cos(theta), math.sin(theta), 1)
+
+    #-------------------------------------------------------------------------
+
+    def merge(self, other):
+        """AngleStats.merge(other) -> AngleStats
+        Merges another accumulator into this one.
+
+        Positional arguments:
+        other (AngleStats) -- accumulator to merge
+
+        Returns this accumulator, which afterwards represents the union of
+        both accumulators' headings. The two accumulators may use different
+        units.
+        """
+
+        self._accumulate(other._cos, other._sin, other.count)
+        self._accumulate(other._cos_c, other._sin_c, 0)
+
+        return self
+
+    #=========================================================================
+    # Statistics
+    #=========================================================================
+
+    def _sums(self):
+        """AngleStats._sums() -> tuple
+        Returns the compensated sums of cosines and sines.
+        """
+
+        return (self._cos + self._cos_c, self._sin + self._sin_c)
+
+    #-------------------------------------------------------------------------
+
+    def resultant(self):
+        """AngleStats.resultant() -> float
+        Returns the mean resultant length of the headings.
+
+        The mean resultant length is the length of the average of the
+        headings' unit vectors. It ranges from 0.0 (for headings spread
+        evenly in all directions) to 1.0 (for identical headings).
+        """
+
+        if self.count == 0:
+            raise ValueError("no headings have been ingested")
+        c, s = self._sums()
+
+        return min(math.hypot(c, s)/self.count, 1.0)
+
+    #-------------------------------------------------------------------------
+
+    def mean(self):
+        """AngleStats.mean() -> Angle
+        Returns the circular mean of the headings.
+
+        The result is the direction of the sum of the headings' unit vectors,
+        as an Angle in this accumulator's unit. A ValueError is raised if no
+        headings have been ingested, or if the headings cancel out exactly
+        so that no mean direction is defined.
+        """
+
+        if self.count == 0:
+            raise ValueError("no headings have been ingested")
+        c, s = self._sums()
+        if c == 0.0 and s == 0.0:
+            raise ValueError("mean direction is undefined")
+
+        return self._template._new(math.atan2(s, c)*(self.mod/(2*math.pi)))
+
+    #-------------------------------------------------------------------------
+
+    def variance(self):
+        """AngleStats.variance() -> float
+        Returns the circular variance of the headings.
+
+        The circular variance is one minus the mean resultant length, ranging
+        from 0.0 for identical headings to 1.0 for maximally spread headings.
+        """
+
+        return 1.0 - self.resultant()
+
+    #-------------------------------------------------------------------------
+
+    def std(self):
+        """AngleStats.std() -> float
+        Returns the circular standard deviation of the headings.
+
+        The circular standard deviation is sqrt(-2 ln R), where R is the
+        mean resultant length. It is returned as a float in this
+        accumulator's unit rather than as an Angle, since it may exceed half
+        of a revolution (and is infinite when R is 0).
+        """
+
+        r = self.resultant()
+        if r == 0.0:
+            return math.inf
+
+        return math.sqrt(-2*math.log(r))*(self.mod/(2*math.pi))
@@ -0,0 +1,115 @@
+"""Defines batched shortest-turn and turn-rate-limited steering for Angles."""
+
+from ._version import __author__, __version__
+
+import numpy as np
+
+from .angles import Angle
+from .arrays import _as_angle_array, _normalize_inplace
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _turn(current, target, mod):
+    """_turn(current, target, mod) -> tuple
+    Computes the shortest rotations from current to target headings.
+
+    Positional arguments:
+    current (AngleArray, iterable, or array-like) -- current headings
+    target (Angle, AngleArray, iterable, or array-like) -- target headings
+    mod (str or float) -- unit of float headings, or None
+
+    Returns the current headings as an AngleArray, the target measures in
+    its unit, and the normalized differences between them as a float64
+    array.
+    """
+
+    c = _as_angle_array(current, mod)
+    if isinstance(target, Angle) == False:
+        target = _as_angle_array(target, mod)
+    t = c._get_other_measure(target)
+
+    # Normalize the differences in place, as Angle subtraction would
+    delta = np.subtract(t, c.measure, dtype=np.float64)
+    _normalize_inplace(delta, c.mod)
+
+    return c, t, delta
+
+#=============================================================================
+# Steering
+#=============================================================================
+
+def shortest_turn(current, target, mod=None):
+    """shortest_turn(current, target[, mod]) -> tuple
+    Finds the shortest rotation from each current heading to its target.
+
+    Positional arguments:
+    current (AngleArray, iterable, or array-like) -- current headings
+    target (Angle, AngleArray, iterable, or array-like) -- a single target
+        heading for every current heading, or one target per heading
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians), and of AngleArrays or sequences of Angles given as the
+        current headings (defaults to their own unit)
+
+    Returns a tuple (rotation, ccw) of arrays. Each element of rotation is
+    the signed shortest rotation (as a float in the current headings' unit)
+    which carries the current heading onto the target, equal to the measure
+    of target - current. Each element of ccw is True if and only if that
+    rotation is counterclockwise, which matches target > current for the
+    corresponding Angles. By the package's tie rule for diametrically
+    opposed headings (the caller is greater), the rotation to an opposed
+    target is a counterclockwise half revolution. Equal headings give a
+    rotation of 0.0 and a ccw value of False.
+    """
+
+    c, t, delta = _turn(current, target, mod)
+
+    return delta, delta > 0
+
+#-----------------------------------------------------------------------------
+
+def steer(current, target, max_turn=None, mod=None):
+    """steer(current, target[, max_turn[, mod]]) -> tuple
+    Turns each current heading toward its target at a limited rate.
+
+    Positional arguments:
+    current (AngleArray, iterable, or array-like) -- current headings
+    target (Angle, AngleArray, iterable, or array-like) -- a single target
+        heading for every current heading, or one target per heading
+
+    Keyword arguments:
+    max_turn (float or array-like) [None] -- largest rotation allowed in a
+        single step, as a nonnegative measure in the current headings' unit,
+        either for every heading or one per heading (None for no limit)
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians), and of AngleArrays or sequences of Angles given as the
+        current headings (defaults to their own unit)
+
+    Returns a tuple (rotation, ccw, headings). The arrays rotation and ccw
+    are as returned by shortest_turn(). Each new heading is the current
+    heading turned along its shortest rotation, by at most max_turn.
+    Headings which can reach their targets within max_turn are set to their
+    targets exactly. The new headings are returned as an AngleArray with the
+    unit and storage precision of the current headings. Everything is
+    computed with a few whole-array passes, from a single normalized
+    difference per heading.
+    """
+
+    c, t, delta = _turn(current, target, mod)
+    ccw = delta > 0
+
+    # Without a limit, every heading reaches its target
+    if max_turn is None:
+        return delta, ccw, c._new(np.broadcast_to(t, delta.shape))
+
+    # Otherwise clip each rotation to the allowed turn
+    limit = np.asarray(max_turn, dtype=np.float64)
+    if (limit < 0).any():
+        raise ValueError("maximum turn must be nonnegative")
+    step = np.clip(delta, -limit, limit)
+    headings = np.where(np.abs(delta) <= limit, t, c.measure + step)
+
+    return delta, ccw, c._new(headings)
@@ -0,0 +1,169 @@
+"""Defines streaming readers and writers for text files of headings."""
+
+from ._version import __author__, __version__
+
+import itertools
+import os
+import sys
+
+from .angles import Angle
+from .units import get_unit
+
+#=============================================================================
+# Helper Functions
+#=============================================================================
+
+def _open(target, mode):
+    """_open(target, mode) -> tuple
+    Gets a file object for a path or an already open file.
+
+    Returns the file object, and whether it was opened here (and so should
+    be closed when finished).
+    """
+
+    if isinstance(target, (str, bytes, os.PathLike)) == True:
+        return open(target, mode, newline=""), True
+    return target, False
+
+#=============================================================================
+# Reading
+#=============================================================================
+
+def read_headings(source, mod="degrees", column=None, delimiter=",",
+                  chunk_size=65536, arrays=False):
+    """read_headings(source[, mod[, column[, delimiter[, chunk_size[,
+        arrays]]]]]) -> generator
+    Streams headings from a text or CSV file.
+
+    Positional arguments:
+    source (str, path, or file) -- path of the file to read, or an open
+        text file-like object
+
+    Keyword arguments:
+    mod (str or float) ["degrees"] -- unit of the stored measures, accepting
+        the same values as the Angle constructor
+    column (int or str) [None] -- field which holds the measures; None for
+        one measure per line, an int for a zero-based field index, or a str
+        for a field name given by the first (header) line
+    delimiter (str) [","] -- field separator, used if column is given
+    chunk_size (int) [65536] -- number of lines parsed and normalized at once
+    arrays (bool) [False] -- whether to yield one AngleArray per chunk
+        (requires NumPy) rather than individual Angles
+
+    The file is read lazily one chunk at a time, so memory use is bounded by
+    the chunk size regardless of the file size. Blank lines are skipped.
+    Fields are split on the delimiter directly, without CSV quoting rules.
+    """
+
+    unit = get_unit(mod)
+    template = Angle(0.0, unit)
+    if arrays == True:
+        import numpy as np
+        from .arrays import AngleArray
+    f, owned = _open(source, "r")
+    try:
+        lines = iter(f)
+
+        # Locate a named column in the header line
+        if isinstance(column, str) == True:
+            header = next(lines, "").rstrip("\r\n").split(delimiter)
+            try:
+                column = [h.strip() for h in header].index(column)
+            except ValueError:
+                raise ValueError("column " + repr(column) + " not found")
+
+        # Parse and normalize one chunk of lines at a time
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if len(chunk) == 0:
+                break
+            if column is None:
+                fields = [s for s in chunk if not s.isspace() and s != ""]
+            else:
+                fields = [s.split(delimiter)[column] for s in chunk
+                          if not s.isspace() and s != ""]
+            if arrays == True:
+                yield AngleArray(np.array(fields, dtype=float), unit)
+            else:
+                for s in fields:
+                    yield template._new(float(s))
+    finally:
+        if owned == True:
+            f.close()
+
+#=============================================================================
+# Writing
+#=============================================================================
+
+def write_headings(target, angles, mod=None, chunk_size=65536):
+    """write_headings(target, angles[, mod[, chunk_size]]) -> int
+    Writes normalized headings to a text file, one measure per line.
+
+    Positional arguments:
+    target (str, path, or file) -- path of the file to write, or an open
+        text file-like object (which is appended to)
+    angles (iterable) -- headings to write, as Angles, AngleArrays, or an
+        iterable of AngleArrays (such as read_headings() yields)
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit in which to write the measures
+        (defaults to the unit of each heading)
+    chunk_size (int) [65536] -- number of individual Angles buffered per
+        write
+
+    Measures are written in their shortest round-trip form, normalized to
+    lie within (-1/2,1/2] full revolutions. The measures of float32
+    AngleArrays are written in the shortest form which reads back as the
+    same float32 value (so 0.1 is written as 0.1, not as its float64
+    widening 0.10000000149011612). Returns the number of headings written.
+    """
+
+    if mod is not None:
+        template = Angle(0.0, mod)
+        new = template.mod
+    else:
+        new = None
+    arrays = sys.modules.get(__package__ + ".arrays")
+    if arrays is not None and isinstance(angles, arrays.AngleArray):
+        angles = [angles]
+    f, owned = _open(target, "w")
+    count = 0
+    try:
+        buffer = []
+        for a in itertools.chain(angles, [None]):
+            # Flush the buffer when it fills, before an array, or at the end
+            if len(buffer) >= chunk_size or not isinstance(a, Angle):
+                if len(buffer) > 0:
+                    f.write("\n".join(buffer) + "\n")
+                    count += len(buffer)
+                    buffer = []
+            if a is None:
+                break
+
+            # Convert single Angles into the buffer
+            if isinstance(a, Angle) == True:
+                if new is not None and new != a.mod:
+                    a = template._new(a._measure*(new/a.mod))
+                buffer.append(repr(a.measure))
+                continue
+
+            # Write whole AngleArrays at once (converting into a plain
+            # AngleArray, since a.__class__ may own a shared memory block)
+            if new is not None and new != a.mod:
+                from .arrays import AngleArray
+                a = AngleArray(a.measure.astype("float64")*(new/a.mod), new,
+                               a.dtype)
+            if len(a) > 0:
+                # Write float32 measures in their own shortest round-trip
+                # form, rather than that of their float64 widening
+                if a.measure.dtype.name == "float32":
+                    text = map(str, a.measure)
+                else:
+                    text = map(repr, a.measure.tolist())
+                f.write("\n".join(text) + "\n")
+                count += len(a)
+    finally:
+        if owned == True:
+            f.close()
+
+    return count
@@ -0,0 +1,245 @@
+"""Defines heading unwrapping, interpolation, and resampling for series."""
+
+from ._version import __author__, __version__
+
+from .angles import Angle, _normalize
+
+#=============================================================================
+# Unwrapper Class
+#=============================================================================
+
+class Unwrapper:
+    """A streaming heading unwrapper.
+
+    Unwrapping is the inverse of normalization. Each heading is replaced by
+    a continuous measure of the total rotation so far, which differs from
+    the previous unwrapped measure by the shortest rotation between the two
+    headings, and from the heading itself by a whole number of revolutions.
+    The first heading is left as it is.
+
+    An Unwrapper object has the following public attributes:
+        mod (float) -- the measure of one full revolution
+        turns (int) -- number of full revolutions added to the latest
+            heading
+        unit (str) -- string version of the unwrapper's unit
+
+    Headings are given as Angles (which are converted to the unwrapper's
+    unit) or floats (which are assumed to already match the unwrapper's
+    unit). As for Angle comparisons, a step to a diametrically opposed
+    heading is taken to be a counterclockwise half revolution.
+    """
+
+    #=========================================================================
+    # Technical Methods
+    #=========================================================================
+
+    def __init__(self, mod="radians"):
+        """Unwrapper([mod]) -> Unwrapper
+        Unwrapper constructor.
+
+        Keyword arguments:
+        mod (str or float) ["radians"] -- angle unit, or measure of one full
+            revolution, accepting the same values as the Angle constructor
+        """
+
+        # Parse the unit once through a template Angle
+        self._template = Angle(0.0, mod)
+        self.mod = self._template.mod
+        self.unit = self._template.unit
+
+        # Latest normalized measure, and the revolutions added to it
+        self._last = None
+        self.turns = 0
+
+    #-------------------------------------------------------------------------
+
+    def update(self, angle):
+        """Unwrapper.update(angle) -> float
+        Ingests a heading, and returns its unwrapped measure.
+
+        Positional arguments:
+        angle (Angle or float) -- newest heading
+        """
+
+        m = _normalize(self._template._get_other_measure(angle), self.mod)
+
+        # Count the revolutions crossed by the shortest step
+        if self._last is not None:
+            step = _normalize(m - self._last, self.mod)
+            self.turns += round((self._last + step - m)/self.mod)
+        self._last = m
+
+        return m + self.turns*self.mod
+
+#=============================================================================
+# Streaming Resampling
+#=============================================================================
+
+def resample_stream(samples, times, mod="radians"):
+    """resample_stream(samples, times[, mod]) -> generator
+    Lazily resamples a heading time series onto new timestamps.
+
+    Positional arguments:
+    samples (iterable) -- (time, heading) pairs in order of strictly
+        increasing time, with headings given as Angles or floats
+    times (iterable) -- new timestamps, in increasing order
+
+    Keyword arguments:
+    mod (str or float) ["radians"] -- unit of float headings, and of the
+        results
+
+    Yields one Angle per new timestamp, interpolated linearly along the
+    shortest arc between the samples on either side of it, as resample()
+    does. Timestamps before the first sample give the first heading.
+    Timestamps after the last sample end the stream, since a later sample
+    could still change them, so both iterables may be unbounded. Only two
+    samples are held at a time.
+    """
+
+    template = Angle(0.0, mod)
+    samples = iter(samples)
+    t0 = t1 = None
+    for t in times:
+        # Advance until the sample interval contains the timestamp
+        while t1 is None or t > t1:
+            try:
+                t2, a = next(samples)
+            except StopIteration:
+                return
+            m = _normalize(template._get_other_measure(a), template.mod)
+            if t1 is None:
+                m1 = m
+            elif t2 <= t1:
+                raise ValueError("sample times must be strictly increasing")
+            t0, m0, t1, m1 = t1, m1, t2, m
+
+        # Interpolate along the shortest arc
+        if t0 is None or t <= t0:
+            yield template._new(m1 if t0 is None else m0)
+        else:
+            step = _normalize(m1 - m0, template.mod)
+            yield template._new(m0 + step*((t - t0)/(t1 - t0)))
+
+#=============================================================================
+# Batch Functions
+#=============================================================================
+
+def unwrap(angles, mod=None):
+    """unwrap(angles[, mod]) -> ndarray
+    Returns the unwrapped measures of a series of headings.
+
+    Positional arguments:
+    angles (AngleArray, iterable, or array-like) -- headings, in order
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians), and of the result for AngleArrays or sequences of Angles
+        (defaults to their own unit)
+
+    Returns a float64 array of continuous measures, as Unwrapper.update()
+    would return for each heading. Each element differs from the normalized
+    heading by an exact whole number of revolutions, so building an
+    AngleArray from the result in the same unit normalizes it back to the
+    original headings (to within rounding). Computed in a few vectorized
+    passes, and requires NumPy.
+    """
+
+    import numpy as np
+    from .arrays import _as_angle_array, _normalize_inplace
+    a = _as_angle_array(angles, mod)
+    m = np.asarray(a.measure, dtype=np.float64)
+    u = m.copy()
+    if m.size < 2:
+        return u
+
+    # Count the revolutions crossed by each shortest step
+    step = _normalize_inplace(np.diff(m), a.mod)
+    turns = np.rint((m[:-1] + step - m[1:])/a.mod)
+    u[1:] += np.cumsum(turns)*a.mod
+
+    return u
+
+#-----------------------------------------------------------------------------
+
+def interpolate(start, end, fraction, mod=None):
+    """interpolate(start, end, fraction[, mod]) -> Angle or AngleArray
+    Interpolates between pairs of headings along the shortest arc.
+
+    Positional arguments:
+    start (Angle, AngleArray, iterable, or array-like) -- starting headings
+    end (Angle, AngleArray, iterable, or array-like) -- ending headings
+    fraction (float or array-like) -- fraction of the way from each start
+        heading to its end heading (0.0 gives start, and 1.0 gives end)
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians), and of the result for AngleArrays or sequences of Angles
+        (defaults to the start headings' own unit)
+
+    Each result is start + fraction*(end - start), computed from the
+    normalized difference so that it follows the shortest arc (and a
+    counterclockwise half revolution for opposed headings). The arguments
+    are broadcast against each other following the usual NumPy rules, and
+    the result is computed with a few whole-array passes. Two single Angles
+    and a single fraction give a single Angle, and anything else gives an
+    AngleArray. Requires NumPy.
+    """
+
+    import numpy as np
+    from .arrays import _as_angle_array, _normalize_inplace
+    single = (isinstance(start, Angle) == True and
+              isinstance(end, Angle) == True and np.ndim(fraction) == 0)
+    a = _as_angle_array([start] if isinstance(start, Angle) else start, mod)
+    if isinstance(end, Angle) == False:
+        end = _as_angle_array(end, mod)
+
+    # Scale the normalized differences by the fractions
+    step = np.subtract(a._get_other_measure(end), a.measure,
+                       dtype=np.float64)
+    _normalize_inplace(step, a.mod)
+    step *= np.asarray(fraction, dtype=np.float64)
+    out = a._new(a.measure + step)
+
+    # Two single Angles give a single Angle
+    if single == True:
+        return out[0]
+
+    return out
+
+#-----------------------------------------------------------------------------
+
+def resample(times, angles, new_times, mod=None):
+    """resample(times, angles, new_times[, mod]) -> AngleArray
+    Resamples a heading time series onto new timestamps.
+
+    Positional arguments:
+    times (array-like) -- timestamps of the headings, in strictly increasing
+        order
+    angles (AngleArray, iterable, or array-like) -- headings, one per
+        timestamp
+    new_times (array-like) -- timestamps at which to sample the series
+
+    Keyword arguments:
+    mod (str or float) [None] -- unit of float headings (defaults to
+        radians), and of the result for AngleArrays or sequences of Angles
+        (defaults to their own unit)
+
+    Each result is interpolated linearly along the shortest arc between the
+    headings at the timestamps on either side of it. Timestamps outside of
+    the series give its first or last heading. The series is unwrapped,
+    interpolated, and normalized again in a few vectorized passes, so no
+    per-sample objects are created. Requires NumPy.
+    """
+
+    import numpy as np
+    from .arrays import _as_angle_array
+    a = _as_angle_array(angles, mod)
+    t = np.asarray(times, dtype=np.float64)
+    if t.shape != a.measure.shape or t.ndim != 1:
+        raise ValueError("there must be one timestamp per heading")
+    if t.size == 0:
+        raise ValueError("no headings given")
+    if (np.diff(t) <= 0).any():
+        raise ValueError("sample times must be strictly increasing")
+
+    return a._new(np.interp(new_times, t, unwrap(a)))
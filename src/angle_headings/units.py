@@ -0,0 +1,245 @@
+"""Defines the registry of angle units used by the Angle class."""
+
+from ._version import __author__, __version__
+
+import math
+
+#=============================================================================
+# Unit Class
+#=============================================================================
+
+class Unit:
+    """An interned descriptor for a unit of angle measure.
+
+    A Unit object has two public attributes:
+        name (str) -- string version of the unit, used as Angle.unit
+        mod (float) -- the measure of one full revolution
+
+    Named units are interned by the registry, so each registered name or mod
+    maps to a single shared Unit object. Units for other numerical mods are
+    built on demand, and are not interned. Units should be obtained through
+    get_unit() or register_unit() rather than constructed directly.
+    """
+
+    __slots__ = ("name", "mod")
+
+    def __init__(self, name, mod):
+        """Unit(name, mod) -> Unit
+        Unit constructor.
+
+        Positional arguments:
+        name (str) -- string version of the unit
+        mod (float) -- measure of one full revolution
+        """
+
+        self.name = name
+        self.mod = mod
+
+    #-------------------------------------------------------------------------
+
+    def __repr__(self):
+        """repr(Unit) -> str
+        Unit representation.
+        """
+
+        return "Unit(" + repr(self.name) + ", " + repr(self.mod) + ")"
+
+    #-------------------------------------------------------------------------
+
+    def __reduce__(self):
+        """Pickles the Unit by its name and mod.
+
+        Unpickling returns the interned Unit with the same name and mod,
+        registering a named unit which the receiving process does not know
+        yet, or an anonymous Unit for an unregistered mod. Since pickle
+        memoizes each object, a sequence of Angles sharing a registered Unit
+        stores it only once.
+        """
+
+        return (_restore_unit, (self.name, self.mod))
+
+#=============================================================================
+# Registry
+#=============================================================================
+
+# Map from unit name strings and full revolution measures to interned Units
+_registry = {}
+
+# Names, aliases, and mods of the built-in units (filled in once they are
+# registered, at the end of this module)
+_builtin = set()
+
+#-----------------------------------------------------------------------------
+
+def register_unit(name, mod, aliases=(), override=False):
+    """register_unit(name, mod[, aliases[, override]]) -> Unit
+    Registers a named unit of angle measure.
+
+    Positional arguments:
+    name (str) -- string version of the unit, used as Angle.unit
+    mod (float) -- measure of one full revolution
+
+    Keyword arguments:
+    aliases (iterable) [()] -- additional strings which should be accepted
+        as this unit's name
+    override (bool) [False] -- whether the unit may replace a built-in unit
+
+    Once registered, the name and all aliases are accepted anywhere the
+    Angle class accepts a unit name string, and any Angle whose full
+    revolution equals mod uses name as its unit string. Returns the interned
+    Unit. For example:
+        register_unit("mil", 6400.0, ("mils",))
+        register_unit("bam", 65536.0)
+        register_unit("hour", 24.0, ("hours", "h"))
+
+    Since registration changes the meaning of names process-wide, a unit
+    whose name, aliases, or mod match those of a built-in unit (radians,
+    degrees, or gradians) raises a ValueError unless override is True.
+    Custom units may be registered again to replace them.
+    """
+
+    # Validate the full revolution measure
+    mod = abs(float(mod))
+    if mod <= 0.0:
+        raise ValueError("measure of full revolution must be positive")
+
+    # Refuse to silently replace a built-in unit
+    name = str(name)
+    aliases = [str(a) for a in aliases]
+    if override == False:
+        for key in [name, mod] + aliases:
+            if key in _builtin:
+                raise ValueError("unit " + repr(key) + " conflicts with a "
+                                 "built-in unit (pass override=True to "
+                                 "replace it)")
+
+    # Intern the unit under its mod, name, and aliases
+    unit = Unit(name, mod)
+    _registry[mod] = unit
+    _registry[unit.name] = unit
+    for a in aliases:
+        _registry[a] = unit
+
+    return unit
+
+#-----------------------------------------------------------------------------
+
+def _restore_unit(name, mod):
+    """_restore_unit(name, mod) -> Unit
+    Returns the interned Unit for a pickled Unit.
+    """
+
+    unit = _registry.get(name)
+    if unit is not None and unit.mod == mod:
+        return unit
+    if unit is None and mod not in _registry and not name.startswith("/ "):
+        return register_unit(name, mod)
+
+    return get_unit(mod)
+
+#-----------------------------------------------------------------------------
+
+def get_unit(mod):
+    """get_unit(mod) -> Unit
+    Returns the interned Unit for a unit name or full revolution measure.
+
+    Positional arguments:
+    mod (str, float, or Unit) -- angle unit, or measure of one full
+        revolution
+
+    Strings must be registered unit names or aliases. Numbers are treated as
+    the measure of a full revolution, and use the registered unit with the
+    same measure if there is one. Otherwise a new anonymous Unit is built
+    for them, which is not interned, so that arbitrary numerical mods never
+    accumulate in the registry. Raises a ValueError for unrecognized strings
+    or nonpositive measures.
+    """
+
+    # Use a registered or previously interned unit if possible
+    try:
+        return _registry[mod]
+    except (KeyError, TypeError):
+        pass
+    if isinstance(mod, Unit) == True:
+        return mod
+
+    # Otherwise attempt to parse numerical mod argument
+    if isinstance(mod, str) == True:
+        raise ValueError("unrecognized unit name string")
+    value = abs(float(mod))
+    if value <= 0.0:
+        raise ValueError("measure of full revolution must be positive")
+    unit = _registry.get(value)
+    if unit is None:
+        unit = Unit("/ " + str(value), value)
+
+    return unit
+
+#-----------------------------------------------------------------------------
+
+def convert_many(values, from_mod, to_mod="radians"):
+    """convert_many(values, from_mod[, to_mod]) -> list
+    Converts a sequence of measures into a different unit.
+
+    Positional arguments:
+    values (iterable) -- measures, as floats or Angles
+    from_mod (str, float, or Unit) -- unit of float measures
+    to_mod (str, float, or Unit) ["radians"] -- unit to convert to
+
+    Both units are parsed once for the whole sequence. Each result matches
+    the value of Angle(value, from_mod).convert(to_mod). Angles in the
+    sequence are converted from their own units. Sequences of floats are
+    converted by the batch backend (see angle_headings.backend).
+    """
+
+    from .angles import Angle, _normalize
+    from .backend import get_backend
+
+    # Parse both units once
+    old = get_unit(from_mod).mod
+    new = get_unit(to_mod).mod
+
+    # Convert plain measures with the batch backend
+    values = list(values)
+    if not any(isinstance(v, Angle) for v in values):
+        return get_backend(len(values)).convert(values, old, new)
+
+    # Otherwise normalize and convert each measure
+    out = []
+    for v in values:
+        if isinstance(v, Angle) == True:
+            out.append(((v._measure/v.mod) % 1.0)*new)
+        else:
+            out.append(((_normalize(float(v), old)/old) % 1.0)*new)
+
+    return out
+
+#-----------------------------------------------------------------------------
+
+def normalize_many(values, mod="radians"):
+    """normalize_many(values[, mod]) -> list
+    Normalizes a sequence of measures.
+
+    Positional arguments:
+    values (iterable) -- float measures
+    mod (str, float, or Unit) ["radians"] -- unit of the measures
+
+    Each result matches the value of Angle(value, mod).measure, normalized
+    to lie within (-1/2,1/2] full revolutions. The unit is parsed once for
+    the whole sequence, which is normalized by the batch backend (see
+    angle_headings.backend).
+    """
+
+    from .backend import get_backend
+
+    values = list(values)
+
+    return get_backend(len(values)).normalize(values, get_unit(mod).mod)
+
+#-----------------------------------------------------------------------------
+
+# Built-in units
+register_unit("rad", 2*math.pi, ("radians", "radian", "rad", "r"))
+register_unit("deg", 360.0, ("degrees", "degree", "deg", "d"))
+register_unit("grad", 400.0, ("gradians", "gradian", "grad", "g"))
+_builtin.update(_registry)
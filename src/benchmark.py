@@ -0,0 +1,1225 @@
+"""Benchmark and correctness-check suite for the angle_headings package.
+
+This script times the package's hot paths and checks its fast paths against
+reference implementations of the scalar Angle semantics. It uses only the
+standard library (batched types are timed and checked only if NumPy is
+installed), and writes its results as JSON so that runs can be diffed
+between releases.
+
+Usage:
+    python benchmark.py [-n NUMBER] [-r REPEAT] [-o FILE] [-b BASELINE]
+                        [--checks-only]
+
+The cost of a fresh "import angle_headings" is also timed, in subprocesses,
+so that regressions in startup time show up against a baseline.
+
+If a baseline JSON file from an earlier run is given, each benchmark also
+reports its time relative to the baseline (values above 1.0 are slower).
+The exit status is nonzero if any correctness check fails.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import timeit
+
+import angle_headings
+from angle_headings import Angle
+
+#=============================================================================
+# Reference Implementations
+#=============================================================================
+
+# Full revolution measures of the built-in units
+MODS = {"rad": 2*math.pi, "deg": 360.0, "grad": 400.0}
+
+#-----------------------------------------------------------------------------
+
+def ref_normalize(value, mod):
+    """ref_normalize(value, mod) -> float
+    Reference copy of the original Angle.measure setter normalization.
+    """
+
+    if value < -mod/2 or value > mod/2:
+        value = ((value + (mod/2)) % mod) - (mod/2)
+    if value == -mod/2:
+        value = -value
+
+    return value
+
+#-----------------------------------------------------------------------------
+
+def ref_other(a, other):
+    """ref_other(a, other) -> float
+    Reference conversion of an Angle or float into a's unit.
+    """
+
+    if isinstance(other, Angle):
+        return other.measure*(a.mod/other.mod)
+    return float(other)
+
+#-----------------------------------------------------------------------------
+
+def close(x, y, mod, tol=1e-9):
+    """close(x, y, mod[, tol]) -> bool
+    Determines whether two measures agree, modulo a full revolution.
+    """
+
+    return abs(ref_normalize(x - y, mod)) <= tol*mod
+
+#-----------------------------------------------------------------------------
+
+def sample(n, mod, seed=0):
+    """sample(n, mod[, seed]) -> list
+    Returns reproducible random measures, including the seam endpoints.
+    """
+
+    rng = random.Random(seed)
+    out = [rng.uniform(-3*mod, 3*mod) for i in range(n)]
+    out += [mod/2, -mod/2, 0.0, mod, -mod, 1.5*mod, -1.5*mod]
+
+    return out
+
+#=============================================================================
+# Correctness Checks
+#=============================================================================
+
+# Registered checks, as (name, function) pairs
+CHECKS = []
+
+def check(f):
+    """Registers a correctness check."""
+
+    CHECKS.append((f.__name__[6:], f))
+    return f
+
+#-----------------------------------------------------------------------------
+
+def fresh_python(code):
+    """fresh_python(code) -> str
+    Runs code in a new interpreter which imports this copy of the package,
+    and returns its output.
+    """
+
+    path = os.path.dirname(os.path.dirname(angle_headings.__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [path] + [p for p in [env.get("PYTHONPATH")] if p])
+
+    return subprocess.check_output([sys.executable, "-c", code], env=env,
+                                   universal_newlines=True)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_normalization():
+    for unit, mod in MODS.items():
+        for x in sample(2000, mod):
+            a = Angle(x, unit)
+            assert a.measure == ref_normalize(x, mod), (unit, x)
+            assert -mod/2 < a.measure <= mod/2, (unit, x)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_operators():
+    for unit, mod in MODS.items():
+        xs = sample(500, mod, 1)
+        ys = sample(500, mod, 2)
+        for x, y in zip(xs, ys):
+            a = Angle(x, unit)
+            b = Angle(y, "deg")
+            for other in (b, y):
+                t = ref_other(a, other)
+                assert close((a + other).measure, a.measure + t, mod)
+                assert close((a - other).measure, a.measure - t, mod)
+                d = ref_normalize(a.measure - t, mod)
+                assert (a == other) == (d == 0)
+                assert (a != other) == (d != 0)
+                assert (a > other) == (d > 0)
+                assert (a < other) == (d < 0)
+                assert (a >= other) == (d >= 0)
+                assert (a <= other) == (d <= 0)
+                assert a.reldiff(other) == abs(d)/(mod/2)
+            assert (-a).measure == ref_normalize(-a.measure, mod)
+            assert (+a).measure == a.measure
+            assert (a*1.7).measure == ref_normalize(a.measure*1.7, mod)
+            assert (a/1.7).measure == ref_normalize(a.measure/1.7, mod)
+            assert (a//0.7).measure == ref_normalize(a.measure//0.7, mod)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_inplace():
+    for unit, mod in MODS.items():
+        for x, y in zip(sample(500, mod, 3), sample(500, mod, 4)):
+            a = Angle(x, unit)
+            b = Angle(y, "grad")
+            c = +a
+            c += b
+            c -= y
+            c *= 1.3
+            c /= 0.9
+            assert c.measure == (((a + b) - y)*1.3/0.9).measure
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_convert():
+    for unit, mod in MODS.items():
+        xs = sample(500, mod, 5)
+        conv = angle_headings.convert_many(xs, unit, "deg")
+        for x, c in zip(xs, conv):
+            a = Angle(x, unit)
+            assert c == a.convert("deg")
+            assert close(a.convert("deg"), a.measure*360.0/mod, 360.0)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_relkey():
+    ref = Angle(170.0, "deg")
+    key = ref.relkey()
+    angles = [Angle(x, "deg") for x in sample(500, 360.0, 6)]
+    for a in angles:
+        assert key(a) == ref_normalize(a.measure - ref.measure, 360.0)
+    ordered = sorted(angles, key=key)
+    for a, b in zip(ordered, ordered[1:]):
+        assert key(a) <= key(b)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_stats():
+    xs = sample(1000, 360.0, 7)
+    s = angle_headings.AngleStats("deg")
+    s.update(xs[:500])
+    t = angle_headings.AngleStats("rad")
+    t.update(Angle(x, "deg") for x in xs[500:])
+    s.merge(t)
+    c = sum(math.cos(math.radians(x)) for x in xs)
+    d = sum(math.sin(math.radians(x)) for x in xs)
+    assert close(s.mean().measure, math.degrees(math.atan2(d, c)), 360.0)
+    assert abs(s.resultant() - math.hypot(c, d)/len(xs)) < 1e-12
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_filters():
+    from angle_headings import filters
+    xs = [175.0 + x/36.0 for x in sample(2000, 360.0, 24)]
+    mean = filters.MovingMean(25, "deg")
+    smooth = filters.ExponentialSmoother(0.2, "deg")
+    median = filters.MovingMedian(25, "deg")
+    for i, x in enumerate(xs):
+        ref = xs[max(0, i - 24):i + 1]
+        c = sum(math.cos(math.radians(r)) for r in ref)
+        d = sum(math.sin(math.radians(r)) for r in ref)
+        assert close(mean.update(x).measure, math.degrees(math.atan2(d, c)),
+                     360.0)
+        assert close(median.update(Angle(x, "deg")).measure,
+                     sorted(ref)[len(ref)//2] if len(ref) % 2 == 1 else
+                     (sorted(ref)[len(ref)//2 - 1] +
+                      sorted(ref)[len(ref)//2])/2, 360.0)
+    s = Angle(xs[0], "deg")
+    for x in xs:
+        s += 0.2*(Angle(x, "deg") - s).measure
+        assert close(smooth.update(x).measure, s.measure, 360.0)
+    if have_numpy() == True:
+        for f, batch, arg in ((filters.MovingMean, filters.moving_mean, 25),
+                              (filters.ExponentialSmoother,
+                               filters.exponential_smooth, 0.2),
+                              (filters.MovingMedian, filters.moving_median,
+                               25)):
+            stream = f(arg, "deg")
+            out = batch(xs, arg, "deg").measure.tolist()
+            assert all(close(o, stream.update(x).measure, 360.0, 1e-12)
+                       for o, x in zip(out, xs))
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_histogram():
+    AngleHistogram = angle_headings.AngleHistogram
+    xs = sample(5000, 360.0, 23)
+    h = AngleHistogram(16, "deg", -11.25)
+    h.update(Angle(x, "deg") for x in xs[:2500])
+    g = AngleHistogram(16, "rad", -math.pi/16)
+    for x in xs[2500:]:
+        g.add(x, "deg")
+    h.merge(g)
+    ref = [0]*16
+    for x in xs:
+        ref[int(((x + 11.25) % 360.0)//22.5)] += 1
+    assert h.counts == ref and h.total == len(xs)
+    assert h.mode().measure == h.centers()[ref.index(max(ref))].measure
+    seam = [180.0 + (x/36.0) for x in xs]
+    s = AngleHistogram(360, "deg")
+    s.update(seam)
+    assert close(s.percentile(50).measure, 180.0, 360.0, 0.5)
+    assert close(s.percentile(0).measure, 170.0, 360.0, 1.0)
+    assert close(s.percentile(100).measure, -170.0, 360.0, 1.0)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_arcs():
+    from angle_headings import arcs
+    for seed, (lo, span) in enumerate([(170.0, 20.0), (-30.0, 300.0),
+                                       (0.0, 360.0)]):
+        xs = [lo + (x % 360.0)*span/360.0 for x in sample(300, 360.0, seed)]
+        m = sorted(Angle(x, "deg").measure for x in xs)
+        gaps = [(m[(i + 1) % len(m)] - m[i]) % 360.0 for i in range(len(m))]
+        gaps[-1] = gaps[-1] or 360.0
+        start, end, width = arcs.largest_gap(xs, "deg")
+        assert close(width, max(gaps), 360.0)
+        assert not any(0 < (x - start.measure) % 360.0 < width for x in m)
+        first, last, order = arcs.covering_arc(xs, "deg")
+        assert first.measure == end.measure and last.measure == start.measure
+        assert sorted(order) == list(range(len(xs)))
+        steps = [(Angle(xs[j], "deg") - first).measure % 360.0 for j in order]
+        assert steps == sorted(steps)
+        assert close(steps[-1], 360.0 - width, 360.0)
+    seam = [175.0, -175.0, 179.0, -179.0]
+    first, last, order = arcs.covering_arc(seam, "deg")
+    assert (first.measure, last.measure, order) == (175.0, -175.0,
+                                                   [0, 2, 3, 1])
+    assert close(arcs.circular_spread(seam, "deg"), 4.0, 360.0)
+    assert arcs.largest_gap([Angle(1.0)])[2] == 2*math.pi
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_trajectory():
+    from angle_headings import trajectory
+    xs = [0.0]
+    for x in sample(500, 340.0, 36):
+        xs.append(xs[-1] + ref_normalize(x, 340.0))
+    unwrapper = angle_headings.Unwrapper("deg")
+    out = [unwrapper.update(Angle(x, "deg")) for x in xs]
+    assert all(abs(u - x) < 1e-9 for u, x in zip(out, xs))
+    assert unwrapper.update(Angle(180.0, "deg") + out[-1]) - out[-1] == 180.0
+    samples = [(i*0.5, x) for i, x in enumerate(xs)]
+    times = [i*0.3 - 1.0 for i in range(len(xs)*2)]
+    out = list(trajectory.resample_stream(samples, times, "deg"))
+    for t, a in zip(times, out):
+        i = min(max(int(t*2), 0), len(xs) - 2)
+        f = min(max(t*2 - i, 0.0), 1.0)
+        start, end = Angle(xs[i], "deg"), Angle(xs[i + 1], "deg")
+        assert close(a.measure, (start + (end - start)*f).measure, 360.0)
+    assert len(out) == sum(1 for t in times if t <= samples[-1][0])
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_index():
+    xs = sample(500, 360.0, 8)
+    index = angle_headings.AngleIndex(xs, "deg")
+    rng = random.Random(9)
+    for i in range(200):
+        c = Angle(rng.uniform(-360, 360), "deg")
+        delta = rng.uniform(0, 200)
+        found = sorted(a.measure for a in index.within(c, delta))
+        scan = sorted(Angle(x, "deg").measure for x in xs
+                      if abs((Angle(x, "deg") - c).measure) <= delta)
+        assert found == scan
+        near = [abs((a - c).measure) for a in index.nearest_k(c, 5)]
+        dist = sorted(abs((Angle(x, "deg") - c).measure) for x in xs)
+        assert near == dist[:5]
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_streams():
+    import io
+    xs = sample(1000, 360.0, 16)
+    text = "id;heading\n" + "".join(str(i) + ";" + repr(x) + "\n"
+                                    for i, x in enumerate(xs))
+    read = list(angle_headings.read_headings(io.StringIO(text), "deg",
+                                             "heading", ";", 64))
+    assert [a.measure for a in read] == [Angle(x, "deg").measure for x in xs]
+    out = io.StringIO()
+    assert angle_headings.write_headings(out, read, "rad", 100) == len(xs)
+    back = angle_headings.read_headings(io.StringIO(out.getvalue()), "rad")
+    for a, b in zip(read, back):
+        assert close(a.convert("deg"), b.convert("deg"), 360.0)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_instrument():
+    from angle_headings import instrument
+    original = Angle.__add__
+    a = Angle(170.0, "deg")
+    b = Angle(1.0, "rad")
+    frozen = angle_headings.FrozenAngle
+    with instrument.instrumented() as snapshot:
+        c = a + b
+        c += 20.0
+        assert a > b and a < -170.0
+        counts = snapshot()
+        f = frozen(370.0, "deg") + 720.0
+        f += 1.0
+        frozen_counts = snapshot()
+    assert Angle.__add__ is original and instrument.enabled() == False
+    assert counts["constructions"] == 1
+    assert counts["normalizations"] == 1
+    assert counts["mixed_unit_conversions"] == 2
+    assert counts["operators"] == {"__add__": 1, "__iadd__": 1, "__gt__": 1,
+                                   "__lt__": 1}
+    assert frozen_counts["constructions"] == 4
+    assert frozen_counts["normalizations"] == 3
+    assert frozen_counts["operators"]["__iadd__"] == 2
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_import():
+    code = ("import sys, angle_headings as ah; "
+            "ah.Angle(1.0, 'deg') + 2.0; ah.convert_many([1.0], 'deg'); "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith(('angle_headings', 'numpy'))))")
+    loaded = fresh_python(code).strip()
+    assert loaded == repr(["angle_headings", "angle_headings._version",
+                           "angle_headings.angles", "angle_headings.backend",
+                           "angle_headings.units"]), loaded
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_units():
+    from angle_headings import units
+    for args in [("deg", 1.0), ("circle", 360.0), ("turn", 1.0, ["d"]),
+                 ("radian", 2*math.pi)]:
+        try:
+            angle_headings.register_unit(*args)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("built-in unit replaced: " + repr(args))
+    assert Angle(90.0, "deg").unit == "deg"
+    assert units.get_unit(1.0) is not units.get_unit(1.0)
+    size = len(units._registry)
+    a = Angle(1.0, 7.25) + Angle(2.0, 13.5)
+    assert a.unit == "/ 7.25" and len(units._registry) == size
+    code = ("import angle_headings as ah; "
+            "ah.register_unit('deg', 1.0, ('turn',), override=True); "
+            "print(ah.Angle(0.25, 'deg').convert('rad'))")
+    assert float(fresh_python(code)) == math.pi/2
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_backend():
+    from angle_headings import backend
+    values = [-180.0, 180.0, -540.0, 540.0, 0.0, -0.0, 1e9, -1e-300]
+    values += sample(1000, 360.0, 25) + sample(1000, 1e6, 26)
+    ref_n = [Angle(v, "deg").measure for v in values]
+    ref_c = [Angle(v, "deg").convert("grad") for v in values]
+    names = ["python"] + (["numpy"] if have_numpy() == True else [])
+    for name in names:
+        b = backend._instance(name)
+        assert b.normalize(values, 360.0) == ref_n
+        assert b.convert(values, 360.0, 400.0) == ref_c
+    try:
+        for name in names:
+            backend.set_backend(name)
+            assert angle_headings.convert_many(values, "deg", "grad") == ref_c
+            assert angle_headings.normalize_many(values, "deg") == ref_n
+    finally:
+        backend.set_backend("auto")
+    code = ("import os; os.environ['ANGLE_HEADINGS_BACKEND'] = 'nmupy'\n"
+            "try:\n import angle_headings.backend\n"
+            "except ValueError as e:\n print('nmupy' in str(e))")
+    assert fresh_python(code).strip() == "True"
+
+#-----------------------------------------------------------------------------
+
+class _Bearing(Angle):
+    """An Angle subclass with instance attributes, for check_pickle()."""
+
+class _FrozenBearing(angle_headings.FrozenAngle):
+    """A FrozenAngle subclass, for check_pickle()."""
+
+    __slots__ = ()
+
+@check
+def check_pickle():
+    import pickle
+    angles = [Angle(x, "deg") for x in sample(1000, 360.0, 27)]
+    for a in angles:
+        a.cos
+    data = pickle.dumps(angles)
+    assert len(data) < 20*len(angles), len(data)
+    out = pickle.loads(data)
+    assert [a.measure for a in out] == [a.measure for a in angles]
+    assert all(a.unit == "deg" and a.mod == 360.0 for a in out)
+    b = pickle.loads(pickle.dumps(Angle(2.5, 7.0)))
+    assert (b.measure, b.mod) == (2.5, 7.0)
+    c = _Bearing(-30.0, "deg")
+    c.label = "north-north-west"
+    d = pickle.loads(pickle.dumps(c))
+    assert type(d) is _Bearing and d == c and d.label == c.label
+    e = _FrozenBearing(30.0, "deg", 360)
+    f = pickle.loads(pickle.dumps(e))
+    assert type(f) is _FrozenBearing and f == e and f._steps == 360
+    g = angle_headings.FrozenAngle(90.0, "deg")
+    assert pickle.loads(pickle.dumps(g)) is g
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_trig():
+    for unit, mod in MODS.items():
+        for x in sample(500, mod, 18):
+            a = Angle(x, unit)
+            theta = x*(2*math.pi/mod)
+            assert abs(a.cos - math.cos(theta)) < 1e-12
+            assert abs(a.sin - math.sin(theta)) < 1e-12
+            assert a.unit_vector == (a.cos, a.sin)
+            assert close(Angle.from_xy(a.cos, a.sin, unit).measure, x, mod,
+                         1e-12)
+            a += mod/4
+            assert abs(a.cos + math.sin(theta)) < 1e-12
+            a.measure = 0.0
+            assert a.unit_vector == (1.0, 0.0)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_frozen():
+    import copy
+    import pickle
+    FrozenAngle = angle_headings.FrozenAngle
+    for unit, mod in MODS.items():
+        assert FrozenAngle(mod/4, unit) is FrozenAngle(-3*mod/4, unit)
+        for x in sample(500, mod, 22):
+            a = FrozenAngle(x, unit)
+            assert a.measure == Angle(x, unit).measure
+            assert (a + 1.0).measure == (Angle(x, unit) + 1.0).measure
+            assert a == Angle(x, unit) and hash(a) == hash(FrozenAngle(x, mod))
+            assert pickle.loads(pickle.dumps(a)) == a and +a is copy.copy(a)
+            b = a
+            b += 1.0
+            assert b is not a and a.measure == Angle(x, unit).measure
+            q = FrozenAngle(x, unit, 3600)
+            r = FrozenAngle(x + mod*1e-7, unit, 3600)
+            assert (q == r) == (hash(q) == hash(r))
+        try:
+            a.measure = 0.0
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("FrozenAngle measure was changed")
+    table = {FrozenAngle(x, "deg", 360): x for x in range(360)}
+    assert table[FrozenAngle(10.2, "deg", 360)] == 10
+    assert table[FrozenAngle(-179.6, "deg", 360)] == 180
+    right = FrozenAngle(90.0, "deg")
+    assert right != 90.0 and 90.0 != right and right == Angle(90.0, "deg")
+    bam = angle_headings.BAMAngle(1 << 14)
+    assert bam != right and right != bam and bam == Angle(90.0, "deg")
+    assert {right: 1}.get(bam) is None and {bam: 1}.get(right) is None
+    assert {90.0: 1}.get(FrozenAngle(90.0, "deg")) is None
+    for x, y in zip(sample(200, 10.0, 26), sample(200, 10.0, 27)):
+        a = FrozenAngle.from_xy(x, y, "deg")
+        assert type(a) is FrozenAngle
+        assert a.measure == Angle.from_xy(x, y, "deg").measure
+    assert FrozenAngle.from_xy(0.0, 1.0, "deg") is FrozenAngle(90.0, "deg")
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_lazy():
+    LazyAngle = angle_headings.LazyAngle
+    xs = sample(2000, 360.0, 17)
+    for h, a, b, k in zip(xs[0::4], xs[1::4], xs[2::4], xs[3::4]):
+        h = Angle(h, "deg")
+        a = Angle(a, "rad")
+        k = k/360.0
+        eager = (h + a - b)*k + a
+        lazy = (LazyAngle(h) + a - b)*k + a
+        assert close(lazy.measure, eager.measure, 360.0, 1e-12)
+        acc = LazyAngle(h)
+        acc += a
+        acc -= b
+        out = acc.angle()
+        assert type(out) is Angle and out.unit == "deg"
+        assert close(out.measure, (h + a - b).measure, 360.0, 1e-12)
+        copy = LazyAngle(acc)
+        assert copy.unit == "deg" and copy.raw == acc.raw
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_bam():
+    BAMAngle = angle_headings.BAMAngle
+    for unit in MODS:
+        for v in range(0, 1 << 16, 7):
+            b = BAMAngle(v)
+            assert BAMAngle.from_angle(b.to_angle(unit)).value == v
+    for x, y in zip(sample(500, 360.0, 12), sample(500, 360.0, 13)):
+        a = BAMAngle.from_measure(x, "deg", 32)
+        b = BAMAngle.from_measure(y, "deg", 32)
+        d = (a.to_angle("deg") - b.to_angle("deg")).measure
+        assert close((a - b).convert("deg"), d, 360.0, 1e-9)
+        assert (a > b) == (d > 0) or abs(d) < 1e-6
+        c = a.to_angle("rad")
+        assert (c == a) == (a == c) == True
+        assert (c < b) == (b > c) and (c >= b) == (b <= c)
+    rng = random.Random(25)
+    for unit in MODS:
+        for v in (rng.getrandbits(52) for i in range(500)):
+            b = BAMAngle(v, 52)
+            assert BAMAngle.from_angle(b.to_angle(unit), 52).value == v
+
+    # Opposed headings favour the first argument, as for Angles
+    for a, b in [(Angle(180.0, "deg"), BAMAngle(0)),
+                 (Angle(0.0, "deg"), BAMAngle(1 << 15)),
+                 (Angle(-math.pi), BAMAngle(0, 32))]:
+        assert a > b and a >= b and not a < b and not a <= b
+        assert b > a and b >= a and not b < a and not b <= a
+        assert a != b and b != a
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array():
+    import numpy
+    AngleArray = angle_headings.AngleArray
+    for unit, mod in MODS.items():
+        xs = sample(1000, mod, 10)
+        ys = sample(1000, mod, 11)
+        arr = AngleArray(xs, unit)
+        brr = AngleArray(ys, "deg")
+        sa = [Angle(x, unit) for x in xs]
+        sb = [Angle(y, "deg") for y in ys]
+        pairs = list(zip(sa, sb))
+        assert arr.measure.tolist() == [a.measure for a in sa]
+        assert (arr + brr).measure.tolist() == [(a + b).measure
+                                                for a, b in pairs]
+        assert (arr - brr).measure.tolist() == [(a - b).measure
+                                                for a, b in pairs]
+        assert (arr*1.7).measure.tolist() == [(a*1.7).measure for a in sa]
+        assert (-arr).measure.tolist() == [(-a).measure for a in sa]
+        assert arr.convert("deg").tolist() == [a.convert("deg") for a in sa]
+        assert arr.reldiff(brr).tolist() == [a.reldiff(b) for a, b in pairs]
+        assert (arr > brr).tolist() == [a > b for a, b in pairs]
+        assert (arr <= sb[0]).tolist() == [a <= sb[0] for a in sa]
+        c = +arr
+        c += brr
+        assert c.measure.tolist() == (arr + brr).measure.tolist()
+        assert (sb[0] + arr).measure.tolist() == [(sb[0] + a).measure
+                                                  for a in sa]
+        assert (sb[0] - arr).measure.tolist() == [(sb[0] - a).measure
+                                                  for a in sa]
+        assert (sb[0] < arr).tolist() == [sb[0] < a for a in sa]
+        assert numpy.asarray(arr).flags.writeable == False
+        assert numpy.array(arr).flags.writeable == True
+        xs = numpy.array(ys)
+        assert (numpy.float64(ys[0]) + arr).measure.tolist() == [
+            (a + ys[0]).measure for a in sa]
+        assert (xs - arr).measure.tolist() == [(-a + y).measure
+                                               for a, y in zip(sa, ys)]
+        assert (xs > arr).tolist() == [a < y for a, y in zip(sa, ys)]
+
+    # Opposed headings favour the first argument, as for Angles
+    for a, b in [(Angle(180.0, "deg"), 0.0), (Angle(0.0, "deg"), 180.0),
+                 (Angle(math.pi), 0.0), (Angle(0.0, "grad"), -180.0)]:
+        arr = AngleArray([b], "deg")
+        ref = Angle(b, "deg")
+        assert (a > arr).tolist() == [a > ref] == [True]
+        assert (a < arr).tolist() == [a < ref] == [False]
+        assert (arr > a).tolist() == [ref > a] == [True]
+        assert (a >= arr).tolist() == [True] and (a <= arr).tolist() == [False]
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_float32():
+    AngleArray = angle_headings.AngleArray
+    for unit, mod in MODS.items():
+        bound = 2.0**-25
+        xs = sample(1000, mod, 30) + [(bound - 0.5)*mod, (0.5 - bound)*mod]
+        ys = sample(1002, mod, 31)
+        arr = AngleArray(xs, unit, "float32")
+        brr = AngleArray(ys, unit, "float32")
+        assert arr.measure.dtype.name == "float32"
+        m = arr.measure.tolist()
+        assert all(-mod/2 < x <= mod/2 for x in m)
+        assert all(close(x, y, mod, bound)
+                   for x, y in zip(m, AngleArray(xs, unit).measure))
+        pairs = list(zip(m, brr.measure.tolist()))
+        c = +arr
+        c -= brr
+        for out, ref in [(arr + brr, [Angle(x, unit) + y for x, y in pairs]),
+                         (c, [Angle(x, unit) - y for x, y in pairs]),
+                         (arr*2.7, [Angle(x, unit)*2.7 for x in m])]:
+            assert out.dtype == arr.dtype
+            assert all(close(x, a.measure, mod, bound)
+                       for x, a in zip(out.measure.tolist(), ref))
+
+    # Text output gives the shortest form of each float32 measure
+    import io
+    out = io.StringIO()
+    arr = AngleArray([0.1, -33.333333, 180.0, 1e-8], "deg", "float32")
+    assert angle_headings.write_headings(out, arr) == 4
+    assert out.getvalue().split() == ["0.1", "-33.333332", "180.0", "1e-08"]
+    back = next(angle_headings.read_headings(io.StringIO(out.getvalue()),
+                                             "deg", arrays=True))
+    back = AngleArray(back.measure, "deg", "float32")
+    assert back.measure.tolist() == arr.measure.tolist()
+
+    # Shared arrays and batch filters keep the storage precision
+    import os
+    import pickle
+    import tempfile
+    from angle_headings import filters
+    SharedAngleArray = angle_headings.SharedAngleArray
+    arr = AngleArray(sample(500, 360.0, 32), "deg", "float32")
+    assert filters.moving_mean(arr, 5).dtype == arr.dtype
+    assert filters.exponential_smooth(arr, 0.5).dtype == arr.dtype
+    assert filters.moving_median(arr, 5).dtype == arr.dtype
+    with SharedAngleArray.share(arr) as a:
+        try:
+            assert a.dtype == arr.dtype and a.measure.nbytes == 4*len(arr)
+            assert a.measure.tolist() == arr.measure.tolist()
+            a += 100.0
+            assert a.measure.tolist() == (arr + 100.0).measure.tolist()
+            with pickle.loads(pickle.dumps(a)) as b:
+                assert b.dtype == a.dtype
+                assert b.measure.tolist() == a.measure.tolist()
+        finally:
+            a.unlink()
+    path = os.path.join(tempfile.mkdtemp(), "headings.f32")
+    with SharedAngleArray.create_file(path, arr) as f:
+        assert os.path.getsize(path) == 4*len(arr)
+    with SharedAngleArray.open_file(path, "deg", "r", "float32") as g:
+        assert g.measure.tolist() == arr.measure.tolist()
+        assert pickle.loads(pickle.dumps(g)).dtype == arr.dtype
+    os.remove(path)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_pairwise():
+    from angle_headings import pairwise
+    xs = sample(300, 360.0, 14)
+    bs = [Angle(y, "rad") for y in sample(200, 2*math.pi, 15)]
+    ref = [[Angle(x, "deg").reldiff(b) for b in bs] for x in xs]
+    m = pairwise.reldiff_matrix(xs, bs, mod="deg")
+    assert m.tolist() == ref
+    for i, j, block in pairwise.reldiff_blocks(xs, bs, "deg", 64):
+        assert block.tolist() == [r[j:j + 64] for r in ref[i:i + 64]]
+    idx, dist = pairwise.nearest_k(xs, bs, k=4, mod="deg", block_size=50)
+    for row, d in zip(ref, dist.tolist()):
+        assert d == sorted(row)[:4]
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_rotation():
+    from angle_headings import rotation
+    xs = sample(500, 360.0, 19)
+    hs = [Angle(x, "deg") for x in xs]
+    pts = list(zip(sample(500, 10.0, 20), sample(500, 10.0, 21)))
+    ref = [(h.cos*x - h.sin*y, h.sin*x + h.cos*y) for h, (x, y)
+           in zip(hs, pts)]
+    out = rotation.rotate(pts, xs, "deg").tolist()
+    assert all(abs(p - q) < 1e-12 for r, o in zip(ref, out)
+               for p, q in zip(r, o))
+    out = rotation.rotate(pts, hs[0]).tolist()
+    assert out[1] == [hs[0].cos*pts[1][0] - hs[0].sin*pts[1][1],
+                      hs[0].sin*pts[1][0] + hs[0].cos*pts[1][1]]
+    v = rotation.unit_vectors(hs)
+    out = rotation.from_vectors(v, mod="deg").measure.tolist()
+    assert all(close(o, Angle.from_xy(x, y, "deg").measure, 360.0, 1e-12)
+               for o, (x, y) in zip(out, v.tolist()))
+    assert all(close(o, x, 360.0, 1e-12) for o, x in zip(out, xs))
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_steering():
+    from angle_headings import steering
+    xs = sample(1000, 360.0, 32) + [0.0, 90.0]
+    ys = sample(1000, 360.0, 33) + [180.0, -90.0]
+    limits = [abs(x) % 20.0 for x in sample(1002, 360.0, 34)]
+    pairs = [(Angle(x, "deg"), Angle(y, "deg")) for x, y in zip(xs, ys)]
+    a = angle_headings.AngleArray(xs, "deg")
+    rotation, ccw, new = steering.steer(a, ys, limits, "deg")
+    assert rotation.tolist() == [(t - c).measure for c, t in pairs]
+    assert ccw.tolist() == [t > c for c, t in pairs]
+    assert rotation[-2] == 180.0 and ccw[-2] == True
+    ref = [t if abs((t - c).measure) <= r else c + math.copysign(r, (t -
+           c).measure) for (c, t), r in zip(pairs, limits)]
+    assert new.measure.tolist() == [h.measure for h in ref]
+    rotation, ccw = steering.shortest_turn(xs, Angle(1.0), "deg")
+    target = Angle(180/math.pi, "deg")
+    assert all(close(r, (target - c).measure, 360.0)
+               for r, (c, t) in zip(rotation.tolist(), pairs))
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_bearings():
+    from angle_headings import bearings
+    rng = random.Random(35)
+    track = [(rng.uniform(-80, 80), rng.uniform(-180, 180))
+             for i in range(500)]
+
+    def ref(p, q):
+        lat1, lat2 = math.radians(p[0]), math.radians(q[0])
+        d = math.radians(q[1] - p[1])
+        return Angle(math.atan2(math.sin(d)*math.cos(lat2),
+                                math.cos(lat1)*math.sin(lat2) -
+                                math.sin(lat1)*math.cos(lat2)*math.cos(d)),
+                     "rad").convert("deg")
+
+    legs = list(zip(track, track[1:]))
+    out = bearings.initial_bearing(track).measure.tolist()
+    assert all(close(b, ref(p, q), 360.0) for b, (p, q) in zip(out, legs))
+    out = bearings.final_bearing(track).measure.tolist()
+    assert all(close(b, ref(q, p) + 180.0, 360.0)
+               for b, (p, q) in zip(out, legs))
+    east = bearings.initial_bearing((0.0, 0.0), (0.0, 1.0), "rad", False)
+    assert isinstance(east, Angle) and east.measure == 0.0
+    assert bearings.initial_bearing((0.0, 0.0), (0.0, -1.0)).measure == -90.0
+    out = bearings.planar_bearing(track, mod="deg").measure.tolist()
+    assert all(close(b, Angle.from_xy(q[0] - p[0], q[1] - p[1]).convert(
+               "deg"), 360.0, 1e-12) for b, (p, q) in zip(out, legs))
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_trajectory():
+    from angle_headings import trajectory
+    xs = sample(1000, 360.0, 37)
+    a = angle_headings.AngleArray(xs, "deg")
+    unwrapper = angle_headings.Unwrapper("deg")
+    u = trajectory.unwrap(a)
+    assert u.tolist() == [unwrapper.update(x) for x in xs]
+    out = angle_headings.AngleArray(u, "deg").measure.tolist()
+    assert all(close(m, x, 360.0, 1e-14) for m, x in zip(out, xs))
+    fractions = [abs(x)/1080.0 for x in sample(999, 360.0, 38)]
+    out = trajectory.interpolate(a[:-1], a[1:], fractions).measure.tolist()
+    assert out == [(Angle(x, "deg") + (Angle(y, "deg") - Angle(x, "deg"))*f
+                    ).measure for x, y, f in zip(xs, xs[1:], fractions)]
+    times = [i*1.5 for i in range(len(xs))]
+    new = [i*0.7 - 3.0 for i in range(2*len(xs))]
+    out = trajectory.resample(times, a, new).measure.tolist()
+    ref = trajectory.resample_stream(zip(times, xs), new, "deg")
+    assert all(close(x, r.measure, 360.0) for x, r in zip(out, ref))
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_shared():
+    import io
+    import os
+    import pickle
+    import tempfile
+    from angle_headings import filters
+    SharedAngleArray = angle_headings.SharedAngleArray
+    xs = sample(1000, 360.0, 28)
+    with SharedAngleArray.share(xs, "deg") as a:
+        try:
+            assert a.measure.tolist() == [Angle(x, "deg").measure for x in xs]
+            data = pickle.dumps(a)
+            assert len(data) < 200
+            with pickle.loads(data) as b:
+                b += 10.0
+                assert b.measure.tolist() == a.measure.tolist()
+            assert a.measure.tolist() == [(Angle(x, "deg") + 10.0).measure
+                                          for x in xs]
+            for out in (filters.moving_mean(a, 5),
+                        filters.exponential_smooth(a, 0.5),
+                        filters.moving_median(a, 5)):
+                assert type(out) is angle_headings.AngleArray
+                assert out.unit == a.unit and len(out) == len(a)
+            text = io.StringIO()
+            assert angle_headings.write_headings(text, [a], "rad") == len(a)
+            assert len(text.getvalue().split()) == len(a)
+        finally:
+            a.unlink()
+    path = os.path.join(tempfile.mkdtemp(), "headings.f64")
+    with SharedAngleArray.create_file(path, xs, "deg") as f:
+        f -= 10.0
+        ref = f.measure.tolist()
+    with SharedAngleArray.open_file(path, "deg") as g:
+        assert g.measure.tolist() == ref
+        assert pickle.loads(pickle.dumps(g)).measure.tolist() == ref
+    os.remove(path)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_arcs():
+    from angle_headings import arcs
+    xs = [170.0 + x/18.0 for x in sample(1000, 360.0, 29)]
+    a = angle_headings.AngleArray(xs, "rad")
+    for f in (arcs.covering_arc, arcs.largest_gap):
+        out, ref = f(a), f(xs)
+        assert [float(x) for x in out[:2]] == [float(x) for x in ref[:2]]
+    assert arcs.covering_arc(a)[2].tolist() == arcs.covering_arc(xs)[2]
+    assert arcs.circular_spread(a) == arcs.circular_spread(xs)
+
+#-----------------------------------------------------------------------------
+
+@check
+def check_angle_array_archive():
+    import os
+    import tempfile
+    from angle_headings import archive
+    xs = sample(1000, 360.0, 39)
+    a = angle_headings.AngleArray(xs, "deg")
+    path = os.path.join(tempfile.mkdtemp(), "headings.ahdg")
+    for dtype, tol in [("float64", 0.0), ("float32", 2.0**-25),
+                       ("fixed16", 2.0**-17), ("fixed32", 2.0**-33)]:
+        assert archive.write_archive(path, a[:600], dtype=dtype) == 600
+        assert archive.append_archive(path, [Angle(x, "deg").convert("rad")
+                                             for x in xs[600:]],
+                                      "rad") == len(xs) - 600
+        with archive.AngleArchive(path) as f:
+            assert len(f) == len(xs) and f.unit == "deg" and f.mod == 360.0
+            out = f[:].measure.tolist()
+            assert all(-180.0 < x <= 180.0 for x in out)
+            assert all(close(x, y, 360.0, tol + 1e-12)
+                       for x, y in zip(out, a.measure.tolist()))
+            assert f[123].measure == out[123]
+            assert f[10:20].measure.tolist() == out[10:20]
+    with archive.AngleArchive(path) as f:
+        assert f.payload.dtype.itemsize == 4
+
+    # Reading an archive leaves the unit registry unchanged
+    fresh_python("import angle_headings as ah; "
+                 "ah.register_unit('mil', 6400.0); "
+                 "ah.write_archive(" + repr(path) + ", [100.0], 'mil')")
+    code = ("import angle_headings as ah; "
+            "from angle_headings import units; "
+            "f = ah.AngleArchive(" + repr(path) + "); "
+            "print(f.unit, f.mod, f[0].measure, 'mil' in units._registry, "
+            "6400.0 in units._registry)")
+    assert fresh_python(code).split() == ["mil", "6400.0", "100.0", "False",
+                                          "False"]
+    os.remove(path)
+
+#=============================================================================
+# Benchmarks
+#=============================================================================
+
+def scalar_benchmarks():
+    """scalar_benchmarks() -> tuple
+    Returns the scalar benchmark statements and their namespace.
+    """
+
+    from angle_headings import arcs
+    namespace = {"Angle": Angle, "math": math, "a": Angle(170.0, "deg"),
+                 "b": Angle(-20.0, "deg"), "c": Angle(1.0, "rad"),
+                 "key": Angle(170.0, "deg").relkey(),
+                 "stats": angle_headings.AngleStats("deg"),
+                 "histogram": angle_headings.AngleHistogram(36, "deg"),
+                 "mean": angle_headings.MovingMean(100, "deg"),
+                 "smooth": angle_headings.ExponentialSmoother(0.1, "deg"),
+                 "median": angle_headings.MovingMedian(100, "deg"),
+                 "unwrapper": angle_headings.Unwrapper("deg"),
+                 "index": angle_headings.AngleIndex(sample(10000, 360.0),
+                                                    "deg"),
+                 "convert_many": angle_headings.convert_many,
+                 "normalize_many": angle_headings.normalize_many,
+                 "covering_arc": arcs.covering_arc,
+                 "values": sample(1000, 360.0),
+                 "angles": [Angle(x, "deg") for x in sample(1000, 360.0)],
+                 "h": Angle(170.0, "deg"),
+                 "LazyAngle": angle_headings.LazyAngle,
+                 "FrozenAngle": angle_headings.FrozenAngle,
+                 "f": angle_headings.FrozenAngle(10.0, "deg", 3600),
+                 "table": {angle_headings.FrozenAngle(x/10, "deg", 3600): x
+                           for x in range(3600)},
+                 "p": angle_headings.BAMAngle(1000),
+                 "q": angle_headings.BAMAngle(60000)}
+    statements = [
+        ("construct_str_mod", "Angle(190.0, 'deg')"),
+        ("construct_num_mod", "Angle(190.0, 360.0)"),
+        ("measure_setter_wrap", "a.measure = 190.0"),
+        ("measure_setter_nowrap", "a.measure = 10.0"),
+        ("pos", "+a"),
+        ("neg", "-a"),
+        ("add_angle", "a + b"),
+        ("add_angle_mixed_unit", "a + c"),
+        ("add_float", "a + 1.0"),
+        ("sub_angle", "a - b"),
+        ("mul", "a*2.0"),
+        ("truediv", "a/2.0"),
+        ("floordiv", "a//2.0"),
+        ("pow", "a**1.0"),
+        ("iadd", "x += 1.0", "x = +a"),
+        ("eq", "a == b"),
+        ("ne", "a != b"),
+        ("gt", "a > b"),
+        ("lt", "a < b"),
+        ("ge", "a >= b"),
+        ("le", "a <= b"),
+        ("gt_mixed_unit", "a > c"),
+        ("abs", "abs(a)"),
+        ("float", "float(a)"),
+        ("convert", "a.convert('rad')"),
+        ("cos_convert", "math.cos(a.convert('rad'))"),
+        ("cos_cached", "a.cos"),
+        ("from_xy", "Angle.from_xy(1.0, 2.0, 'deg')"),
+        ("reldiff", "a.reldiff(b)"),
+        ("relkey", "key(b)"),
+        ("stats_add", "stats.add(b)"),
+        ("moving_mean_update", "mean.update(b)"),
+        ("exponential_smoother_update", "smooth.update(b)"),
+        ("moving_median_update", "median.update(b)"),
+        ("unwrapper_update", "unwrapper.update(b)"),
+        ("histogram_add", "histogram.add(b)"),
+        ("histogram_update_1000", "histogram.update(values)"),
+        ("covering_arc_1000", "covering_arc(values, 'deg')"),
+        ("index_within", "index.within(b, 1.0)"),
+        ("convert_many_1000", "convert_many(values, 'deg', 'rad')"),
+        ("pickle_roundtrip_1000", "pickle.loads(pickle.dumps(angles))",
+         "import pickle"),
+        ("normalize_many_1000", "normalize_many(values, 'deg')"),
+        ("chain_eager", "h + b - c + b*0.5"),
+        ("chain_lazy", "x = LazyAngle(h); x += b; x -= c; x += b*0.5; "
+                       "x.angle()"),
+        ("chain_lazy_binary", "(LazyAngle(h) + b - c + b*0.5).angle()"),
+        ("frozen_construct", "FrozenAngle(10.0, 'deg')"),
+        ("frozen_construct_interned", "FrozenAngle(90.0, 'deg')"),
+        ("frozen_add", "f + b"),
+        ("frozen_hash", "hash(f)"),
+        ("frozen_lookup", "table[f]"),
+        ("bam_add", "p + q"),
+        ("bam_eq", "p == q"),
+        ("bam_gt", "p > q"),
+        ("bam_hash", "hash(p)"),
+    ]
+
+    return statements, namespace
+
+#-----------------------------------------------------------------------------
+
+def array_benchmarks(n=100000):
+    """array_benchmarks([n]) -> tuple
+    Returns the batched benchmark statements and their namespace.
+    """
+
+    AngleArray = angle_headings.AngleArray
+    from angle_headings.pairwise import nearest_k
+    from angle_headings.filters import exponential_smooth, moving_mean
+    from angle_headings.rotation import from_vectors, rotate
+    from angle_headings.arcs import circular_spread, covering_arc
+    from angle_headings.steering import shortest_turn, steer
+    from angle_headings.bearings import initial_bearing, planar_bearing
+    from angle_headings.trajectory import interpolate, resample, unwrap
+    from angle_headings.archive import AngleArchive, write_archive
+    import tempfile
+    namespace = {"AngleArray": AngleArray, "n": n, "nearest_k": nearest_k,
+                 "covering_arc": covering_arc,
+                 "circular_spread": circular_spread,
+                 "shortest_turn": shortest_turn, "steer": steer,
+                 "initial_bearing": initial_bearing,
+                 "planar_bearing": planar_bearing,
+                 "unwrap": unwrap, "interpolate": interpolate,
+                 "resample": resample,
+                 "AngleArchive": AngleArchive,
+                 "write_archive": write_archive,
+                 "path": os.path.join(tempfile.mkdtemp(), "bench.ahdg"),
+                 "rotate": rotate, "from_vectors": from_vectors,
+                 "moving_mean": moving_mean,
+                 "exponential_smooth": exponential_smooth,
+                 "points": [(x, 1.0) for x in sample(n, 10.0, 3)[:n]],
+                 "values": sample(n, 360.0)[:n],
+                 "A": AngleArray(sample(n, 360.0, 1)[:n], "deg"),
+                 "B": AngleArray(sample(n, 360.0, 2)[:n], "deg"),
+                 "A32": AngleArray(sample(n, 360.0, 1)[:n], "deg",
+                                   "float32"),
+                 "B32": AngleArray(sample(n, 360.0, 2)[:n], "deg",
+                                   "float32"),
+                 "b": Angle(-20.0, "deg"),
+                 "stats": angle_headings.AngleStats("deg"),
+                 "histogram": angle_headings.AngleHistogram(36, "deg")}
+    statements = [
+        ("array_construct", "AngleArray(values, 'deg')"),
+        ("array_add_array", "A + B"),
+        ("array_add_array_float32", "A32 + B32"),
+        ("array_add_angle", "A + b"),
+        ("array_add_float", "A + 1.0"),
+        ("array_iadd_float", "X += 1.0", "X = +A"),
+        ("array_iadd_float_float32", "X += 1.0", "X = +A32"),
+        ("array_sub_array", "A - B"),
+        ("array_mul", "A*2.0"),
+        ("array_neg", "-A"),
+        ("array_gt", "A > B"),
+        ("array_convert", "A.convert('rad')"),
+        ("array_reldiff", "A.reldiff(B)"),
+        ("array_stats_update", "stats.update(A)"),
+        ("array_histogram_update", "histogram.update(A)"),
+        ("array_moving_mean_100", "moving_mean(A, 100)"),
+        ("array_exponential_smooth", "exponential_smooth(A, 0.1)"),
+        ("array_shortest_turn", "shortest_turn(A, B)"),
+        ("array_steer", "steer(A, B, 5.0)"),
+        ("array_initial_bearing", "initial_bearing(T)", "import numpy; "
+                                  "T = numpy.array(points)"),
+        ("array_planar_bearing", "planar_bearing(T)", "import numpy; "
+                                 "T = numpy.array(points)"),
+        ("array_unwrap", "unwrap(A)"),
+        ("array_interpolate", "interpolate(A, B, 0.25)"),
+        ("array_resample", "resample(T, A, T2)", "import numpy; "
+                           "T = numpy.arange(n)*1.0; T2 = T*0.9 + 0.05"),
+        ("array_archive_write", "write_archive(path, A)"),
+        ("array_archive_read", "AngleArchive(path)[:]",
+         "write_archive(path, A)"),
+        ("array_archive_read_float32", "AngleArchive(path)[:]",
+         "write_archive(path, A, dtype='float32')"),
+        ("array_rotate_angle", "rotate(P, b)", "import numpy; "
+                               "P = numpy.array(points)"),
+        ("array_rotate_array", "rotate(P, A)", "import numpy; "
+                               "P = numpy.array(points)"),
+        ("array_from_vectors", "from_vectors(P)", "import numpy; "
+                               "P = numpy.array(points)"),
+        ("array_covering_arc", "covering_arc(A)"),
+        ("array_circular_spread", "circular_spread(A)"),
+        ("pairwise_nearest_k_1000x1000", "nearest_k(A[:1000], B[:1000])"),
+    ]
+
+    return statements, namespace
+
+#-----------------------------------------------------------------------------
+
+def import_benchmarks(repeat):
+    """import_benchmarks(repeat) -> dict
+    Times a fresh import of the package, returning the best time.
+
+    Positional arguments:
+    repeat (int) -- number of timings (each in a new interpreter), of which
+        the fastest is kept
+    """
+
+    code = ("import time; t = time.perf_counter(); import angle_headings; "
+            "print(time.perf_counter() - t)")
+    best = min(float(fresh_python(code)) for i in range(repeat))
+
+    return {"import_angle_headings": {"statement": "import angle_headings",
+                                      "ns_per_call": best*1e9,
+                                      "ns_per_element": best*1e9,
+                                      "calls_per_sec": 1.0/best}}
+
+#-----------------------------------------------------------------------------
+
+def run(statements, namespace, number, repeat, per=1):
+    """run(statements, namespace, number, repeat[, per]) -> dict
+    Times each statement, returning the best time per call.
+
+    Positional arguments:
+    statements (list) -- (name, statement) pairs, or (name, statement,
+        setup) triples
+    namespace (dict) -- globals for the statements
+    number (int) -- number of executions per timing
+    repeat (int) -- number of timings, of which the fastest is kept
+
+    Keyword arguments:
+    per (int) [1] -- number of elements processed by each call
+    """
+
+    results = {}
+    for name, stmt, *setup in statements:
+        timer = timeit.Timer(stmt, *setup, globals=namespace)
+        best = min(timer.repeat(repeat=repeat, number=number))/number
+        results[name] = {"statement": stmt,
+                         "ns_per_call": best*1e9,
+                         "ns_per_element": best*1e9/per,
+                         "calls_per_sec": 1.0/best}
+
+    return results
+
+#=============================================================================
+# Main
+#=============================================================================
+
+def have_numpy():
+    """Determines whether the batched types are available."""
+
+    try:
+        angle_headings.AngleArray
+    except ImportError:
+        return False
+    return True
+
+#-----------------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=100000,
+                        help="scalar executions per timing")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timings per benchmark (fastest is kept)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="JSON output file ('-' for stdout)")
+    parser.add_argument("-b", "--baseline",
+                        help="earlier JSON output to compare against")
+    parser.add_argument("--checks-only", action="store_true",
+                        help="run only the correctness checks")
+    args = parser.parse_args(argv)
+    numpy = have_numpy()
+
+    # Correctness checks
+    checks = {}
+    for name, f in CHECKS:
+        if name.startswith("angle_array") and not numpy:
+            checks[name] = "skipped (NumPy not installed)"
+            continue
+        try:
+            f()
+            checks[name] = "ok"
+        except AssertionError as e:
+            checks[name] = "FAILED " + repr(e.args)
+        except Exception as e:
+            # Report errors as failures, so that the other checks still run
+            checks[name] = "FAILED (raised " + repr(e) + ")"
+    failed = [name for name in checks if checks[name].startswith("FAILED")]
+
+    # Benchmarks
+    report = {"package_version": angle_headings.__version__,
+              "python": platform.python_version(),
+              "implementation": platform.python_implementation(),
+              "platform": platform.platform(),
+              "numpy": numpy,
+              "checks": checks,
+              "benchmarks": {}}
+    if args.checks_only == False:
+        report["benchmarks"].update(import_benchmarks(max(args.repeat, 5)))
+        report["benchmarks"].update(run(*scalar_benchmarks(), args.number,
+                                        args.repeat))
+        if numpy:
+            n = 100000
+            report["benchmarks"].update(
+                run(*array_benchmarks(n), max(args.number//10000, 1),
+                    args.repeat, per=n))
+
+    # Comparison against an earlier run
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            old = json.load(f)["benchmarks"]
+        for name, result in report["benchmarks"].items():
+            if name in old:
+                result["baseline_ratio"] = (result["ns_per_call"]
+                                            / old[name]["ns_per_call"])
+
+    # Output
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())